@@ -0,0 +1,381 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+# Приветствие pygame не нужно в выводе замеров
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.controller.game_controller import GameController  # noqa: E402
+from src.model.game_state import GameState  # noqa: E402
+from src.model.mouse import Mouse  # noqa: E402
+from src.model.platform import Platform  # noqa: E402
+from src.model.platform_manager import PlatformManager  # noqa: E402
+from src.model.platform_generator import PlatformGenerator  # noqa: E402
+from src.model.player import Player  # noqa: E402
+from src.model.state_buffer import pack_state, unpack_state  # noqa: E402
+from src.model.world import World  # noqa: E402
+from constants import (  # noqa: E402
+    SCREEN_WIDTH, VISIBLE_PLATFORM_RANGE, WORLD_OFFSET_MARGIN,
+    PLATFORM_START_Y, PLATFORM_WIDTH, PLATFORM_SPACING_MIN, PLAYER_SPEED,
+    MOUSE_SPAWN_OFFSET_Y, WORLD_CHUNK_WIDTH
+)
+
+# Шаг между началами соседних платформ в замерах
+PLATFORM_STEP = PLATFORM_WIDTH + PLATFORM_SPACING_MIN
+
+
+def bench_platforms(retained: int, frames: int) -> float:
+    """
+    Кадр World.update для хранилища платформ: удаление слева, генерация
+    справа и запрос видимых. Удаление отстает от камеры на retained
+    платформ, поэтому в хранилище все время около retained платформ,
+    а видимых - одно и то же количество
+    :param retained: Сколько платформ держать за левой границей
+    :param frames: Количество кадров
+    :return: Среднее время кадра в микросекундах
+    """
+    lag = retained * PLATFORM_STEP
+    manager = PlatformManager([
+        Platform(i * PLATFORM_STEP, PLATFORM_START_Y, PLATFORM_WIDTH)
+        for i in range(retained + 10)
+    ])
+    world_offset = float(lag)
+
+    started = time.perf_counter()
+    for _ in range(frames):
+        world_offset += PLAYER_SPEED
+        manager.remove_offscreen_platforms(world_offset - lag)
+        last = manager.get_last_platform()
+        while (last.x + last.width <
+               world_offset + SCREEN_WIDTH + VISIBLE_PLATFORM_RANGE):
+            last = Platform(last.x + PLATFORM_STEP, PLATFORM_START_Y,
+                            PLATFORM_WIDTH)
+            manager.add_platform(last)
+        manager.get_visible_platforms(world_offset)
+    return (time.perf_counter() - started) / frames * 1e6
+
+
+def bench_world_update(retained: int, frames: int) -> Tuple[float, float]:
+    """
+    Кадр World.update целиком (платформы, широкая фаза, мыши) при беге
+    вправо. Удаление платформ отстает от камеры на retained шагов
+    платформ, как в bench_platforms
+    :param retained: Сколько платформ держать за левой границей
+    :param frames: Количество кадров
+    :return: (среднее время кадра в микросекундах, среднее количество
+             хранимых платформ)
+    """
+    world = World(0, prefetch=False)
+    manager = world.platform_manager
+    evict = manager.remove_offscreen_platforms
+    lag = retained * PLATFORM_STEP
+    manager.remove_offscreen_platforms = (
+        lambda world_offset: evict(world_offset - lag)
+    )
+    # Один большой шаг заполняет окно хранимых платформ
+    world.update(lag)
+
+    platforms = 0
+    elapsed = 0.0
+    for _ in range(frames):
+        started = time.perf_counter()
+        world.update(PLAYER_SPEED)
+        elapsed += time.perf_counter() - started
+        platforms += world.platform_count
+    world.chunk_prefetcher.close()
+    return elapsed / frames * 1e6, platforms / frames
+
+
+def run_platforms(args: argparse.Namespace) -> None:
+    """Замер хранилища платформ при растущем окне хранимых платформ"""
+    print("retained    manager  world.update  platforms"
+          "   (us/frame, margin %d)" % WORLD_OFFSET_MARGIN)
+    for retained in args.retained:
+        world_us, platforms = bench_world_update(retained, args.frames)
+        print(f"{retained:>8}  "
+              f"{bench_platforms(retained, args.frames):>9.2f}  "
+              f"{world_us:>12.2f}  {platforms:>9.0f}")
+
+
+def bytes_per_instance(factory: Callable[[int], object],
+                       count: int) -> float:
+    """
+    Память на один объект по данным tracemalloc
+    :param factory: Создает объект по номеру
+    :param count: Количество объектов в замере
+    :return: Среднее число байт на объект
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory(i) for i in range(count)]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    # Сам список ссылок к объектам не относится
+    used -= sys.getsizeof(instances)
+    return used / count
+
+
+def without_slots(cls: type) -> type:
+    """
+    Копия класса без __slots__: атрибуты хранятся в __dict__, как до
+    объявления слотов. Методы те же, поэтому конструктор работает
+    """
+    namespace = {
+        name: value for name, value in vars(cls).items()
+        if name not in cls.__slots__ and
+        name not in ("__slots__", "__dict__", "__weakref__")
+    }
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def bench_player_update(frames: int) -> float:
+    """
+    Player.update на ряду платформ (бег с прыжками)
+    :param frames: Количество кадров
+    :return: Среднее время кадра в микросекундах
+    """
+    platforms = [
+        Platform(i * PLATFORM_STEP, PLATFORM_START_Y, PLATFORM_WIDTH)
+        for i in range(8)
+    ]
+    player = Player()
+    started = time.perf_counter()
+    for frame in range(frames):
+        if frame % 60 == 0:
+            player.world_x = 0
+            player.jump()
+        player.update(platforms, PLAYER_SPEED)
+    return (time.perf_counter() - started) / frames * 1e6
+
+
+def player_update_in_mode(optimize: bool, frames: int) -> float:
+    """
+    bench_player_update в отдельном интерпретаторе: проверка сеттеров
+    (VALIDATE_SETTERS) задается флагом -O при запуске
+    :param optimize: Запустить с python -O
+    :param frames: Количество кадров
+    :return: Среднее время кадра в микросекундах
+    """
+    flags = ["-O"] if optimize else []
+    code = ("import benchmark; "
+            f"print(benchmark.bench_player_update({frames}))")
+    output = subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def run_entities(args: argparse.Namespace) -> None:
+    """
+    Память игровых объектов со слотами и без них и стоимость кадра
+    игрока с проверкой сеттеров (отладка) и без нее (python -O)
+    """
+    factories = {
+        Player: lambda cls, i: cls(),
+        Platform: lambda cls, i: cls(i, PLATFORM_START_Y, PLATFORM_WIDTH),
+        Mouse: lambda cls, i: cls(i, PLATFORM_START_Y),
+        GameState: lambda cls, i: cls(),
+    }
+    print(f"{'bytes/obj':>10}  {'slots':>8}  {'no slots':>8}")
+    for cls, factory in factories.items():
+        plain = without_slots(cls)
+        slotted = bytes_per_instance(lambda i: factory(cls, i), args.count)
+        unslotted = bytes_per_instance(lambda i: factory(plain, i),
+                                       args.count)
+        print(f"{cls.__name__:>10}  {slotted:8.1f}  {unslotted:8.1f}")
+
+    # Режимы чередуются, берется лучший замер каждого: шум машины
+    # иначе больше разницы между режимами
+    debug = release = float("inf")
+    for _ in range(args.repeat):
+        debug = min(debug, player_update_in_mode(False, args.frames))
+        release = min(release, player_update_in_mode(True, args.frames))
+    print(f"{'us/frame':>10}  {'debug':>8}  {'-O':>8}")
+    print(f"{'update':>10}  {debug:8.3f}  {release:8.3f}")
+
+
+def _grown_state(game: GameController, platforms: int, mice: int,
+                 shift: float) -> bytes:
+    """
+    Снимок game с заданным количеством платформ и мышей
+    :param shift: Сдвиг всех объектов по X (разные наборы объектов)
+    """
+    scalars, world = unpack_state(game.snapshot())
+    platform_values = array("d")
+    for index in range(platforms):
+        platform_values.extend((shift + index * PLATFORM_STEP,
+                                PLATFORM_START_Y, PLATFORM_WIDTH))
+    mouse_values = array("d")
+    for index in range(mice):
+        x = shift + index * PLATFORM_STEP / 2
+        mouse_values.extend((x, PLATFORM_START_Y + MOUSE_SPAWN_OFFSET_Y,
+                             0.0, 0.0))
+    return pack_state(scalars, world._replace(platforms=platform_values,
+                                              mice=mouse_values))
+
+
+def bench_snapshot(platforms: int, mice: int,
+                   rounds: int) -> Tuple[int, float, float, float]:
+    """
+    GameController.snapshot/restore при заданном размере мира
+    :param platforms: Количество платформ
+    :param mice: Количество мышей
+    :param rounds: Количество повторов
+    :return: (размер снимка в байтах, snapshot, restore того же
+             состояния (откат), restore другого состояния (переход
+             между ветвями)) - время в микросекундах
+    """
+    game = GameController(headless=True, seed=0)
+    other = _grown_state(game, platforms, mice, PLATFORM_STEP / 4)
+    game.restore(_grown_state(game, platforms, mice, 0.0))
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        buffer = game.snapshot()
+    snapshot_us = (time.perf_counter() - started) / rounds * 1e6
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        game.restore(buffer)
+    rollback_us = (time.perf_counter() - started) / rounds * 1e6
+
+    started = time.perf_counter()
+    for _ in range(rounds // 2):
+        game.restore(other)
+        game.restore(buffer)
+    switch_us = (time.perf_counter() - started) / (rounds // 2 * 2) * 1e6
+    return len(buffer), snapshot_us, rollback_us, switch_us
+
+
+def run_snapshot(args: argparse.Namespace) -> None:
+    """
+    Размер и задержка снимков состояния при росте мира. Время растет
+    линейно с числом объектов: в игре живы до ~10 платформ и несколько
+    мышей, и откат занимает десятки микросекунд; до 20 платформ и 20
+    мышей он остается в пределах ~100 мкс, а 1000 платформ и 1000 мышей
+    - уже около 2.6 мс
+    """
+    print("platforms     mice     bytes  snapshot  rollback    switch"
+          "   (us per call)")
+    for platforms in args.platforms:
+        for mice in args.mice:
+            size, snapshot_us, rollback_us, switch_us = bench_snapshot(
+                platforms, mice, args.rounds
+            )
+            print(f"{platforms:>9}  {mice:>7}  {size:>8}  "
+                  f"{snapshot_us:>8.1f}  {rollback_us:>8.1f}  "
+                  f"{switch_us:>8.1f}")
+
+
+def bench_chunk(index: int, rounds: int) -> float:
+    """
+    PlatformGenerator.generate_chunk для куска с заданным номером
+    :return: Среднее время куска в микросекундах
+    """
+    generator = PlatformGenerator(0)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        generator.generate_chunk(index)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def bench_world_chunks(prefetch: bool,
+                       frames: int) -> Tuple[float, float, float]:
+    """
+    World.update при беге вправо: кадры, в которых добавляется кусок
+    :param prefetch: Готовить куски в фоновом потоке
+    :param frames: Количество кадров
+    :return: (среднее и худшее время кадра с новым куском в
+             микросекундах, доля кусков из очереди)
+    """
+    world = World(0, prefetch=prefetch)
+    chunk_frames = []
+    for _ in range(frames):
+        count = world.platform_count
+        started = time.perf_counter()
+        world.update(PLAYER_SPEED)
+        elapsed = time.perf_counter() - started
+        if world.platform_count > count:
+            chunk_frames.append(elapsed)
+        # Уступаем поток, как при ожидании следующего кадра в игре
+        time.sleep(0)
+    stats = world.chunk_prefetcher.get_stats()
+    world.chunk_prefetcher.close()
+    if not chunk_frames:
+        return 0.0, 0.0, stats['hit_rate']
+    return (sum(chunk_frames) / len(chunk_frames) * 1e6,
+            max(chunk_frames) * 1e6, stats['hit_rate'])
+
+
+def run_chunks(args: argparse.Namespace) -> None:
+    """Стоимость куска мира и кадры с генерацией"""
+    for km in args.km:
+        index = int(km * 100000 // WORLD_CHUNK_WIDTH)
+        print(f"chunk at {km:>6} km  "
+              f"{bench_chunk(index, args.rounds):8.1f} us/chunk")
+    print("prefetch   mean     max  hit rate"
+          "   (us per frame with a new chunk)")
+    for prefetch in (False, True):
+        mean_us, max_us, hit_rate = bench_world_chunks(prefetch,
+                                                       args.frames)
+        print(f"{'on' if prefetch else 'off':>8}  {mean_us:>5.0f}  "
+              f"{max_us:>6.0f}  {hit_rate:>8.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Model microbenchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    platforms = commands.add_parser(
+        "platforms", help="platform storage cost vs retained window"
+    )
+    platforms.add_argument("--retained", type=int, nargs="+",
+                           default=[10, 100, 1000, 10000, 100000])
+    platforms.add_argument("--frames", type=int, default=20000)
+    platforms.set_defaults(handler=run_platforms)
+
+    entities = commands.add_parser(
+        "entities", help="entity memory and player update cost"
+    )
+    entities.add_argument("--count", type=int, default=10000)
+    entities.add_argument("--frames", type=int, default=200000)
+    entities.add_argument("--repeat", type=int, default=5)
+    entities.set_defaults(handler=run_entities)
+
+    snapshot = commands.add_parser(
+        "snapshot", help="game state snapshot size and restore latency"
+    )
+    snapshot.add_argument("--platforms", type=int, nargs="+",
+                          default=[10, 100, 1000])
+    snapshot.add_argument("--mice", type=int, nargs="+",
+                          default=[0, 10, 100, 1000])
+    snapshot.add_argument("--rounds", type=int, default=2000)
+    snapshot.set_defaults(handler=run_snapshot)
+
+    chunks = commands.add_parser(
+        "chunks", help="world chunk generation cost and prefetch"
+    )
+    chunks.add_argument("--km", type=float, nargs="+",
+                        default=[0, 1, 50, 5000],
+                        help="chunk positions (1 km = 100000 px)")
+    chunks.add_argument("--rounds", type=int, default=2000)
+    chunks.add_argument("--frames", type=int, default=20000)
+    chunks.set_defaults(handler=run_chunks)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,29 @@ SCREEN_TITLE = "Котик и мышки"
 # Настройки отображения
 SHOW_HITBOXES = False
 HITBOX_COLOR = (255, 0, 0, 150)
+# Все хитбоксы кадра рисуются на общий слой и выводятся одним blit
+HITBOX_BATCHED = True
 FPS = 60
+# Симуляция в отдельном потоке, отрисовка по неизменяемым снимкам кадров
+THREADED_SIMULATION = False
+# Фиксированный шаг симуляции с интерполяцией при отрисовке.
+# FPS задает только частоту отрисовки
+FIXED_TIMESTEP = False
+# Шагов симуляции в секунду. Не настраивается: скорости, гравитация,
+# интервалы и запись ввода заданы на шаг 60 Гц, другое значение
+# изменило бы скорость игры
+SIMULATION_RATE = 60
+MAX_SIMULATION_STEPS = 5  # Максимум шагов симуляции за один кадр
+
+# Отрисовка без окна в поверхность в памяти (захват кадров в NumPy)
+HEADLESS_RENDER = False
+CAPTURE_INTERVAL = 1  # Захватывать каждый N-й кадр
+CAPTURE_RESOLUTION = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+# Отрисовка только измененных областей (dirty rects)
+DIRTY_RECT_RENDERING = False
+# При прокрутке камеры больше этого порога (px) кадр перерисовывается целиком
+DIRTY_RECT_SCROLL_THRESHOLD = 20
 
 # Отладочная информация
 DEBUG_FONT_NAME = None
@@ -16,6 +38,25 @@ DEBUG_FONT_SIZE = 24
 DEBUG_TEXT_COLOR = (255, 255, 255)
 DEBUG_LINE_SPACING = 25
 DEBUG_MARGIN = 10
+DEBUG_TEXT_CACHE_SIZE = 64
+# Быстро меняющиеся числа собираются из заранее отрисованных глифов
+DEBUG_GLYPH_ATLAS = True
+DEBUG_GLYPH_CHARS = "0123456789.-"
+
+# Профилировщик кадра
+PROFILER_HISTORY = 240  # Количество хранимых кадров
+PROFILER_GRAPH_WIDTH = 240
+PROFILER_GRAPH_HEIGHT = 80
+PROFILER_GRAPH_MAX_MS = 50.0  # Время кадра, соответствующее верху графика
+PROFILER_BUDGETS_MS = (1000 / 60, 1000 / 30)  # Линии бюджета кадра
+PROFILER_BACKGROUND_COLOR = (0, 0, 0, 160)
+PROFILER_GRAPH_COLOR = (80, 220, 80)
+PROFILER_BUDGET_COLOR = (255, 200, 0)
+PROFILER_MAX_STAGES_SHOWN = 6
+
+# Проверка типов в сеттерах моделей. Под python -O (__debug__ == False)
+# проверки отключаются, а физика пишет атрибуты напрямую
+VALIDATE_SETTERS = __debug__
 
 # Параметры игрока
 PLAYER_WIDTH = 200
@@ -39,23 +80,70 @@ PLATFORM_SPACING_MIN = 150
 PLATFORM_SPACING_MAX = 300
 PLATFORM_ALTERNATION_PATTERN = 2
 PLATFORM_ALTERNATION_MULTIPLIER = 1
+# Шаг квантования ширины платформ (0 - без квантования).
+# Кратность ширине тайла (PLATFORM_WIDTH) повышает переиспользование кэша
+PLATFORM_WIDTH_QUANTUM = 0
+PLATFORM_SURFACE_CACHE_SIZE = 64
 
 # Генерация мира
 WORLD_OFFSET_MARGIN = 100
 VISIBLE_PLATFORM_RANGE = 100
 INITIAL_PLATFORMS = 5
+# Ширина ячейки пространственного хэша для широкой фазы коллизий
+COLLISION_CELL_SIZE = 256
+# Зерно мира, если оно не задано, берется из модуля random
+# в диапазоне [0, 2 ** WORLD_SEED_BITS)
+WORLD_SEED_BITS = 32
+# Заданное зерно хранится в записях ввода и снимках как 64-битное
+# без знака: допустимы зерна [0, WORLD_SEED_LIMIT)
+WORLD_SEED_LIMIT = 2 ** 64
+# Мир генерируется кусками фиксированной ширины: кусок определяется
+# зерном мира и своим номером (номер занимает младшие биты зерна куска)
+WORLD_CHUNK_WIDTH = 2048
+WORLD_CHUNK_INDEX_BITS = 32
+# Сколько следующих кусков готовит фоновый поток
+WORLD_CHUNK_PREFETCH = 2
+# Генерировать куски впереди игрока в фоновом потоке
+BACKGROUND_CHUNK_PREFETCH = True
+
+# Запись и воспроизведение ввода
+REPLAY_MAGIC = b"CMRP"
+# 2 - мир строится кусками: записи версии 1 относятся к другой
+# раскладке платформ при том же зерне
+REPLAY_VERSION = 2
+# Ключевой кадр для перемотки воспроизведения каждые N кадров
+REPLAY_KEYFRAME_INTERVAL = 600
 
 # Пути к файлам
 ASSETS_DIR = "assets"
 BACKGROUND_IMAGE = "background.png"
+# Слои фона от дальнего к ближнему: (файл, коэффициент прокрутки).
+# 0 - слой неподвижен, 1 - движется вместе с платформами
+BACKGROUND_LAYERS = [
+    (BACKGROUND_IMAGE, 0.0),
+]
 PLATFORM_IMAGE = "grass.png"
 PLAYER_IMAGE = "cat.png"
 
+# Анимация игрока: лист спрайтов, разбитый на сетку кадров
+PLAYER_SPRITE_SHEET = PLAYER_IMAGE
+PLAYER_SHEET_COLUMNS = 1
+PLAYER_SHEET_ROWS = 1
+# Номера кадров листа (построчно) для каждого состояния
+PLAYER_ANIMATIONS = {
+    "idle": [0],
+    "run": [0],
+    "jump": [0],
+    "fall": [0],
+}
+PLAYER_ANIMATION_FRAME_TIME = 6  # Игровых кадров на один кадр анимации
+
 # Клавиши управления
 MOVE_LEFT_KEY = pygame.K_LEFT
 MOVE_RIGHT_KEY = pygame.K_RIGHT
 JUMP_KEY = pygame.K_SPACE
 TOGGLE_HITBOX_KEY = pygame.K_h
+TOGGLE_PROFILER_KEY = pygame.K_p
 
 # Позиции и высоты
 PLAYER_INITIAL_X = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
@@ -91,6 +179,7 @@ MOUSE_SCALE = (MOUSE_WIDTH, MOUSE_HEIGHT)
 MOUSE_SPAWN_OFFSET_Y = -20
 MOUSE_SPAWN_MARGIN = 20
 MOUSE_SPAWN_INTERVAL = 180
+MOUSE_POOL_SIZE = 128  # Максимум свободных мышей для переиспользования
 MOUSE_REMOVE_OFFSET = 100
 MOUSE_ANIMATION_SPEED = 0.2
 MOUSE_ANIMATION_AMPLITUDE = 0.1
@@ -99,3 +188,11 @@ MOUSE_ANIMATION_FRAME_DIVISOR = 2
 # Загрузка ресурсов
 FALLBACK_SURFACE_WIDTH = 100
 FALLBACK_SURFACE_HEIGHT = 100
+
+# Атлас текстур: имя -> (файл, размер)
+ATLAS_IMAGES = {
+    "platform": (PLATFORM_IMAGE, (PLATFORM_WIDTH, PLATFORM_HEIGHT)),
+    "mouse": (MOUSE_IMAGE, MOUSE_SCALE),
+}
+ATLAS_MAX_WIDTH = 1024
+ATLAS_PADDING = 1
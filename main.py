@@ -1,5 +1,28 @@
+import argparse
 from src.controller.game_controller import GameController
+from constants import WORLD_SEED_LIMIT
+
+
+def world_seed(value: str) -> int:
+    """Зерно мира из командной строки: целое в [0, 2 ** 64)"""
+    seed = int(value)
+    if not 0 <= seed < WORLD_SEED_LIMIT:
+        raise argparse.ArgumentTypeError("seed must be in [0, 2 ** 64)")
+    return seed
+
 
 if __name__ == "__main__":
-    game = GameController()
-    game.run()
+    parser = argparse.ArgumentParser(description="Cat and mouse")
+    parser.add_argument("--seed", type=world_seed, default=None,
+                        help="world seed, random when omitted")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="save the input replay to PATH on exit")
+    args = parser.parse_args()
+
+    game = GameController(seed=args.seed, record=args.record is not None)
+    try:
+        game.run()
+    finally:
+        # GameLoop.run завершает процесс через sys.exit
+        if args.record is not None:
+            game.recorder.save(args.record)
@@ -0,0 +1,64 @@
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Optional
+
+# Приветствие pygame испортило бы JSON в stdout
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.controller.input_recorder import Recording  # noqa: E402
+from src.controller.replayer import Replayer  # noqa: E402
+from constants import REPLAY_KEYFRAME_INTERVAL  # noqa: E402
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded game headlessly at maximum speed"
+    )
+    parser.add_argument("path", help="replay file written by main.py "
+                                     "--record")
+    parser.add_argument("--keyframe-interval", type=int,
+                        default=REPLAY_KEYFRAME_INTERVAL)
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="timed passes over the whole replay")
+    parser.add_argument("--seek", type=int, default=None,
+                        help="finish by seeking to this frame")
+    args = parser.parse_args(argv)
+
+    recording = Recording.load(args.path)
+    timings = []
+    for _ in range(max(1, args.repeat)):
+        replayer = Replayer(recording, args.keyframe_interval)
+        started = time.perf_counter()
+        replayer.run()
+        timings.append(time.perf_counter() - started)
+
+    result = {
+        "seed": recording.seed,
+        "frames": recording.frame_count,
+        "best_s": round(min(timings), 6),
+        "frames_per_s": round(recording.frame_count / min(timings), 1)
+        if min(timings) > 0 else None,
+        "keyframes": len(replayer.keyframes),
+    }
+    if args.seek is not None:
+        started = time.perf_counter()
+        replayer.seek(args.seek)
+        result["seek_ms"] = round((time.perf_counter() - started) * 1e3, 3)
+
+    info = replayer.controller.get_game_info()
+    result.update({
+        "frame": info["frame"],
+        "score": info["score"],
+        "distance": info["player_world_x"],
+        "mice": info["collected_mice"],
+    })
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
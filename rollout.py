@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional
+
+# Приветствие pygame испортило бы поток JSON в stdout
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.controller.action import Action  # noqa: E402
+from src.controller.game_controller import GameController  # noqa: E402
+from constants import WORLD_SEED_LIMIT  # noqa: E402
+
+# Смещение зерна политики, чтобы ее случайные числа не влияли на мир
+POLICY_SEED_OFFSET = 0x5EED
+
+# Действия случайной политики
+RANDOM_ACTIONS = (
+    Action.NONE, Action.LEFT, Action.RIGHT, Action.JUMP,
+    Action.LEFT | Action.JUMP, Action.RIGHT | Action.JUMP
+)
+
+
+def parse_script(script: str) -> List[Action]:
+    """
+    Разбирает сценарий ввода вида "RIGHT*30 RIGHT|JUMP NONE*5"
+    :param script: Действия через пробел, комбинации через "|",
+                   повтор через "*"
+    :return: Последовательность действий (повторяется по кругу)
+    """
+    actions = []
+    for token in script.split():
+        name, _, repeat = token.partition("*")
+        action = Action.NONE
+        try:
+            for part in name.split("|"):
+                action |= Action[part.upper()]
+            count = int(repeat) if repeat else 1
+        except (KeyError, ValueError):
+            raise ValueError(f"Bad script token {token!r}") from None
+        if count < 0:
+            raise ValueError(f"Bad script token {token!r}")
+        actions.extend([action] * count)
+
+    if not actions:
+        raise ValueError("Script contains no actions")
+    return actions
+
+
+def random_policy(seed: int) -> Iterator[Action]:
+    """Случайная политика с собственным генератором"""
+    rng = random.Random(seed + POLICY_SEED_OFFSET)
+    while True:
+        yield rng.choice(RANDOM_ACTIONS)
+
+
+def scripted_policy(actions: List[Action]) -> Iterator[Action]:
+    """Сценарная политика: действия повторяются по кругу"""
+    while True:
+        yield from actions
+
+
+def run_rollout(job: Dict) -> Dict:
+    """
+    Один прогон игры без дисплея (выполняется в процессе-работнике)
+    :param job: seed, frames и script (None - случайная политика)
+    :return: Результат прогона
+    """
+    seed = job["seed"]
+    frames = job["frames"]
+    script = job["script"]
+
+    game = GameController(headless=True, seed=seed)
+    policy = (random_policy(seed) if script is None
+              else scripted_policy(parse_script(script)))
+
+    frame_times = []
+    started = time.perf_counter()
+    for _, action in zip(range(frames), policy):
+        frame_start = time.perf_counter()
+        game.step(action)
+        frame_times.append(time.perf_counter() - frame_start)
+    elapsed = time.perf_counter() - started
+
+    frame_times.sort()
+    info = game.get_game_info()
+    return {
+        "seed": seed,
+        "frames": frames,
+        "policy": "random" if script is None else "script",
+        "score": info["score"],
+        "distance": info["player_world_x"],
+        "mice": info["collected_mice"],
+        "elapsed_s": round(elapsed, 6),
+        "frame_ms": _timing_summary(frame_times),
+    }
+
+
+def _timing_summary(sorted_times: List[float]) -> Dict[str, float]:
+    """Среднее и перцентили времени кадра в миллисекундах"""
+    if not sorted_times:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+
+    def percentile(fraction: float) -> float:
+        index = min(len(sorted_times) - 1, int(len(sorted_times) * fraction))
+        return round(sorted_times[index] * 1000.0, 4)
+
+    return {
+        "mean": round(sum(sorted_times) / len(sorted_times) * 1000.0, 4),
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "max": round(sorted_times[-1] * 1000.0, 4),
+    }
+
+
+class RolloutRunner:
+    """
+    Раздает прогоны по пулу процессов и выдает результаты по мере
+    готовности. В работе одновременно не больше window прогонов, поэтому
+    при падении процесса (BrokenProcessPool) под подозрением только они:
+    пул пересоздается для остальных, а подозреваемые потом выполняются
+    по одному в отдельном процессе, где падение однозначно
+    """
+
+    def __init__(self, workers: Optional[int] = None, retries: int = 2):
+        """
+        :param workers: Количество процессов (None - по числу ядер)
+        :param retries: Сколько раз перезапускать упавший прогон
+        """
+        self._workers = workers or os.cpu_count() or 1
+        self._retries = retries
+
+    def run(self, jobs: List[Dict]) -> Iterator[Dict]:
+        """
+        Выполняет прогоны
+        :param jobs: Описания прогонов (см. run_rollout)
+        :return: Результаты в порядке завершения
+        """
+        queue = deque(jobs)
+        suspects = []
+        while queue:
+            yield from self._run_pool(queue, suspects)
+
+        for job in suspects:
+            yield self._run_isolated(job)
+
+    def _run_pool(self, queue: deque, suspects: List[Dict]) -> Iterator[Dict]:
+        """Выполняет очередь в одном пуле до конца или до его падения"""
+        window = self._workers * 2
+        in_flight = {}
+        with ProcessPoolExecutor(max_workers=self._workers) as pool:
+            while queue or in_flight:
+                while queue and len(in_flight) < window:
+                    job = queue.popleft()
+                    in_flight[pool.submit(run_rollout, job)] = job
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        suspects.extend(in_flight.values())
+                        return
+                    except Exception as error:
+                        result = _error_result(in_flight[future], error)
+                    del in_flight[future]
+                    yield result
+
+    def _run_isolated(self, job: Dict) -> Dict:
+        """Выполняет прогон в отдельном процессе с повторами при падении"""
+        error = None
+        for _ in range(self._retries + 1):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                try:
+                    return pool.submit(run_rollout, job).result()
+                except BrokenProcessPool as crash:
+                    error = crash
+                except Exception as failure:
+                    return _error_result(job, failure)
+        return _error_result(job, error)
+
+
+def _error_result(job: Dict, error: BaseException) -> Dict:
+    """Строка результата для прогона, завершившегося ошибкой"""
+    return {"seed": job["seed"], "frames": job["frames"],
+            "error": repr(error)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(
+        description="Parallel headless rollouts, one JSON line per seed"
+    )
+    parser.add_argument("--seed-start", type=int, default=0)
+    parser.add_argument("--seed-count", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="frame budget per rollout")
+    parser.add_argument("--script", default=None,
+                        help='scripted input, e.g. "RIGHT*30 RIGHT|JUMP"; '
+                             "random policy when omitted")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--output", default="-",
+                        help="JSON lines file, '-' for stdout")
+    args = parser.parse_args(argv)
+    if not (0 <= args.seed_start and args.seed_count >= 0 and
+            args.seed_start + args.seed_count <= WORLD_SEED_LIMIT):
+        parser.error("seeds must be in [0, 2 ** 64)")
+
+    if args.script is not None:
+        # Ошибку в сценарии показываем до запуска пула
+        try:
+            parse_script(args.script)
+        except (KeyError, ValueError) as error:
+            parser.error(f"--script: {error}")
+
+    jobs = [
+        {"seed": seed, "frames": args.frames, "script": args.script}
+        for seed in range(args.seed_start, args.seed_start + args.seed_count)
+    ]
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    failed = 0
+    try:
+        runner = RolloutRunner(args.workers, args.retries)
+        for result in runner.run(jobs):
+            failed += "error" in result
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
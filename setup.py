@@ -8,6 +8,7 @@ setup(
         "": ["*.png", "*.json"]  # Включаем все ресурсы
     },
     install_requires=[
-        "pygame>=2.0.0"  # Указываем зависимости
+        "pygame>=2.0.0",  # Указываем зависимости
+        "numpy>=1.20",  # BatchSimulator и захват кадров
     ],
 )
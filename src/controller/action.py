@@ -0,0 +1,24 @@
+from enum import IntFlag
+from constants import PLAYER_SPEED
+
+
+class Action(IntFlag):
+    """Действия игрока за один кадр (битовая маска)"""
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    JUMP = 4
+
+
+def movement_from_action(action: Action, can_move_left: bool) -> float:
+    """
+    Переводит действие в движение по X по тем же правилам, что и клавиатура
+    :param action: Действие кадра
+    :param can_move_left: Разрешено ли движение влево
+    :return: Величина движения
+    """
+    if action & Action.RIGHT:
+        return PLAYER_SPEED
+    if action & Action.LEFT and can_move_left:
+        return -PLAYER_SPEED
+    return 0.0
@@ -1,11 +1,17 @@
 import pygame
+from typing import Optional, Tuple
 from src.model.game_state import GameState
+from src.model.frame_snapshot import FrameSnapshot
 from src.model.player import Player
 from src.model.world import World
+from src.model.state_buffer import pack_state, unpack_state
 from src.controller.input_handler import InputHandler
+from src.controller.input_recorder import InputRecorder
 from src.controller.game_loop import GameLoop
 from src.controller.input_callbacks import IInputCallbacks
+from src.controller.action import Action, movement_from_action
 from src.utils.sound_manager import SoundManager
+from src.utils.frame_profiler import FrameProfiler
 from constants import (
     BACKGROUND_MUSIC, SOUND_VOLUME,
     TOGGLE_MUSIC_KEY, TOGGLE_SOUND_KEY,
@@ -14,24 +20,43 @@ from constants import (
 
 
 class GameController(IInputCallbacks):
-    def __init__(self):
-        """Инициализация контроллера игры с разделением ответственности"""
+    def __init__(self, headless: bool = False, seed: Optional[int] = None,
+                 record: bool = False):
+        """
+        Инициализация контроллера игры с разделением ответственности
+        :param headless: Без звука и дисплея, управление только через step().
+                         Куски мира строятся в том же потоке
+        :param seed: Зерно мира (None - случайное)
+        :param record: Записывать действия игрока с клавиатуры
+                       (InputRecorder, см. свойство recorder)
+        """
+        self._headless = headless
+
         # Модель
         self._game_state = GameState()
         self._player = Player()
-        self._world = World()
+        self._world = World(seed, prefetch=not self._headless)
 
         # Ввод - теперь передаем self как callback
-        self._input_handler = InputHandler(self)
+        recorder = InputRecorder(self._world.seed) if record else None
+        self._input_handler = InputHandler(self, recorder)
 
         # Звук
-        self._sound_manager = SoundManager()
+        self._sound_manager = SoundManager(enabled=not headless)
         self._load_sounds()
 
         # Временное состояние
         self._current_movement = 0.0
         self._was_on_ground = False
         self._last_mouse_count = 0
+        self._frame = 0
+
+        # Профилировщик стадий кадра
+        self._profiler = FrameProfiler()
+        for method_name in ("handle_events", "_process_input",
+                            "_update_world", "_update_player",
+                            "_handle_collisions"):
+            self._profiler.instrument(self, method_name)
 
     # Свойства для контролируемого доступа
 
@@ -50,6 +75,16 @@ class GameController(IInputCallbacks):
         """Мир (только чтение)"""
         return self._world
 
+    @property
+    def seed(self) -> int:
+        """Зерно текущего мира (только чтение)"""
+        return self._world.seed
+
+    @property
+    def recorder(self) -> Optional[InputRecorder]:
+        """Запись действий игрока (только чтение)"""
+        return self._input_handler.recorder
+
     @property
     def input_handler(self) -> InputHandler:
         """Обработчик ввода (только чтение)"""
@@ -60,6 +95,21 @@ class GameController(IInputCallbacks):
         """Звуки (только чтение)"""
         return self._sound_manager
 
+    @property
+    def frame(self) -> int:
+        """Количество выполненных шагов симуляции (только чтение)"""
+        return self._frame
+
+    @property
+    def headless(self) -> bool:
+        """Режим без звука и дисплея (только чтение)"""
+        return self._headless
+
+    @property
+    def profiler(self) -> FrameProfiler:
+        """Профилировщик кадра (только чтение)"""
+        return self._profiler
+
     # Реализация интерфейса IInputCallbacks
 
     def _load_sounds(self) -> None:
@@ -79,6 +129,10 @@ class GameController(IInputCallbacks):
         """Переключение хитбоксов"""
         self._game_state.toggle_hitboxes()
 
+    def on_toggle_profiler(self) -> None:
+        """Переключение профилировщика кадра"""
+        self._profiler.toggle()
+
     def get_movement(self, can_move_left: bool) -> float:
         """Получение вектора движения"""
         return self._input_handler.get_movement(can_move_left)
@@ -90,17 +144,24 @@ class GameController(IInputCallbacks):
         # Получаем движение через callback
         self._current_movement = self.get_movement(self._world.can_move_left())
 
-    def _update_world(self) -> None:
+    def _update_world(self, dt: int = 1) -> None:
         """Обновление состояния мира"""
-        self._world.update(self._current_movement)
+        self._world.update(self._current_movement, dt)
 
-    def _update_player(self) -> None:
+    def _update_player(self, dt: int = 1) -> None:
         """Обновление состояния игрока"""
         # Сохраняем предыдущее состояние для определения приземления
 
+        # Хитбокс игрока не сдвигается по X на экране, поэтому платформы
+        # для коллизий выбираются по его пути за шаг
         self._player.update(
-            self._world.get_visible_platforms(),
-            self._current_movement
+            self._world.get_platforms_near(
+                self._player.hitbox,
+                self._player.world_x,
+                self._current_movement
+            ),
+            self._current_movement,
+            dt
         )
 
     def _handle_collisions(self) -> None:
@@ -149,21 +210,103 @@ class GameController(IInputCallbacks):
     def update(self) -> None:
         """Обновление игровой логики"""
         self._process_input()
-        self._update_world()
-        self._update_player()
+        self._advance()
+
+    def step(self, action: Action = Action.NONE, dt: int = 1
+             ) -> Tuple[FrameSnapshot, dict]:
+        """
+        Один шаг симуляции с заданным действием вместо клавиатуры.
+        Не требует дисплея, микшера и часов
+        :param action: Действие игрока на этот шаг
+        :param dt: Длина шага в целых кадрах 60 Гц (больше 1 - быстрее
+                   реального времени, приземления ловятся непрерывной
+                   проверкой коллизий)
+        :return: (наблюдение, информация о игре)
+        """
+        self.advance(action, dt)
+        return self.get_observation(), self.get_game_info()
+
+    def advance(self, action: Action = Action.NONE, dt: int = 1) -> None:
+        """
+        Шаг step() без снимка наблюдения - для воспроизведения записей
+        на максимальной скорости. Действие проходит тот же путь, что и
+        ввод с клавиатуры в update()
+        :param action: Действие игрока на этот шаг
+        :param dt: Длина шага в целых кадрах 60 Гц
+        """
+        if dt < 1 or dt != int(dt):
+            raise ValueError("Step length must be a positive whole number "
+                             "of frames")
+        if action & Action.JUMP:
+            self.on_jump()
+        self._current_movement = movement_from_action(
+            action, self._world.can_move_left()
+        ) * dt
+        self._advance(dt)
+
+    def _advance(self, dt: int = 1) -> None:
+        """
+        Продвигает мир на один шаг после обработки ввода
+        :param dt: Длина шага в кадрах 60 Гц
+        """
+        self._update_world(dt)
+        self._update_player(dt)
         self._handle_collisions()
+        self._frame += 1
+
+    def get_observation(self) -> FrameSnapshot:
+        """Неизменяемый снимок текущего шага"""
+        return FrameSnapshot.capture(self._frame, self._game_state,
+                                     self._player, self._world)
 
     def run(self) -> None:
         """Запуск игры через GameLoop"""
         game_loop = GameLoop(self)
         game_loop.run()
 
-    def reset_game(self) -> None:
-        """Сброс игры к начальному состоянию"""
+    def snapshot(self) -> bytes:
+        """
+        Снимок всего состояния модели в плоском буфере (state_buffer):
+        контроллер, GameState, Player, платформы, мыши с таймером
+        появления и генератор случайных чисел мира. Не путать с
+        FrameSnapshot - неизменяемым снимком для отрисовки
+        :return: Буфер для restore
+        """
+        scalars = ((self._frame, self._current_movement,
+                    self._was_on_ground, self._last_mouse_count) +
+                   self._game_state.get_state() +
+                   self._player.get_state())
+        return pack_state(scalars, self._world.get_state())
+
+    def restore(self, buffer: bytes) -> None:
+        """
+        Возвращает модель в состояние snapshot. Буфер не изменяется и
+        может восстанавливаться повторно (ветвление, откат). Статистика
+        пула мышей и широкой фазы не восстанавливается.
+        Время линейно по числу платформ и мышей: десятки микросекунд
+        для живого окна игры (до ~20 платформ и ~20 мышей), миллисекунды
+        для тысяч объектов (см. benchmark.py snapshot)
+        :param buffer: Результат snapshot
+        """
+        scalars, world_state = unpack_state(buffer)
+        (self._frame, self._current_movement, self._was_on_ground,
+         self._last_mouse_count) = scalars[:4]
+        self._game_state.set_state(*scalars[4:8])
+        self._player.set_state(*scalars[8:])
+        self._world.set_state(world_state)
+
+    def reset_game(self, seed: Optional[int] = None) -> None:
+        """
+        Сброс игры к начальному состоянию
+        :param seed: Зерно нового мира (None - случайное)
+        """
         self._game_state.reset()
         self._player = Player()
-        self._world = World()
+        self._world.chunk_prefetcher.close()
+        self._world = World(seed, prefetch=not self._headless)
         self._current_movement = 0.0
+        self._last_mouse_count = 0
+        self._frame = 0
 
     def get_game_info(self) -> dict:
         """
@@ -171,13 +314,18 @@ class GameController(IInputCallbacks):
         :return: словарь с информацией о игре
         """
         return {
+            'frame': self._frame,
             'player_position': self._player.get_position(),
+            'player_world_x': self._player.world_x,
             'player_velocity_y': self._player.vel_y,
             'player_jumping': self._player.is_jumping,
             'world_offset': self._world.world_offset,
             'platform_count': self._world.platform_count,
             'active_platforms': self._world.active_platform_count,
             'score': self._game_state.score,
+            'collected_mice': self._world.collected_mice_count,
+            'mouse_pool': self._world.mouse_pool.get_stats(),
+            'broad_phase': self._world.get_collision_stats(),
             'show_hitboxes': self._game_state.show_hitboxes,
             'running': self._game_state.running
         }
@@ -1,40 +1,115 @@
+import os
 import pygame
 import sys
+import threading
+from typing import Callable, Optional, TYPE_CHECKING
 from src.view.game_view import GameView
 from src.view.player_view import PlayerView
 from src.view.world_view import WorldView
 from src.view.debug_view import DebugView
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, FPS
+from src.view.hitbox_renderer import HitboxRenderer
+from src.model.frame_snapshot import FrameSnapshot
+from src.controller.snapshot_buffer import SnapshotBuffer
+from src.view.frame_capture import FrameCapture
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, FPS, THREADED_SIMULATION,
+    FIXED_TIMESTEP, SIMULATION_RATE, MAX_SIMULATION_STEPS,
+    HEADLESS_RENDER, CAPTURE_INTERVAL, CAPTURE_RESOLUTION
+)
+
+if TYPE_CHECKING:
+    import numpy
 
 
 class GameLoop:
-    def __init__(self, game_controller):
+    def __init__(self,
+                 game_controller,
+                 threaded: bool = THREADED_SIMULATION,
+                 fixed_timestep: bool = FIXED_TIMESTEP,
+                 headless: bool = HEADLESS_RENDER,
+                 on_frame: Optional[
+                     Callable[[int, 'numpy.ndarray'], None]] = None,
+                 capture_interval: int = CAPTURE_INTERVAL,
+                 capture_resolution=CAPTURE_RESOLUTION):
+        """
+        Инициализация игрового цикла
+        :param game_controller: Контроллер игры
+        :param threaded: Запускать симуляцию в отдельном потоке
+        :param fixed_timestep: Фиксированный шаг симуляции с интерполяцией
+                               (SIMULATION_RATE шагов в секунду при любом
+                               FPS отрисовки)
+        :param headless: Отрисовка без окна и без ограничения FPS
+        :param on_frame: Получатель захваченных кадров (массив HxWx3)
+        :param capture_interval: Захватывать каждый N-й кадр
+        :param capture_resolution: Размер захватываемых кадров
+        """
         self._game_controller = game_controller
         self._screen = None
         self._clock = None
         self._view = None
 
+        # Многопоточный режим
+        self._threaded = threaded
+        self._snapshots = SnapshotBuffer()
+        self._controller_lock = threading.Lock()
+        self._sim_frame = 0
+
+        # Фиксированный шаг
+        self._fixed_timestep = fixed_timestep
+        self._sim_step = 1.0 / SIMULATION_RATE
+
+        # Отрисовка без окна
+        self._headless = headless
+        self._on_frame = on_frame
+        self._capture_interval = capture_interval
+        self._capture_resolution = capture_resolution
+        self._capture: Optional[FrameCapture] = None
+
     def _initialize_views(self) -> GameView:
         """Инициализация всех view"""
-        player_view = PlayerView()
-        world_view = WorldView()
+        # Один отрисовщик хитбоксов на все view для пакетной отрисовки
+        hitbox_renderer = HitboxRenderer()
+        player_view = PlayerView(hitbox_renderer)
+        world_view = WorldView(hitbox_renderer)
         debug_view = DebugView()
 
         return GameView(
             screen=self._screen,
             player_view=player_view,
             world_view=world_view,
-            debug_view=debug_view
+            debug_view=debug_view,
+            hitbox_renderer=hitbox_renderer,
+            profiler=self._game_controller.profiler,
+            present=not self._headless
         )
 
     def _initialize(self) -> None:
         """Инициализация дисплея и view"""
-        pygame.init()
-        self._screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(SCREEN_TITLE)
+        if self._headless:
+            self._initialize_headless()
+        else:
+            pygame.init()
+            self._screen = pygame.display.set_mode(
+                (SCREEN_WIDTH, SCREEN_HEIGHT)
+            )
+            pygame.display.set_caption(SCREEN_TITLE)
         self._clock = pygame.time.Clock()
         self._view = self._initialize_views()
 
+        if self._on_frame is not None:
+            self._capture = FrameCapture(self._screen,
+                                         self._on_frame,
+                                         self._capture_interval,
+                                         self._capture_resolution)
+
+    def _initialize_headless(self) -> None:
+        """Отрисовка в поверхность в памяти без окна"""
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        # Дисплей 1x1 нужен только для convert_alpha при загрузке ресурсов
+        pygame.display.set_mode((1, 1))
+        self._screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+
     def _process_events(self) -> None:
         """Обработка всех событий ввода"""
         self._game_controller.handle_events()
@@ -45,22 +120,143 @@ class GameLoop:
 
     def _render_frame(self) -> None:
         """Отрисовка кадра"""
-        self._view.render(
+        self._render(
             self._game_controller.game_state,
             self._game_controller.player,
             self._game_controller.world
         )
 
-    def run(self) -> None:
-        """Запуск главного игрового цикла"""
+    def _render(self, game_state, player, world) -> None:
+        """
+        Отрисовка состояния (модели или снимка кадра) и захват кадра.
+        Через этот метод рисуют все режимы цикла
+        """
+        self._view.render(game_state, player, world)
+        if self._capture is not None:
+            self._capture.capture()
+
+    def _capture_snapshot(self) -> FrameSnapshot:
+        """Снимок текущего шага симуляции"""
+        return FrameSnapshot.capture(
+            self._sim_frame,
+            self._game_controller.game_state,
+            self._game_controller.player,
+            self._game_controller.world
+        )
+
+    def _publish_snapshot(self) -> None:
+        """Публикует снимок текущего кадра для потока отрисовки"""
+        self._snapshots.publish(self._capture_snapshot())
+
+    def _simulation_worker(self) -> None:
+        """Поток симуляции: обновляет игру и публикует снимки"""
+        clock = pygame.time.Clock()
+
+        while self._game_controller.game_state.running:
+            with self._controller_lock:
+                self._update_game()
+                self._sim_frame += 1
+                self._publish_snapshot()
+            # Частота шагов не зависит от FPS отрисовки
+            clock.tick(SIMULATION_RATE)
+
+    def _run_serial(self) -> None:
+        """Последовательный цикл: события, логика, отрисовка"""
+        profiler = self._game_controller.profiler
+
+        while self._game_controller.game_state.running:
+            profiler.begin_frame()
+            self._process_events()
+            self._update_game()
+            self._render_frame()
+            profiler.end_frame()
+            if not self._headless:
+                self._clock.tick(FPS)
+
+    def _run_fixed_timestep(self) -> None:
+        """Цикл с фиксированным шагом симуляции и интерполяцией"""
+        accumulator = 0.0
+        previous = current = self._capture_snapshot()
+        profiler = self._game_controller.profiler
+        self._clock.tick()
+
+        while self._game_controller.game_state.running:
+            # Ожидание FPS не входит в измеряемый кадр. Время кадра
+            # ограничено, чтобы не догонять бесконечно
+            accumulator += min(self._clock.tick(FPS) / 1000.0,
+                               self._sim_step * MAX_SIMULATION_STEPS)
+
+            profiler.begin_frame()
+            self._process_events()
+
+            while accumulator >= self._sim_step:
+                self._update_game()
+                self._sim_frame += 1
+                previous, current = current, self._capture_snapshot()
+                accumulator -= self._sim_step
+
+            snapshot = current.lerp(previous, accumulator / self._sim_step)
+            self._render(snapshot.game_state,
+                         snapshot.player,
+                         snapshot.world)
+            profiler.end_frame()
+
+    def _run_threaded(self) -> None:
+        """Цикл отрисовки с симуляцией в отдельном потоке"""
+        self._publish_snapshot()
+        simulation = threading.Thread(target=self._simulation_worker,
+                                      name="simulation", daemon=True)
+        simulation.start()
+
+        profiler = self._game_controller.profiler
+        rendered_frame = -1
+        while self._game_controller.game_state.running:
+            # События pygame обрабатываются только в главном потоке
+            with self._controller_lock:
+                self._process_events()
+
+            snapshot = self._snapshots.wait_newer(rendered_frame,
+                                                  timeout=1 / FPS)
+            if snapshot.frame != rendered_frame:
+                # В этом режиме кадр - это работа потока отрисовки
+                profiler.begin_frame()
+                self._render(snapshot.game_state,
+                             snapshot.player,
+                             snapshot.world)
+                profiler.end_frame()
+                rendered_frame = snapshot.frame
+
+        simulation.join()
+
+    def run_frames(self, frame_count: int) -> int:
+        """
+        Прогоняет заданное число кадров без ограничения FPS и без выхода
+        :param frame_count: Количество кадров
+        :return: Количество захваченных кадров
+        """
         if not self._screen:
             self._initialize()
 
-        while self._game_controller.game_state.running:
+        for _ in range(frame_count):
+            if not self._game_controller.game_state.running:
+                break
             self._process_events()
             self._update_game()
             self._render_frame()
-            self._clock.tick(FPS)
+
+        return self._capture.frames_captured if self._capture else 0
+
+    def run(self) -> None:
+        """Запуск главного игрового цикла"""
+        if not self._screen:
+            self._initialize()
+
+        if self._threaded:
+            self._run_threaded()
+        elif self._fixed_timestep:
+            self._run_fixed_timestep()
+        else:
+            self._run_serial()
 
         pygame.quit()
         sys.exit()
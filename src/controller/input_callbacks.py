@@ -14,6 +14,11 @@ class IInputCallbacks(ABC):
         """Callback для переключения хитбоксов"""
         pass
 
+    @abstractmethod
+    def on_toggle_profiler(self) -> None:
+        """Callback для переключения профилировщика кадра"""
+        pass
+
     @abstractmethod
     def get_movement(self, can_move_left: bool) -> float:
         """Callback для получения движения"""
@@ -1,41 +1,71 @@
 import pygame
+from typing import Optional
 from constants import (
     JUMP_KEY,
     TOGGLE_HITBOX_KEY,
+    TOGGLE_PROFILER_KEY,
     MOVE_RIGHT_KEY,
     MOVE_LEFT_KEY,
-    PLAYER_SPEED,
 )
 from src.controller.input_callbacks import IInputCallbacks
+from src.controller.action import Action, movement_from_action
+from src.controller.input_recorder import InputRecorder
 
 
 class InputHandler:
     def __init__(
         self,
         callbacks: IInputCallbacks,
+        recorder: Optional[InputRecorder] = None,
     ):
         """
         Инициализация обработчика ввода
         :param callbacks: Объект с callback методами
+        :param recorder: Запись действий каждого кадра (None - без записи)
         """
         self.callbacks = callbacks
+        self._recorder = recorder
+        # Прыжок с прошлого кадра: попадает в действие следующего кадра
+        self._jump_pending = False
+
+    @property
+    def recorder(self) -> Optional[InputRecorder]:
+        """Запись действий (только чтение)"""
+        return self._recorder
 
     def process_event(self, event) -> None:
         """Обработка отдельных событий"""
         if event.type == pygame.KEYDOWN:
             if event.key == JUMP_KEY:
                 self.callbacks.on_jump()
+                self._jump_pending = True
             elif event.key == TOGGLE_HITBOX_KEY:
                 self.callbacks.on_toggle_hitbox()
+            elif event.key == TOGGLE_PROFILER_KEY:
+                self.callbacks.on_toggle_profiler()
 
-    def get_movement(self, can_move_left: bool) -> float:
-        """Получение вектора движения от пользователя"""
+    def get_action(self) -> Action:
+        """Действие по текущему состоянию клавиш движения"""
         keys = pygame.key.get_pressed()
-        movement = 0.0
+        action = Action.NONE
 
         if keys[MOVE_RIGHT_KEY]:
-            movement = PLAYER_SPEED
-        elif keys[MOVE_LEFT_KEY] and can_move_left:
-            movement = -PLAYER_SPEED
+            action |= Action.RIGHT
+        if keys[MOVE_LEFT_KEY]:
+            action |= Action.LEFT
+
+        return action
 
-        return movement
+    def get_movement(self, can_move_left: bool) -> float:
+        """
+        Получение вектора движения от пользователя.
+        Вызывается один раз за кадр, поэтому здесь же действие кадра
+        попадает в запись
+        """
+        action = self.get_action()
+        if self._recorder is not None:
+            if self._jump_pending:
+                action |= Action.JUMP
+            self._recorder.record(action)
+        self._jump_pending = False
+        return movement_from_action(action, can_move_left)
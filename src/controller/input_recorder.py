@@ -0,0 +1,119 @@
+import struct
+from typing import NamedTuple
+from src.controller.action import Action
+from constants import REPLAY_MAGIC, REPLAY_VERSION
+
+# Заголовок файла: сигнатура, версия, зерно мира, количество кадров
+_HEADER = struct.Struct("<4sBQI")
+# Все биты Action помещаются в полубайт: два кадра на байт
+_ACTION_BITS = 4
+_ACTION_MASK = (1 << _ACTION_BITS) - 1
+_KNOWN_ACTIONS = Action.LEFT | Action.RIGHT | Action.JUMP
+
+
+class Recording(NamedTuple):
+    """Запись игры: зерно мира и действие каждого кадра"""
+    seed: int
+    actions: bytes  # Action кадра, по байту на кадр
+
+    @property
+    def frame_count(self) -> int:
+        """Количество записанных кадров"""
+        return len(self.actions)
+
+    def to_bytes(self) -> bytes:
+        """
+        Компактный двоичный формат: заголовок и битовые маски действий,
+        по два кадра в байте (младший полубайт - четный кадр)
+        :return: Содержимое файла записи
+        """
+        actions = self.actions
+        packed = bytearray((len(actions) + 1) // 2)
+        for index in range(0, len(actions) - 1, 2):
+            packed[index // 2] = (actions[index] |
+                                  actions[index + 1] << _ACTION_BITS)
+        if len(actions) % 2:
+            packed[-1] = actions[-1]
+
+        header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed,
+                              len(actions))
+        return header + bytes(packed)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Recording':
+        """
+        Разбирает двоичный формат to_bytes
+        :param data: Содержимое файла записи
+        :return: Запись
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Replay data is truncated")
+        magic, version, seed, frame_count = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        packed = data[_HEADER.size:]
+        if len(packed) != (frame_count + 1) // 2:
+            raise ValueError("Replay data does not match its frame count")
+
+        actions = bytearray(frame_count)
+        actions[0::2] = bytes(byte & _ACTION_MASK
+                              for byte in packed[:(frame_count + 1) // 2])
+        actions[1::2] = bytes(byte >> _ACTION_BITS
+                              for byte in packed[:frame_count // 2])
+        if any(action & ~_KNOWN_ACTIONS for action in actions):
+            raise ValueError("Replay contains unknown action bits")
+        return cls(seed, bytes(actions))
+
+    def save(self, path: str) -> None:
+        """Сохраняет запись в файл"""
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Recording':
+        """Загружает запись из файла"""
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+
+class InputRecorder:
+    """Накопитель действий игрока по кадрам для последующего повтора"""
+
+    def __init__(self, seed: int):
+        """
+        :param seed: Зерно мира, в котором идет запись
+        """
+        self._seed = seed
+        self._actions = bytearray()
+
+    # Свойства
+
+    @property
+    def seed(self) -> int:
+        """Зерно мира (только чтение)"""
+        return self._seed
+
+    @property
+    def frame_count(self) -> int:
+        """Количество записанных кадров (только чтение)"""
+        return len(self._actions)
+
+    # Публичные методы
+
+    def record(self, action: Action) -> None:
+        """
+        Добавляет действие очередного кадра
+        :param action: Битовая маска LEFT/RIGHT/JUMP
+        """
+        self._actions.append(action)
+
+    def get_recording(self) -> Recording:
+        """Неизменяемая запись на текущий момент"""
+        return Recording(self._seed, bytes(self._actions))
+
+    def save(self, path: str) -> None:
+        """Сохраняет запись в файл"""
+        self.get_recording().save(path)
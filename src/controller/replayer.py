@@ -0,0 +1,107 @@
+from bisect import bisect_right, insort
+from typing import Dict, List, Optional
+from src.controller.action import Action
+from src.controller.game_controller import GameController
+from src.controller.input_recorder import Recording
+from constants import REPLAY_KEYFRAME_INTERVAL
+
+# Action для каждого значения байта записи (без создания enum в цикле)
+_ACTIONS = [Action(value)
+            for value in range((Action.LEFT | Action.RIGHT | Action.JUMP) + 1)]
+
+
+class Replayer:
+    """
+    Воспроизведение записи без дисплея на максимальной скорости.
+    Каждые keyframe_interval кадров сохраняется ключевой кадр, поэтому
+    seek() перематывает к любому кадру, проигрывая не больше
+    keyframe_interval кадров
+    """
+
+    def __init__(self, recording: Recording,
+                 keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL):
+        """
+        :param recording: Запись (зерно мира и действия кадров)
+        :param keyframe_interval: Шаг ключевых кадров
+        """
+        if keyframe_interval < 1:
+            raise ValueError("Keyframe interval must be positive")
+
+        self._recording = recording
+        self._keyframe_interval = keyframe_interval
+        self._controller = GameController(headless=True,
+                                          seed=recording.seed)
+        self._keyframes: Dict[int, bytes] = {
+            0: self._controller.snapshot()
+        }
+        self._keyframe_frames: List[int] = [0]
+
+    # Свойства
+
+    @property
+    def controller(self) -> GameController:
+        """Контроллер воспроизводимой игры (только чтение)"""
+        return self._controller
+
+    @property
+    def frame(self) -> int:
+        """Номер следующего воспроизводимого кадра (только чтение)"""
+        return self._controller.frame
+
+    @property
+    def frame_count(self) -> int:
+        """Длина записи в кадрах (только чтение)"""
+        return self._recording.frame_count
+
+    @property
+    def keyframes(self) -> List[int]:
+        """Кадры с сохраненными ключевыми кадрами (только чтение)"""
+        return self._keyframe_frames.copy()
+
+    # Публичные методы
+
+    def run(self, frames: Optional[int] = None) -> int:
+        """
+        Воспроизводит запись с текущего кадра
+        :param frames: Сколько кадров проиграть (None - до конца записи)
+        :return: Количество проигранных кадров
+        """
+        end = self.frame_count
+        if frames is not None:
+            end = min(end, self.frame + frames)
+        start = self.frame
+        self._play_to(end)
+        return self.frame - start
+
+    def seek(self, frame: int) -> None:
+        """
+        Перематывает к кадру: загружает ближайший ключевой кадр
+        не позже frame и проигрывает оставшиеся кадры
+        :param frame: Номер кадра (0..frame_count)
+        """
+        if not 0 <= frame <= self.frame_count:
+            raise ValueError("Frame is outside the recording")
+
+        # Вперед в пределах интервала быстрее без загрузки
+        nearest = self._keyframe_frames[
+            bisect_right(self._keyframe_frames, frame) - 1
+        ]
+        if not nearest <= self.frame <= frame:
+            self._controller.restore(self._keyframes[nearest])
+        self._play_to(frame)
+
+    # Приватные методы
+
+    def _play_to(self, end: int) -> None:
+        """Проигрывает кадры до end, сохраняя новые ключевые кадры"""
+        actions = self._recording.actions
+        controller = self._controller
+        interval = self._keyframe_interval
+
+        for frame in range(self.frame, end):
+            controller.advance(_ACTIONS[actions[frame]])
+            next_frame = frame + 1
+            if (next_frame % interval == 0 and
+                    next_frame not in self._keyframes):
+                self._keyframes[next_frame] = controller.snapshot()
+                insort(self._keyframe_frames, next_frame)
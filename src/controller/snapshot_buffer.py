@@ -0,0 +1,46 @@
+import threading
+from typing import List, Optional
+from src.model.frame_snapshot import FrameSnapshot
+
+
+class SnapshotBuffer:
+    """Двойной буфер снимков кадров между потоками симуляции и отрисовки"""
+
+    def __init__(self) -> None:
+        self._slots: List[Optional[FrameSnapshot]] = [None, None]
+        self._front = 0
+        self._condition = threading.Condition()
+
+    def publish(self, snapshot: FrameSnapshot) -> None:
+        """
+        Записывает снимок в задний буфер и меняет буферы местами
+        :param snapshot: Готовый снимок кадра
+        """
+        with self._condition:
+            back = 1 - self._front
+            self._slots[back] = snapshot
+            self._front = back
+            self._condition.notify_all()
+
+    def latest(self) -> Optional[FrameSnapshot]:
+        """Последний опубликованный снимок"""
+        with self._condition:
+            return self._slots[self._front]
+
+    def wait_newer(self,
+                   frame: int,
+                   timeout: Optional[float] = None
+                   ) -> Optional[FrameSnapshot]:
+        """
+        Ждет снимок новее заданного кадра
+        :param frame: Номер последнего отрисованного кадра
+        :param timeout: Максимальное время ожидания в секундах
+        :return: Последний снимок (может быть не новее при таймауте)
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (self._slots[self._front] is not None and
+                         self._slots[self._front].frame > frame),
+                timeout
+            )
+            return self._slots[self._front]
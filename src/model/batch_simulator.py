@@ -0,0 +1,429 @@
+import random
+import numpy as np
+from typing import List, Sequence
+from src.model.platform import Platform
+from src.model.platform_generator import PlatformGenerator
+from src.controller.action import Action
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    PLAYER_INITIAL_X, PLAYER_INITIAL_Y, PLAYER_HEIGHT,
+    PLAYER_SPEED, PLAYER_JUMP_POWER, PLAYER_GRAVITY,
+    PLAYER_HITBOX_WIDTH, PLAYER_HITBOX_HEIGHT,
+    PLAYER_HITBOX_OFFSET_X, PLAYER_HITBOX_OFFSET_Y,
+    PLATFORM_HITBOX_HEIGHT, PLATFORM_HITBOX_OFFSET,
+    INITIAL_PLATFORMS, VISIBLE_PLATFORM_RANGE, WORLD_OFFSET_MARGIN,
+    MOUSE_WIDTH, MOUSE_HEIGHT, MOUSE_SCORE,
+    MOUSE_SPAWN_INTERVAL, MOUSE_SPAWN_MARGIN, MOUSE_SPAWN_OFFSET_Y,
+    MOUSE_REMOVE_OFFSET, MOUSE_ANIMATION_SPEED,
+    MOUSE_ANIMATION_AMPLITUDE, MOUSE_ANIMATION_FRAME_DIVISOR
+)
+
+# Хитбокс игрока по X не меняется: игрок всегда в одной экранной точке
+_PLAYER_HITBOX_X = int(PLAYER_INITIAL_X + PLAYER_HITBOX_OFFSET_X)
+
+
+class BatchSimulator:
+    """
+    N независимых игр, состояние которых хранится в массивах NumPy.
+    Шаг повторяет GameController.step для каждой игры: физика,
+    коллизии и сбор мышей векторизованы по играм, а куски платформ
+    строит PlatformGenerator с зерном игры, и появление мышей (редкие
+    события) берет числа из собственного random.Random каждой игры в
+    том же порядке, что и World
+    """
+
+    def __init__(self,
+                 seeds: Sequence[int],
+                 platform_capacity: int = 16,
+                 mouse_capacity: int = 16):
+        """
+        :param seeds: Зерно случайных чисел для каждой игры
+        :param platform_capacity: Начальная емкость кольцевого буфера платформ
+        :param mouse_capacity: Начальное количество слотов мышей
+        """
+        if not seeds:
+            raise ValueError("At least one seed is required")
+
+        n = len(seeds)
+        self._size = n
+        self._rows = np.arange(n)
+        self._rngs = [random.Random(seed) for seed in seeds]
+        self._generators = [PlatformGenerator(seed) for seed in seeds]
+
+        # Игрок
+        self.player_y = np.full(n, float(PLAYER_INITIAL_Y))
+        self.vel_y = np.zeros(n)
+        self.world_x = np.zeros(n)
+        self.is_jumping = np.zeros(n, dtype=bool)
+
+        # Мир и счет
+        self.world_offset = np.zeros(n)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.collected_mice = np.zeros(n, dtype=np.int64)
+        self._last_collected = np.zeros(n, dtype=np.int64)
+        self._spawn_timer = np.zeros(n, dtype=np.int64)
+        self.frame = 0
+
+        # Платформы: кольцевые буферы, упорядоченные по X
+        self.platform_x = np.zeros((n, platform_capacity))
+        self.platform_y = np.zeros((n, platform_capacity))
+        self.platform_width = np.zeros((n, platform_capacity))
+        self._platform_head = np.zeros(n, dtype=np.int64)
+        self.platform_count = np.zeros(n, dtype=np.int64)
+
+        # Мыши: слоты с флагом занятости
+        self.mouse_x = np.zeros((n, mouse_capacity))
+        self.mouse_y = np.zeros((n, mouse_capacity))
+        self._mouse_animation = np.zeros((n, mouse_capacity))
+        self.mouse_active = np.zeros((n, mouse_capacity), dtype=bool)
+        self.mouse_collected = np.zeros((n, mouse_capacity), dtype=bool)
+        self._mouse_order = np.zeros((n, mouse_capacity), dtype=np.int64)
+        self._spawned_mice = 0
+
+        for game in range(n):
+            for platform in self._generators[game].generate_chunk(0):
+                self._append_platform(game, platform)
+
+    # Свойства
+
+    @property
+    def size(self) -> int:
+        """Количество игр"""
+        return self._size
+
+    def get_platforms(self, game: int) -> List[tuple]:
+        """Платформы игры (x, y, width) в порядке генерации"""
+        capacity = self.platform_x.shape[1]
+        head = self._platform_head[game]
+        return [
+            (self.platform_x[game, (head + k) % capacity],
+             self.platform_y[game, (head + k) % capacity],
+             self.platform_width[game, (head + k) % capacity])
+            for k in range(self.platform_count[game])
+        ]
+
+    def get_mice(self, game: int) -> List[tuple]:
+        """Активные мыши игры (x, y, collected), отсортированные по X"""
+        slots = np.nonzero(self.mouse_active[game])[0]
+        return sorted(
+            (self.mouse_x[game, s], self.mouse_y[game, s],
+             bool(self.mouse_collected[game, s]))
+            for s in slots
+        )
+
+    # Шаг симуляции
+
+    def step(self, actions) -> None:
+        """
+        Один шаг всех игр
+        :param actions: Действие (Action) для каждой игры или одно на всех
+        """
+        actions = np.broadcast_to(np.asarray(actions, dtype=np.int64),
+                                  (self._size,))
+
+        # Прыжок (GameController.on_jump)
+        jump = ((actions & Action.JUMP) != 0) & ~self.is_jumping
+        self.vel_y[jump] = -float(PLAYER_JUMP_POWER)
+        self.is_jumping |= jump
+
+        # Движение (movement_from_action)
+        right = (actions & Action.RIGHT) != 0
+        left = ((actions & Action.LEFT) != 0) & (self.world_offset > 0)
+        movement = np.where(right, float(PLAYER_SPEED),
+                            np.where(left, -float(PLAYER_SPEED), 0.0))
+
+        # World.update
+        self.world_offset += movement
+        self._remove_offscreen_platforms()
+        self._generate_ahead_platforms()
+        visible = self._visible_platform_mask()
+        self._update_mice(visible)
+
+        # Player.update
+        self.world_x += movement
+        self.vel_y += PLAYER_GRAVITY
+        self.player_y += self.vel_y
+        on_ground = self._resolve_platform_collisions(visible)
+        fall_out = ((self.player_y > SCREEN_HEIGHT - PLAYER_HEIGHT) &
+                    ~on_ground)
+        self.player_y[fall_out] = float(SCREEN_HEIGHT - PLAYER_HEIGHT)
+        self.vel_y[fall_out] = 0.0
+        self.is_jumping[fall_out] = False
+
+        # World.check_player_collisions и начисление очков
+        self._resolve_platform_collisions(visible)
+        self._collect_mice()
+        scored = self.collected_mice > self._last_collected
+        self.score[scored] += MOUSE_SCORE
+        self._last_collected[scored] = self.collected_mice[scored]
+
+        self.frame += 1
+
+    # Платформы
+
+    def _logical_slots(self, k: int) -> np.ndarray:
+        """Физический индекс k-й по порядку платформы каждой игры"""
+        return (self._platform_head + k) % self.platform_x.shape[1]
+
+    def _append_platform(self, game: int, platform: Platform) -> None:
+        """Добавляет платформу в конец кольцевого буфера игры"""
+        capacity = self.platform_x.shape[1]
+        if self.platform_count[game] == capacity:
+            self._grow_platforms()
+            capacity = self.platform_x.shape[1]
+
+        slot = (self._platform_head[game] + self.platform_count[game]) % (
+            capacity
+        )
+        self.platform_x[game, slot] = platform.x
+        self.platform_y[game, slot] = platform.y
+        self.platform_width[game, slot] = platform.width
+        self.platform_count[game] += 1
+
+    def _grow_platforms(self) -> None:
+        """Удваивает емкость буферов, выстраивая платформы с нуля"""
+        capacity = self.platform_x.shape[1]
+        order = (self._platform_head[:, None] +
+                 np.arange(capacity)[None, :]) % capacity
+        for name in ("platform_x", "platform_y", "platform_width"):
+            old = getattr(self, name)
+            grown = np.zeros((self._size, capacity * 2))
+            grown[:, :capacity] = np.take_along_axis(old, order, axis=1)
+            setattr(self, name, grown)
+        self._platform_head[:] = 0
+
+    def _last_platform_end(self) -> np.ndarray:
+        """Правый край последней платформы каждой игры"""
+        last = self._logical_slots(0) + self.platform_count - 1
+        last %= self.platform_x.shape[1]
+        return (self.platform_x[self._rows, last] +
+                self.platform_width[self._rows, last])
+
+    def _remove_offscreen_platforms(self) -> None:
+        """
+        Удаляет платформы за левой границей.
+        Правые края платформ возрастают, поэтому удаляется только начало
+        """
+        limit = self.world_offset - WORLD_OFFSET_MARGIN
+        while True:
+            head = self._platform_head
+            remove = (self.platform_count > 0) & (
+                self.platform_x[self._rows, head] +
+                self.platform_width[self._rows, head] < limit
+            )
+            if not remove.any():
+                return
+            self._platform_head[remove] = (
+                (head[remove] + 1) % self.platform_x.shape[1]
+            )
+            self.platform_count[remove] -= 1
+
+    def _needs_platforms(self) -> np.ndarray:
+        """Маска игр, которым нужны новые платформы"""
+        return (
+            (self.platform_count < INITIAL_PLATFORMS) |
+            (self._last_platform_end() <
+             self.world_offset + SCREEN_WIDTH + VISIBLE_PLATFORM_RANGE)
+        )
+
+    def _generate_ahead_platforms(self) -> None:
+        """Генерация кусков впереди (только для игр, где она нужна)"""
+        for game in np.nonzero(self._needs_platforms())[0]:
+            generator = self._generators[game]
+            while self._game_needs_platforms(game):
+                index = 0
+                if self.platform_count[game] > 0:
+                    capacity = self.platform_x.shape[1]
+                    last = (self._platform_head[game] +
+                            self.platform_count[game] - 1) % capacity
+                    index = generator.chunk_index(
+                        self.platform_x[game, last]) + 1
+                for platform in generator.generate_chunk(index):
+                    self._append_platform(game, platform)
+
+    def _game_needs_platforms(self, game: int) -> bool:
+        """Скалярный вариант _needs_platforms для одной игры"""
+        count = self.platform_count[game]
+        if count < INITIAL_PLATFORMS:
+            return True
+        last = (self._platform_head[game] + count - 1) % (
+            self.platform_x.shape[1]
+        )
+        end = self.platform_x[game, last] + self.platform_width[game, last]
+        return bool(end < self.world_offset[game] + SCREEN_WIDTH +
+                    VISIBLE_PLATFORM_RANGE)
+
+    def _visible_platform_mask(self) -> np.ndarray:
+        """Маска (игра, k-я платформа) платформ в зоне видимости"""
+        capacity = self.platform_x.shape[1]
+        order = (self._platform_head[:, None] +
+                 np.arange(capacity)[None, :]) % capacity
+        screen_x = (np.take_along_axis(self.platform_x, order, axis=1) -
+                    self.world_offset[:, None])
+        valid = np.arange(capacity)[None, :] < self.platform_count[:, None]
+        return (valid &
+                (-VISIBLE_PLATFORM_RANGE < screen_x) &
+                (screen_x < SCREEN_WIDTH + VISIBLE_PLATFORM_RANGE))
+
+    def _resolve_platform_collisions(self, visible: np.ndarray) -> np.ndarray:
+        """
+        Player.update / World.check_player_collisions по видимым
+        платформам в порядке генерации
+        :return: Маска игр, приземлившихся на платформу
+        """
+        on_ground = np.zeros(self._size, dtype=bool)
+
+        for k in np.nonzero(visible.any(axis=0))[0]:
+            slots = self._logical_slots(k)
+            # pygame.Rect отбрасывает дробную часть координат
+            on_ground |= self._resolve_collision(
+                visible[:, k],
+                np.trunc(self.platform_x[self._rows, slots] - self.world_x),
+                np.trunc(self.platform_y[self._rows, slots] +
+                         PLATFORM_HITBOX_OFFSET),
+                np.trunc(self.platform_width[self._rows, slots]),
+                PLATFORM_HITBOX_HEIGHT
+            )
+
+        return on_ground
+
+    def _resolve_collision(self, candidates: np.ndarray,
+                           left: np.ndarray, top: np.ndarray,
+                           width, height) -> np.ndarray:
+        """
+        Player._resolve_platform_collision для всех игр сразу
+        :param candidates: Игры, для которых проверяется этот хитбокс
+        :param left: Левый край хитбокса (экранные координаты)
+        :param top: Верхний край хитбокса
+        :param width: Ширина хитбокса
+        :param height: Высота хитбокса
+        :return: Маска игр, приземлившихся на хитбокс
+        """
+        hitbox_top = np.trunc(self.player_y + PLAYER_HITBOX_OFFSET_Y)
+        bottom = top + height
+
+        collide = (candidates &
+                   (_PLAYER_HITBOX_X < left + width) &
+                   (left < _PLAYER_HITBOX_X + PLAYER_HITBOX_WIDTH) &
+                   (hitbox_top < bottom) &
+                   (top < hitbox_top + PLAYER_HITBOX_HEIGHT))
+
+        land = (collide & (self.vel_y > 0) &
+                (hitbox_top + PLAYER_HITBOX_HEIGHT > top))
+        bump = collide & (self.vel_y < 0) & (hitbox_top < bottom)
+
+        self.player_y = np.where(
+            land, top - (PLAYER_HITBOX_OFFSET_Y + PLAYER_HITBOX_HEIGHT),
+            self.player_y
+        )
+        self.player_y = np.where(bump, bottom - PLAYER_HITBOX_OFFSET_Y,
+                                 self.player_y)
+        self.vel_y[land | bump] = 0.0
+        self.is_jumping[land] = False
+        return land
+
+    # Мыши
+
+    def _update_mice(self, visible: np.ndarray) -> None:
+        """MouseManager.update для всех игр"""
+        # Анимация покачивания
+        animated = self.mouse_active & ~self.mouse_collected
+        self._mouse_animation[animated] += MOUSE_ANIMATION_SPEED
+        up = (np.trunc(self._mouse_animation).astype(np.int64) %
+              MOUSE_ANIMATION_FRAME_DIVISOR == 0)
+        self.mouse_y[animated & up] += MOUSE_ANIMATION_AMPLITUDE
+        self.mouse_y[animated & ~up] -= MOUSE_ANIMATION_AMPLITUDE
+
+        # Собранные мыши уходят и засчитываются
+        collected = self.mouse_active & self.mouse_collected
+        self.collected_mice += collected.sum(axis=1)
+        self.mouse_active &= ~collected
+
+        # Мыши за левой границей
+        self.mouse_active &= ~(
+            self.mouse_x - self.world_offset[:, None] < -MOUSE_REMOVE_OFFSET
+        )
+
+        # Появление новых мышей
+        self._spawn_timer += 1
+        spawning = self._spawn_timer >= MOUSE_SPAWN_INTERVAL
+        for game in np.nonzero(spawning)[0]:
+            self._spawn_mouse(game, visible[game])
+        self._spawn_timer[spawning] = 0
+
+    def _spawn_mouse(self, game: int, visible: np.ndarray) -> None:
+        """MouseManager._spawn_mouse для одной игры"""
+        candidates = np.nonzero(visible)[0]
+        if not len(candidates):
+            return
+
+        rng = self._rngs[game]
+        slot = (self._platform_head[game] +
+                candidates[rng.choice(range(len(candidates)))]) % (
+            self.platform_x.shape[1]
+        )
+        width = self.platform_width[game, slot]
+        x = self.platform_x[game, slot] + rng.randint(
+            MOUSE_SPAWN_MARGIN, int(width) - MOUSE_SPAWN_MARGIN
+        )
+        y = self.platform_y[game, slot] + MOUSE_SPAWN_OFFSET_Y
+
+        offset = self.world_offset[game]
+        if not offset < x < offset + SCREEN_WIDTH:
+            return
+
+        free = np.nonzero(~self.mouse_active[game])[0]
+        if not len(free):
+            self._grow_mice()
+            free = np.nonzero(~self.mouse_active[game])[0]
+
+        slot = free[0]
+        self.mouse_x[game, slot] = float(x)
+        self.mouse_y[game, slot] = float(y)
+        self._mouse_animation[game, slot] = 0.0
+        self.mouse_collected[game, slot] = False
+        self.mouse_active[game, slot] = True
+        self._mouse_order[game, slot] = self._spawned_mice
+        self._spawned_mice += 1
+
+    def _grow_mice(self) -> None:
+        """Удваивает количество слотов мышей"""
+        capacity = self.mouse_x.shape[1]
+        for name in ("mouse_x", "mouse_y", "_mouse_animation",
+                     "mouse_active", "mouse_collected", "_mouse_order"):
+            old = getattr(self, name)
+            grown = np.zeros((self._size, capacity * 2), dtype=old.dtype)
+            grown[:, :capacity] = old
+            setattr(self, name, grown)
+
+    def _collect_mice(self) -> None:
+        """
+        MouseManager.check_collisions: мыши проверяются в порядке появления,
+        и каждая собранная мышь, как в Player.handle_collision,
+        отталкивает игрока своим хитбоксом
+        """
+        order = np.argsort(
+            np.where(self.mouse_active, self._mouse_order, np.iinfo(
+                np.int64).max),
+            axis=1, kind="stable"
+        )
+        for rank in range(int(self.mouse_active.sum(axis=1).max(initial=0))):
+            slots = order[:, rank]
+            mouse_x = self.mouse_x[self._rows, slots]
+            mouse_y = self.mouse_y[self._rows, slots]
+            left = np.trunc(mouse_x)
+            top = np.trunc(mouse_y)
+            hitbox_top = np.trunc(self.player_y + PLAYER_HITBOX_OFFSET_Y)
+
+            # Хитбокс мыши в мировых координатах, игрока - в экранных
+            hit = (self.mouse_active[self._rows, slots] &
+                   ~self.mouse_collected[self._rows, slots] &
+                   (left < _PLAYER_HITBOX_X + PLAYER_HITBOX_WIDTH) &
+                   (_PLAYER_HITBOX_X < left + MOUSE_WIDTH) &
+                   (top < hitbox_top + PLAYER_HITBOX_HEIGHT) &
+                   (hitbox_top < top + MOUSE_HEIGHT))
+            self.mouse_collected[self._rows[hit], slots[hit]] = True
+
+            self._resolve_collision(hit,
+                                    np.trunc(mouse_x - self.world_x),
+                                    top, MOUSE_WIDTH, MOUSE_HEIGHT)
@@ -0,0 +1,184 @@
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+from src.model.platform import Platform
+from src.model.platform_generator import PlatformGenerator
+from constants import WORLD_CHUNK_PREFETCH
+
+
+class _PrefetchQueue:
+    """
+    Общее состояние владельца и фонового потока. Поток держит ссылку
+    только на него, поэтому ChunkPrefetcher собирается сборщиком мусора
+    и останавливает поток из __del__
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.pending: Deque[int] = deque()
+        self.ready: Dict[int, List[Platform]] = {}
+        # Номера кусков, которые еще нужны владельцу: (от, до]
+        self.window = (0, 0)
+        # Кусок, который поток генерирует сейчас
+        self.in_progress = -1
+        self.closed = False
+
+
+def _prefetch_worker(generator: PlatformGenerator,
+                     queue: _PrefetchQueue) -> None:
+    """Генерирует запрошенные куски, пока очередь не закрыта"""
+    condition = queue.condition
+    while True:
+        with condition:
+            while not queue.pending and not queue.closed:
+                condition.wait()
+            if queue.closed:
+                return
+            index = queue.pending.popleft()
+            queue.in_progress = index
+
+        chunk = generator.generate_chunk(index)
+
+        with condition:
+            queue.in_progress = -1
+            low, high = queue.window
+            if low < index <= high:
+                queue.ready[index] = chunk
+
+
+class ChunkPrefetcher:
+    """
+    Выдает куски мира и заранее готовит следующие за запрошенным.
+    В фоновом режиме куски index + 1 .. index + depth генерирует
+    отдельный поток в ограниченную очередь, и World забирает готовый
+    кусок без генерации в кадре. Если кусок не успел, он строится сразу
+    (промах) - результат одинаков, потому что кусок зависит только от
+    зерна и номера
+    """
+
+    def __init__(self, generator: PlatformGenerator,
+                 depth: int = WORLD_CHUNK_PREFETCH,
+                 background: bool = True):
+        """
+        :param generator: Генератор кусков
+        :param depth: Сколько кусков впереди готовить
+        :param background: Готовить куски в фоновом потоке
+                           (False - каждый кусок строится по запросу)
+        """
+        if depth < 1:
+            raise ValueError("Prefetch depth must be positive")
+        self._generator = generator
+        self._depth = depth
+        self._background = background
+        self._queue = _PrefetchQueue()
+        self._thread = None
+
+        # Статистика
+        self._hits = 0
+        self._misses = 0
+        self._inline_time = 0.0
+        self._max_inline_time = 0.0
+
+    def __del__(self) -> None:
+        self.close()
+
+    # Свойства
+
+    @property
+    def generator(self) -> PlatformGenerator:
+        """Генератор кусков (только чтение)"""
+        return self._generator
+
+    @property
+    def background(self) -> bool:
+        """Работает ли фоновая генерация (только чтение)"""
+        return self._background
+
+    # Публичные методы
+
+    def get_chunk(self, index: int) -> List[Platform]:
+        """
+        Платформы куска: готовые из очереди или построенные сразу.
+        Запрашивает фоновую генерацию следующих кусков
+        :param index: Номер куска
+        :return: Платформы куска по возрастанию X
+        """
+        chunk = None
+        if self._background:
+            chunk = self._request_after(index)
+
+        if chunk is not None:
+            self._hits += 1
+            return chunk
+
+        self._misses += 1
+        started = time.perf_counter()
+        chunk = self._generator.generate_chunk(index)
+        elapsed = time.perf_counter() - started
+        self._inline_time += elapsed
+        self._max_inline_time = max(self._max_inline_time, elapsed)
+        return chunk
+
+    def close(self) -> None:
+        """Останавливает фоновый поток (куски дальше строятся по запросу)"""
+        queue = getattr(self, "_queue", None)
+        if queue is None:
+            return
+        with queue.condition:
+            queue.closed = True
+            queue.pending.clear()
+            queue.ready.clear()
+            queue.condition.notify_all()
+        self._background = False
+
+    def get_stats(self) -> Dict[str, float]:
+        """Статистика выдачи кусков"""
+        requests = self._hits + self._misses
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / requests if requests else 0.0,
+            'inline_time': self._inline_time,
+            'max_inline_time': self._max_inline_time,
+        }
+
+    def reset_stats(self) -> None:
+        """Обнуляет статистику"""
+        self._hits = 0
+        self._misses = 0
+        self._inline_time = 0.0
+        self._max_inline_time = 0.0
+
+    # Приватные методы
+
+    def _request_after(self, index: int) -> Optional[List[Platform]]:
+        """
+        Забирает кусок index, если он готов, и ставит в очередь
+        следующие depth кусков вместо устаревших
+        :return: Платформы куска или None
+        """
+        queue = self._queue
+        high = index + self._depth
+        with queue.condition:
+            chunk = queue.ready.pop(index, None)
+            queue.window = (index, high)
+            for stale in [ready for ready in queue.ready
+                          if not index < ready <= high]:
+                del queue.ready[stale]
+            queue.pending.clear()
+            queue.pending.extend(ahead for ahead in range(index + 1, high + 1)
+                                 if ahead not in queue.ready and
+                                 ahead != queue.in_progress)
+            if queue.pending:
+                queue.condition.notify()
+
+        if self._thread is None:
+            # Поток запускается при первом запросе
+            self._thread = threading.Thread(
+                target=_prefetch_worker,
+                args=(self._generator, queue),
+                name="chunk-prefetch", daemon=True,
+            )
+            self._thread.start()
+        return chunk
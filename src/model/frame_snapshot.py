@@ -0,0 +1,182 @@
+import pygame
+from typing import NamedTuple, Tuple, TYPE_CHECKING
+from constants import PLATFORM_HITBOX_HEIGHT, PLATFORM_HITBOX_OFFSET
+
+if TYPE_CHECKING:
+    from src.model.game_state import GameState
+    from src.model.player import Player
+    from src.model.world import World
+    from src.model.platform import Platform
+    from src.model.mouse import Mouse
+
+
+class PlayerSnapshot(NamedTuple):
+    """Неизменяемый снимок игрока для отрисовки"""
+    x: float
+    y: float
+    world_x: float
+    vel_y: float
+    is_jumping: bool
+    facing_right: bool
+    hitbox: pygame.Rect  # Копия, не изменять
+
+    @classmethod
+    def capture(cls, player: 'Player') -> 'PlayerSnapshot':
+        return cls(player.x, player.y, player.world_x, player.vel_y,
+                   player.is_jumping, player.facing_right,
+                   pygame.Rect(player.hitbox))
+
+    def lerp(self, previous: 'PlayerSnapshot',
+             alpha: float) -> 'PlayerSnapshot':
+        """Положение между предыдущим и этим снимком"""
+        x = _lerp(previous.x, self.x, alpha)
+        y = _lerp(previous.y, self.y, alpha)
+        hitbox = self.hitbox.move(round(x - self.x), round(y - self.y))
+        return self._replace(x=x, y=y,
+                             world_x=_lerp(previous.world_x, self.world_x,
+                                           alpha),
+                             hitbox=hitbox)
+
+
+class PlatformSnapshot(NamedTuple):
+    """Неизменяемый снимок платформы для отрисовки"""
+    x: float
+    y: float
+    width: float
+    height: float
+
+    @classmethod
+    def capture(cls, platform: 'Platform') -> 'PlatformSnapshot':
+        return cls(platform.x, platform.y, platform.width, platform.height)
+
+    def get_hitbox(self, world_offset: float = 0) -> pygame.Rect:
+        """Хитбокс с учетом смещения камеры (как у Platform)"""
+        return pygame.Rect(self.x - world_offset,
+                           self.y + PLATFORM_HITBOX_OFFSET,
+                           self.width, PLATFORM_HITBOX_HEIGHT)
+
+
+class MouseSnapshot(NamedTuple):
+    """Неизменяемый снимок мыши для отрисовки"""
+    x: float
+    y: float
+    width: float
+    height: float
+    collected: bool
+
+    @classmethod
+    def capture(cls, mouse: 'Mouse') -> 'MouseSnapshot':
+        return cls(mouse.x, mouse.y, mouse.width, mouse.height,
+                   mouse.collected)
+
+    def lerp(self, previous: 'MouseSnapshot',
+             alpha: float) -> 'MouseSnapshot':
+        """Положение между предыдущим и этим снимком"""
+        return self._replace(y=_lerp(previous.y, self.y, alpha))
+
+    def get_hitbox(self, world_offset: float = 0) -> pygame.Rect:
+        """Хитбокс с учетом смещения камеры"""
+        return pygame.Rect(self.x - world_offset, self.y,
+                           self.width, self.height)
+
+
+class WorldSnapshot(NamedTuple):
+    """Неизменяемый снимок видимой части мира"""
+    world_offset: float
+    platform_count: int
+    active_mice_count: int
+    collected_mice_count: int
+    visible_platforms: Tuple[PlatformSnapshot, ...]
+    visible_mice: Tuple[MouseSnapshot, ...]
+
+    @classmethod
+    def capture(cls, world: 'World') -> 'WorldSnapshot':
+        return cls(
+            world.world_offset,
+            world.platform_count,
+            world.active_mice_count,
+            world.collected_mice_count,
+            tuple(map(PlatformSnapshot._make,
+                      world.get_visible_platform_bounds())),
+            tuple(MouseSnapshot.capture(mouse)
+                  for mouse in world.get_visible_mice()),
+        )
+
+    def lerp(self, previous: 'WorldSnapshot',
+             alpha: float) -> 'WorldSnapshot':
+        """Камера и мыши между предыдущим и этим снимком"""
+        # Мыши не двигаются по X, поэтому сопоставляются по координате
+        previous_mice = {mouse.x: mouse for mouse in previous.visible_mice}
+        mice = tuple(
+            mouse.lerp(previous_mice[mouse.x], alpha)
+            if mouse.x in previous_mice else mouse
+            for mouse in self.visible_mice
+        )
+        return self._replace(
+            world_offset=_lerp(previous.world_offset, self.world_offset,
+                               alpha),
+            visible_mice=mice
+        )
+
+    # Тот же интерфейс чтения, что и у World
+
+    def get_visible_platforms(self) -> Tuple[PlatformSnapshot, ...]:
+        return self.visible_platforms
+
+    def get_visible_mice(self) -> Tuple[MouseSnapshot, ...]:
+        return self.visible_mice
+
+
+class GameStateSnapshot(NamedTuple):
+    """Неизменяемый снимок состояния игры"""
+    running: bool
+    show_hitboxes: bool
+    score: int
+
+    @classmethod
+    def capture(cls, game_state: 'GameState') -> 'GameStateSnapshot':
+        return cls(game_state.running, game_state.show_hitboxes,
+                   game_state.score)
+
+
+class FrameSnapshot(NamedTuple):
+    """Все, что нужно для отрисовки одного кадра"""
+    frame: int
+    game_state: GameStateSnapshot
+    player: PlayerSnapshot
+    world: WorldSnapshot
+
+    @classmethod
+    def capture(cls,
+                frame: int,
+                game_state: 'GameState',
+                player: 'Player',
+                world: 'World') -> 'FrameSnapshot':
+        """
+        Снимает неизменяемую копию состояния кадра
+        :param frame: Номер кадра симуляции
+        :param game_state: Состояние игры
+        :param player: Игрок
+        :param world: Мир
+        :return: Снимок кадра
+        """
+        return cls(frame,
+                   GameStateSnapshot.capture(game_state),
+                   PlayerSnapshot.capture(player),
+                   WorldSnapshot.capture(world))
+
+    def lerp(self, previous: 'FrameSnapshot',
+             alpha: float) -> 'FrameSnapshot':
+        """
+        Интерполирует игрока, камеру и мышей между двумя шагами симуляции
+        :param previous: Снимок предыдущего шага
+        :param alpha: Доля пути от previous к этому снимку (0..1)
+        :return: Снимок для отрисовки
+        """
+        return self._replace(player=self.player.lerp(previous.player, alpha),
+                             world=self.world.lerp(previous.world, alpha))
+
+
+def _lerp(start: float, end: float, alpha: float) -> float:
+    """Линейная интерполяция"""
+    return start + (end - start) * alpha
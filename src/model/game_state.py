@@ -1,4 +1,9 @@
+from typing import Tuple
+
+
 class GameState:
+    __slots__ = ("_running", "_show_hitboxes", "_score", "_world_offset")
+
     def __init__(self):
         self._running = True
         self._show_hitboxes = False
@@ -80,6 +85,19 @@ class GameState:
             raise ValueError("Delta must be a number")
         self._world_offset += float(delta)
 
+    def get_state(self) -> Tuple[bool, bool, int, float]:
+        """Состояние: работает, хитбоксы, счет, смещение мира"""
+        return (self._running, self._show_hitboxes, self._score,
+                self._world_offset)
+
+    def set_state(self, running: bool, show_hitboxes: bool, score: int,
+                  world_offset: float) -> None:
+        """Восстанавливает состояние get_state"""
+        self._running = running
+        self._show_hitboxes = show_hitboxes
+        self._score = score
+        self._world_offset = world_offset
+
     def reset(self) -> None:
         """Сброс состояния игры к начальным значениям"""
         self._running = True
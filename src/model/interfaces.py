@@ -6,6 +6,8 @@ from typing import Tuple
 class IGameObject(ABC):
     """Интерфейс для всех игровых объектов"""
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, *args, **kwargs) -> None:
         """Обновление состояния объекта"""
@@ -25,6 +27,8 @@ class IGameObject(ABC):
 class ICollidable(ABC):
     """Интерфейс для объектов с коллизиями"""
 
+    __slots__ = ()
+
     @abstractmethod
     def check_collision(self, other) -> bool:
         """Проверка коллизии с другим объектом"""
@@ -9,6 +9,11 @@ from constants import (
 
 
 class Mouse(IGameObject, ICollidable):
+    __slots__ = (
+        "_x", "_y", "_width", "_height", "_collected", "_animation_frame",
+        "_animation_speed", "_hitbox",
+    )
+
     def __init__(self, x: float, y: float):
         """
         Инициализация мыши - собираемого предмета
@@ -50,17 +55,26 @@ class Mouse(IGameObject, ICollidable):
     def hitbox(self) -> pygame.Rect:
         return self._hitbox
 
+    @property
+    def world_hitbox(self) -> pygame.Rect:
+        """Хитбокс в мировых координатах (только чтение)"""
+        return self._hitbox
+
     # Реализция интерфейса IGameObject
 
-    def update(self, *args, **kwargs) -> None:
-        """Обновление анимации мыши"""
+    def update(self, dt: float = 1, *args, **kwargs) -> None:
+        """
+        Обновление анимации мыши
+        :param dt: Длина шага в кадрах 60 Гц
+        """
         if not self._collected:
             # Простая анимация - покачивание вверх-вниз
-            self._animation_frame += self._animation_speed  # type: ignore
+            self._animation_frame += (self._animation_speed *  # type: ignore
+                                      dt)
             if int(self._animation_frame) % MOUSE_ANIMATION_FRAME_DIVISOR == 0:
-                self._y += MOUSE_ANIMATION_AMPLITUDE
+                self._y += MOUSE_ANIMATION_AMPLITUDE * dt
             else:
-                self._y -= MOUSE_ANIMATION_AMPLITUDE
+                self._y -= MOUSE_ANIMATION_AMPLITUDE * dt
             self._update_hitbox()
 
     def get_position(self) -> Tuple[float, float]:
@@ -100,7 +114,8 @@ class Mouse(IGameObject, ICollidable):
     # Приватные методы
 
     def _update_hitbox(self) -> None:
-        self._hitbox = pygame.Rect(self._x, self._y, self._width, self._height)
+        # Прямоугольник изменяется на месте, без создания нового
+        self._hitbox.update(self._x, self._y, self._width, self._height)
 
     # Публичные методы
 
@@ -108,9 +123,23 @@ class Mouse(IGameObject, ICollidable):
         """Помечает мышь как собранную"""
         self._collected = True
 
+    def get_state(self) -> Tuple[float, float, float, bool]:
+        """Состояние: x, y, кадр анимации, собрана"""
+        return self._x, self._y, self._animation_frame, self._collected
+
+    def set_state(self, x: float, y: float, animation_frame: float,
+                  collected: bool) -> None:
+        """Восстанавливает состояние get_state"""
+        self._x = x
+        self._y = y
+        self._animation_frame = animation_frame
+        self._collected = collected
+        self._update_hitbox()
+
     def respawn(self, new_x: float, new_y: float) -> None:
-        """Перемещает мышь в новую позицию"""
-        self._x = new_x
-        self._y = new_y
+        """Перемещает мышь в новую позицию в начальном состоянии"""
+        self._x = float(new_x)
+        self._y = float(new_y)
         self._collected = False
+        self._animation_frame = 0
         self._update_hitbox()
@@ -1,6 +1,10 @@
 import random
-from typing import List
+from array import array
+from typing import List, Optional, Tuple
 from src.model.mouse import Mouse
+from src.model.mouse_pool import MousePool
+from src.model.spatial_hash import SpatialHash
+from src.model.state_buffer import MOUSE_FIELDS
 from constants import (
     SCREEN_WIDTH,
     MOUSE_SPAWN_OFFSET_Y,
@@ -13,40 +17,76 @@ from constants import (
 class MouseManager:
     """Управляет созданием, удалением и обновлением мышей"""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[random.Random] = None,
+                 pool: Optional[MousePool] = None) -> None:
+        """
+        :param rng: Источник случайных чисел (по умолчанию модуль random)
+        :param pool: Пул для переиспользования мышей
+        """
+        self._rng = rng if rng is not None else random
+        self._pool = pool if pool is not None else MousePool()
         self._mice: List[Mouse] = []
+        # Широкая фаза коллизий: мыши регистрируются по X хитбокса
+        self._index = SpatialHash()
         self._collected_count = 0
+        self._active_count = 0  # Несобранные мыши в self._mice
         self._spawn_timer = 0
         self._spawn_interval = MOUSE_SPAWN_INTERVAL
-
-    def update(self, world_offset: float, platforms: List) -> None:
-        """Обновляет состояние всех мышей"""
-        # Обновляем существующих мышей
-        for mouse in self._mice:
-            mouse.update()
-
-        # Удаляем собранные мыши
-        self._remove_collected_mice()
-
-        # Удаляем мыши за экраном
-        self._remove_offscreen_mice(world_offset)
+        # Видимые мыши для последнего запрошенного смещения мира
+        self._visible_cache: Optional[Tuple[float, List[Mouse]]] = None
+
+    def update(self, world_offset: float, platforms: List,
+               dt: float = 1) -> None:
+        """
+        Обновляет состояние всех мышей
+        :param world_offset: Смещение мира по X
+        :param platforms: Видимые платформы для появления мышей
+        :param dt: Длина шага в кадрах 60 Гц
+        """
+        # Анимация и удаление собранных и ушедших за экран - один проход
+        self._update_and_compact(world_offset, dt)
 
         # Спавним новые мыши
-        self._spawn_timer += 1
+        self._spawn_timer += dt
         if self._spawn_timer >= self._spawn_interval:
             self._spawn_mouse(world_offset, platforms)
             self._spawn_timer = 0
 
+        self._visible_cache = None
+
+    def _update_and_compact(self, world_offset: float, dt: float) -> None:
+        """
+        Обновляет мышей и оставляет в списке только живых:
+        собранные засчитываются, ушедшие за левую границу экрана
+        удаляются, все удаленные возвращаются в пул
+        """
+        alive = []
+
+        for mouse in self._mice:
+            if mouse.collected:
+                self._collected_count += 1
+            elif mouse.x - world_offset < -MOUSE_REMOVE_OFFSET:
+                pass
+            else:
+                mouse.update(dt)
+                alive.append(mouse)
+                continue
+            self._index.remove(mouse)
+            self._pool.release(mouse)
+
+        self._mice = alive
+        self._active_count = len(alive)
+
     def _spawn_mouse(self, world_offset: float, platforms: List) -> None:
         """Создает новую мышь на случайной платформе"""
         if not platforms:
             return
 
         # Выбираем случайную платформу
-        platform = random.choice(platforms)
+        platform = self._rng.choice(platforms)
 
         # Позиция на платформе (сверху)
-        x = platform.x + random.randint(
+        x = platform.x + self._rng.randint(
             MOUSE_SPAWN_MARGIN,
             int(platform.width) - MOUSE_SPAWN_MARGIN
         )
@@ -54,37 +94,25 @@ class MouseManager:
 
         # Проверяем, чтобы мышь была на экране
         if x > world_offset and x < world_offset + SCREEN_WIDTH:
-            new_mouse = Mouse(x, y)
+            new_mouse = self._pool.acquire(x, y)
             self._mice.append(new_mouse)
-
-    def _remove_collected_mice(self) -> None:
-        """Удаляет собранные мыши"""
-        mice_to_remove = [mouse for mouse in self._mice if mouse.collected]
-        for mouse in mice_to_remove:
-            self._mice.remove(mouse)
-            self._collected_count += 1
-
-    def _remove_offscreen_mice(self, world_offset: float) -> None:
-        """Удаляет мышей, которые ушли за левую границу экрана"""
-        mice_to_remove = []
-
-        for mouse in self._mice:
-            mouse_x, mouse_y = mouse.get_position()
-            screen_x = mouse_x - world_offset
-
-            if screen_x < -MOUSE_REMOVE_OFFSET:
-                mice_to_remove.append(mouse)
-
-        for mouse in mice_to_remove:
-            self._mice.remove(mouse)
+            self._index.insert(new_mouse, new_mouse.x,
+                               new_mouse.x + new_mouse.width)
+            self._active_count += 1
 
     def check_collisions(self, player) -> bool:
         """Проверяет коллизии игрока с мышами"""
         had_collision = False
 
-        for mouse in self._mice:
+        # Хитбокс мыши сравнивается с экранным хитбоксом игрока
+        # (Mouse.check_collision), поэтому запрос тоже по экранному X.
+        # Запас в 1 px покрывает отбрасывание дробной части в Rect
+        player_rect = player.get_rect()
+        for mouse in self._index.query(player_rect.left - 1,
+                                       player_rect.right + 1):
             if not mouse.collected and mouse.check_collision(player):
                 mouse.collect()
+                self._active_count -= 1
                 player.handle_collision(mouse)
                 had_collision = True
 
@@ -92,18 +120,70 @@ class MouseManager:
 
     def get_visible_mice(self, world_offset: float) -> List[Mouse]:
         """Возвращает мышей в зоне видимости"""
-        visible_mice = []
-
+        # GameView запрашивает видимых мышей несколько раз за кадр
+        if (self._visible_cache is None or
+                self._visible_cache[0] != world_offset):
+            visible_mice = [
+                mouse for mouse in self._mice
+                if (-MOUSE_REMOVE_OFFSET < mouse.x - world_offset <
+                    SCREEN_WIDTH + MOUSE_REMOVE_OFFSET)
+            ]
+            self._visible_cache = (world_offset, visible_mice)
+
+        return self._visible_cache[1].copy()
+
+    def get_state(self) -> Tuple[float, int, array]:
+        """
+        Плоское состояние: таймер появления, собранные мыши и массив 'd'
+        с x, y, кадром анимации и признаком сбора каждой мыши
+        """
+        values = array("d")
         for mouse in self._mice:
-            mouse_x, mouse_y = mouse.get_position()
-            screen_x = mouse_x - world_offset
-
-            if (-MOUSE_REMOVE_OFFSET <
-                screen_x <
-                    SCREEN_WIDTH + MOUSE_REMOVE_OFFSET):
-                visible_mice.append(mouse)
-
-        return visible_mice
+            values.extend(mouse.get_state())
+        return self._spawn_timer, self._collected_count, values
+
+    def set_state(self, spawn_timer: float, collected_count: int,
+                  values: array) -> None:
+        """
+        Восстанавливает состояние get_state. Текущие мыши
+        переиспользуются по порядку, недостающие берутся из пула, лишние
+        возвращаются в пул. Широкая фаза обходит мышей в порядке
+        регистрации, поэтому начиная с первой сдвинутой мыши все
+        следующие регистрируются заново
+        """
+        current = self._mice
+        count = len(values) // MOUSE_FIELDS
+        for mouse in current[count:]:
+            self._index.remove(mouse)
+            self._pool.release(mouse)
+
+        mice = current[:count]
+        reindex = False
+        for number in range(count):
+            index = number * MOUSE_FIELDS
+            x, y, animation_frame, collected = (
+                values[index:index + MOUSE_FIELDS]
+            )
+            if number < len(mice):
+                mouse = mice[number]
+                if reindex or mouse.x != x:
+                    reindex = True
+                    self._index.remove(mouse)
+                    mouse.set_state(x, y, animation_frame, bool(collected))
+                    self._index.insert(mouse, x, x + mouse.width)
+                else:
+                    mouse.set_state(x, y, animation_frame, bool(collected))
+            else:
+                mouse = self._pool.acquire(x, y)
+                mouse.set_state(x, y, animation_frame, bool(collected))
+                self._index.insert(mouse, x, x + mouse.width)
+                mice.append(mouse)
+
+        self._mice = mice
+        self._active_count = sum(not mouse.collected for mouse in mice)
+        self._spawn_timer = spawn_timer
+        self._collected_count = collected_count
+        self._visible_cache = None
 
     # Свойства
 
@@ -111,10 +191,20 @@ class MouseManager:
     def mice(self) -> List[Mouse]:
         return self._mice.copy()
 
+    @property
+    def index(self) -> SpatialHash:
+        """Широкая фаза коллизий мышей (только чтение)"""
+        return self._index
+
+    @property
+    def pool(self) -> MousePool:
+        """Пул мышей (только чтение)"""
+        return self._pool
+
     @property
     def collected_count(self) -> int:
         return self._collected_count
 
     @property
     def active_mice_count(self) -> int:
-        return len([mouse for mouse in self._mice if not mouse.collected])
+        return self._active_count
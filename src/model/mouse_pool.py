@@ -0,0 +1,96 @@
+from typing import Dict, List
+from src.model.mouse import Mouse
+from constants import MOUSE_POOL_SIZE
+
+
+class MousePool:
+    """
+    Ограниченный пул мышей: удаленные мыши возвращаются в пул и
+    переиспользуются через Mouse.respawn вместо создания новых
+    """
+
+    def __init__(self, max_size: int = MOUSE_POOL_SIZE):
+        """
+        :param max_size: Максимум свободных мышей в пуле
+                         (лишние отдаются сборщику мусора)
+        """
+        if max_size < 0:
+            raise ValueError("Pool size must not be negative")
+        self._max_size = max_size
+        self._free: List[Mouse] = []
+        self._in_use = 0
+        self._high_water = 0
+        self._reuses = 0
+        self._misses = 0
+        self._discarded = 0
+
+    # Свойства
+
+    @property
+    def size(self) -> int:
+        """Количество свободных мышей в пуле (только чтение)"""
+        return len(self._free)
+
+    @property
+    def max_size(self) -> int:
+        """Максимум свободных мышей в пуле (только чтение)"""
+        return self._max_size
+
+    @property
+    def in_use(self) -> int:
+        """Количество выданных мышей (только чтение)"""
+        return self._in_use
+
+    @property
+    def high_water(self) -> int:
+        """Наибольшее количество одновременно выданных мышей (только чтение)"""
+        return self._high_water
+
+    @property
+    def misses(self) -> int:
+        """Создания мышей при пустом пуле (только чтение)"""
+        return self._misses
+
+    # Публичные методы
+
+    def acquire(self, x: float, y: float) -> Mouse:
+        """
+        Выдает мышь в заданной позиции
+        :param x: Координата X
+        :param y: Координата Y
+        :return: Переиспользованная или новая мышь
+        """
+        if self._free:
+            mouse = self._free.pop()
+            mouse.respawn(x, y)
+            self._reuses += 1
+        else:
+            mouse = Mouse(x, y)
+            self._misses += 1
+
+        self._in_use += 1
+        self._high_water = max(self._high_water, self._in_use)
+        return mouse
+
+    def release(self, mouse: Mouse) -> None:
+        """
+        Возвращает мышь в пул
+        :param mouse: Мышь, больше не используемая менеджером
+        """
+        self._in_use -= 1
+        if len(self._free) < self._max_size:
+            self._free.append(mouse)
+        else:
+            self._discarded += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Статистика пула"""
+        return {
+            'size': len(self._free),
+            'max_size': self._max_size,
+            'in_use': self._in_use,
+            'high_water': self._high_water,
+            'reuses': self._reuses,
+            'misses': self._misses,
+            'discarded': self._discarded,
+        }
@@ -7,6 +7,11 @@ from typing import Tuple
 
 
 class Platform(IGameObject, ICollidable):
+    __slots__ = (
+        "_x", "_y", "_width", "_height", "_hitbox_height", "_hitbox_y_offset",
+        "_hitbox",
+    )
+
     def __init__(self, x: float, y: float, width: float):
         """
         Инициализация платформы с полной инкапсуляцией
@@ -20,6 +25,14 @@ class Platform(IGameObject, ICollidable):
         # Хитбокс (только верхняя часть платформы)
         self._hitbox_height = PLATFORM_HITBOX_HEIGHT
         self._hitbox_y_offset = PLATFORM_HITBOX_OFFSET
+        # Платформа неподвижна: хитбокс в мировых координатах считается
+        # один раз, смещение камеры учитывает сторона игрока
+        self._hitbox = pygame.Rect(
+            self._x,
+            self._y + self._hitbox_y_offset,
+            self._width,
+            self._hitbox_height,
+        )
 
     # Свойства контролируемого доступа
 
@@ -43,6 +56,11 @@ class Platform(IGameObject, ICollidable):
         """Высота платформы (только чтение)"""
         return self._height
 
+    @property
+    def world_hitbox(self) -> pygame.Rect:
+        """Хитбокс в мировых координатах (только чтение)"""
+        return self._hitbox
+
     # Реализация интерфейса IGameObject
 
     def update(self, *args, **kwargs) -> None:
@@ -70,8 +88,8 @@ class Platform(IGameObject, ICollidable):
         """ICollidable - проверка коллизии"""
         if hasattr(other, 'get_rect'):
             other_rect = other.get_rect()
-            platform_hitbox = self.get_hitbox(0)  # Без смещения для проверки
-            return platform_hitbox.colliderect(other_rect)
+            # Без смещения для проверки
+            return self._hitbox.colliderect(other_rect)
         return False
 
     def handle_collision(self, other) -> None:
@@ -1,6 +1,6 @@
 # src/model/platform_generator.py
 import random
-from typing import List
+from typing import List, Tuple
 from src.model.platform import Platform
 from constants import (
     PLATFORM_SPACING_MIN, PLATFORM_SPACING_MAX,
@@ -8,54 +8,270 @@ from constants import (
     PLATFORM_START_Y, PLATFORM_HEIGHT_VARIATION,
     PLATFORM_Y_RANGE_MIN, PLATFORM_Y_RANGE_MAX,
     START_PLATFORM_WIDTH, INITIAL_PLATFORMS,
-    PLATFORM_ALTERNATION_PATTERN, PLATFORM_ALTERNATION_MULTIPLIER
+    PLATFORM_ALTERNATION_PATTERN, PLATFORM_ALTERNATION_MULTIPLIER,
+    PLATFORM_WIDTH_QUANTUM, WORLD_CHUNK_WIDTH, WORLD_CHUNK_INDEX_BITS
 )
 
+# Попыток случайно выбрать ширину и промежуток, оставляющие
+# заполнимый остаток куска, до детерминированного выбора
+_FILL_ATTEMPTS = 16
+# Отступ от края куска - половина промежутка на стыке кусков
+_EDGE_GAP_MIN = (PLATFORM_SPACING_MIN + 1) // 2
+_EDGE_GAP_MAX = PLATFORM_SPACING_MAX // 2
+
 
 class PlatformGenerator:
-    """Отвечает за генерацию платформ"""
+    """
+    Отвечает за генерацию платформ.
+    Мир разбит на куски фиксированной ширины, платформы куска зависят
+    только от (зерно мира, номер куска), поэтому любой кусок строится
+    за O(1) без генерации предыдущих. Промежуток на стыке кусков
+    складывается из отступа в конце куска и отступа в начале
+    следующего, каждый из них - от половины минимального до половины
+    максимального промежутка, так что стык всегда проходим
+    """
 
-    def __init__(self):
-        pass
+    def __init__(self, seed: int, chunk_width: int = WORLD_CHUNK_WIDTH):
+        """
+        :param seed: Зерно мира
+        :param chunk_width: Ширина куска
+        """
+        # Наименьший заполняемый отрезок куска - две платформы
+        if chunk_width < (PLATFORM_SPACING_MAX + 2 * MIN_PLATFORM_WIDTH +
+                          PLATFORM_SPACING_MIN + START_PLATFORM_WIDTH +
+                          PLATFORM_SPACING_MAX):
+            raise ValueError("Chunk width is too small")
+        self._seed = seed
+        self._chunk_width = chunk_width
 
-    def generate_initial_platforms(self) -> List[Platform]:
-        """Генерация стартовых платформ"""
-        platforms = []
+        # При квантовании ширин остаток куска уходит в отступ у правого
+        # края: допустимые ширины и заполнимые длины считаются один раз
+        self._widths: List[int] = []
+        self._fill_lengths: List[Tuple[int, int]] = []
+        if PLATFORM_WIDTH_QUANTUM > 0:
+            self._widths = sorted({
+                self._quantize(width)
+                for width in range(MIN_PLATFORM_WIDTH, MAX_PLATFORM_WIDTH + 1)
+            })
+            self._fill_lengths = self._quantized_fill_lengths()
 
-        # Стартовая платформа
-        start_platform = Platform(0, PLATFORM_START_Y, START_PLATFORM_WIDTH)
-        platforms.append(start_platform)
+    # Свойства
 
-        # Последующие платформы
-        for i in range(1, INITIAL_PLATFORMS + 1):
-            last_platform = platforms[-1]
+    @property
+    def seed(self) -> int:
+        """Зерно мира (только чтение)"""
+        return self._seed
 
-            x = (
-                last_platform.x
-                + last_platform.width
-                + random.randint(PLATFORM_SPACING_MIN, PLATFORM_SPACING_MAX)
-            )
+    @property
+    def chunk_width(self) -> int:
+        """Ширина куска (только чтение)"""
+        return self._chunk_width
+
+    # Публичные методы
+
+    def chunk_index(self, x: float) -> int:
+        """Номер куска, которому принадлежит координата X"""
+        return int(x // self._chunk_width)
 
-            y = (PLATFORM_START_Y -
-                 (i % PLATFORM_ALTERNATION_PATTERN) *
-                 PLATFORM_HEIGHT_VARIATION *
-                 PLATFORM_ALTERNATION_MULTIPLIER)
-            width = random.randint(MIN_PLATFORM_WIDTH, MAX_PLATFORM_WIDTH)
+    def generate_chunk(self, index: int) -> List[Platform]:
+        """
+        Платформы куска по возрастанию X
+        :param index: Номер куска (0 - стартовый)
+        :return: Платформы, целиком лежащие в куске
+        """
+        if index < 0:
+            raise ValueError("Chunk index must not be negative")
+        rng = random.Random((self._seed << WORLD_CHUNK_INDEX_BITS) | index)
+        start = index * self._chunk_width
+        if self._widths:
+            # Правый отступ - от _EDGE_GAP_MIN, остаток добавит _fill_quantized
+            end = start + self._chunk_width - _EDGE_GAP_MIN
+        else:
+            end = start + self._chunk_width - self._edge_gap(rng)
 
-            new_platform = Platform(x, y, width)
-            platforms.append(new_platform)
+        platforms = []
+        if index == 0:
+            # Стартовая платформа
+            platforms.append(
+                Platform(0, PLATFORM_START_Y, START_PLATFORM_WIDTH)
+            )
+            x = START_PLATFORM_WIDTH + rng.randint(PLATFORM_SPACING_MIN,
+                                                   PLATFORM_SPACING_MAX)
+        else:
+            x = start + self._edge_gap(rng)
+
+        if self._widths and self._can_fill_quantized(end - x):
+            layout = self._fill_quantized(rng, end - x)
+        else:
+            layout = self._fill(rng, end - x)
+        for width, gap in layout:
+            platforms.append(
+                Platform(x, self._platform_y(rng, index, len(platforms)),
+                         width)
+            )
+            x += width + gap
 
         return platforms
 
-    def generate_platform(self, last_platform: Platform) -> Platform:
-        """Генерация одной новой платформы после последней"""
-        new_x = (
-            last_platform.x
-            + last_platform.width
-            + random.randint(PLATFORM_SPACING_MIN, PLATFORM_SPACING_MAX)
-        )
+    def generate_range(self, start_x: float,
+                       end_x: float) -> List[Platform]:
+        """
+        Платформы, пересекающие отрезок [start_x, end_x), без генерации
+        мира до start_x (например, сразу с 50-го километра)
+        """
+        first = max(0, self.chunk_index(start_x))
+        last = self.chunk_index(end_x)
+        return [
+            platform
+            for index in range(first, last + 1)
+            for platform in self.generate_chunk(index)
+            if platform.x < end_x and platform.x + platform.width > start_x
+        ]
+
+    # Приватные методы
+
+    @staticmethod
+    def _edge_gap(rng: random.Random) -> int:
+        """Отступ от края куска - половина промежутка на стыке"""
+        return rng.randint(_EDGE_GAP_MIN, _EDGE_GAP_MAX)
+
+    @staticmethod
+    def _can_fill(length: float) -> bool:
+        """Можно ли заполнить отрезок платформами и промежутками"""
+        return (MIN_PLATFORM_WIDTH <= length <= MAX_PLATFORM_WIDTH or
+                length >= 2 * MIN_PLATFORM_WIDTH + PLATFORM_SPACING_MIN)
+
+    def _fill(self, rng: random.Random,
+              length: float) -> List[Tuple[float, int]]:
+        """
+        Ширины платформ и промежутки после них, точно заполняющие
+        отрезок: последняя платформа заканчивается на его конце
+        :param length: Длина отрезка (заполнимая, см. _can_fill)
+        :return: Пары (ширина, промежуток до следующей платформы)
+        """
+        layout = []
+        while length > MAX_PLATFORM_WIDTH:
+            for _ in range(_FILL_ATTEMPTS):
+                width = self._random_width(rng)
+                gap = rng.randint(PLATFORM_SPACING_MIN, PLATFORM_SPACING_MAX)
+                if self._can_fill(length - width - gap):
+                    break
+            else:
+                # Остаток между одной и двумя платформами: последней
+                # остается платформа наибольшей ширины
+                width = MIN_PLATFORM_WIDTH
+                gap = PLATFORM_SPACING_MIN
+                if not self._can_fill(length - width - gap):
+                    gap = length - MAX_PLATFORM_WIDTH - width
+            layout.append((width, gap))
+            length -= width + gap
+
+        layout.append((length, 0))
+        return layout
+
+    def _fill_quantized(self, rng: random.Random,
+                        length: int) -> List[Tuple[int, int]]:
+        """
+        _fill для квантованных ширин: все платформы, включая последнюю,
+        берут ширину из квантованных, а недостающее до конца отрезка
+        (не больше _EDGE_GAP_MAX - _EDGE_GAP_MIN) добавляется к отступу
+        у правого края куска
+        :param length: Длина отрезка (см. _can_fill_quantized)
+        :return: Пары (ширина, промежуток до следующей платформы)
+        """
+        slack = _EDGE_GAP_MAX - _EDGE_GAP_MIN
+        layout = []
+        while True:
+            last = [width for width in self._widths
+                    if 0 <= length - width <= slack]
+            if last:
+                layout.append((rng.choice(last), 0))
+                return layout
+
+            for _ in range(_FILL_ATTEMPTS):
+                width = self._random_width(rng)
+                gap = rng.randint(PLATFORM_SPACING_MIN, PLATFORM_SPACING_MAX)
+                if self._can_fill_quantized(length - width - gap):
+                    break
+            else:
+                width, gap = next(
+                    (width, gap)
+                    for width in self._widths
+                    for gap in range(PLATFORM_SPACING_MIN,
+                                     PLATFORM_SPACING_MAX + 1)
+                    if self._can_fill_quantized(length - width - gap)
+                )
+            layout.append((width, gap))
+            length -= width + gap
+
+    def _can_fill_quantized(self, length: int) -> bool:
+        """Можно ли заполнить отрезок для _fill_quantized"""
+        return any(low <= length <= high
+                   for low, high in self._fill_lengths)
+
+    def _quantized_fill_lengths(self) -> List[Tuple[int, int]]:
+        """
+        Длины отрезков, заполнимые квантованными ширинами, до ширины
+        куска: объединение отрезков [low, high]. Одна платформа
+        заполняет [ширина, ширина + запас отступа], каждая следующая
+        сдвигает отрезки на ширину и промежуток
+        """
+        slack = _EDGE_GAP_MAX - _EDGE_GAP_MIN
+        frontier = self._merge([(width, width + slack)
+                                for width in self._widths])
+        lengths = frontier
+        while frontier:
+            frontier = self._merge([
+                (low + width + PLATFORM_SPACING_MIN,
+                 min(high + width + PLATFORM_SPACING_MAX,
+                     self._chunk_width))
+                for low, high in frontier
+                for width in self._widths
+                if low + width + PLATFORM_SPACING_MIN <= self._chunk_width
+            ])
+            lengths = self._merge(lengths + frontier)
+        return lengths
+
+    @staticmethod
+    def _merge(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Объединяет пересекающиеся и смежные целые отрезки"""
+        merged: List[Tuple[int, int]] = []
+        for low, high in sorted(intervals):
+            if merged and low <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+            else:
+                merged.append((low, high))
+        return merged
+
+    @staticmethod
+    def _platform_y(rng: random.Random, index: int, number: int) -> float:
+        """Высота платформы: чередование у старта, дальше случайно"""
+        if index == 0 and number <= INITIAL_PLATFORMS:
+            return (PLATFORM_START_Y -
+                    (number % PLATFORM_ALTERNATION_PATTERN) *
+                    PLATFORM_HEIGHT_VARIATION *
+                    PLATFORM_ALTERNATION_MULTIPLIER)
+        return rng.randint(PLATFORM_Y_RANGE_MIN, PLATFORM_Y_RANGE_MAX)
 
-        new_y = random.randint(PLATFORM_Y_RANGE_MIN, PLATFORM_Y_RANGE_MAX)
-        new_width = random.randint(MIN_PLATFORM_WIDTH, MAX_PLATFORM_WIDTH)
+    @classmethod
+    def _random_width(cls, rng: random.Random) -> int:
+        """Случайная ширина платформы с учетом квантования"""
+        return cls._quantize(rng.randint(MIN_PLATFORM_WIDTH,
+                                         MAX_PLATFORM_WIDTH))
 
-        return Platform(new_x, new_y, new_width)
+    @staticmethod
+    def _quantize(width: int) -> int:
+        """
+        Квантование к кратным шагу, чтобы поверхности переиспользовались.
+        Результат остается кратным шагу внутри
+        [MIN_PLATFORM_WIDTH, MAX_PLATFORM_WIDTH]; если таких кратных нет,
+        ширина не квантуется
+        """
+        quantum = PLATFORM_WIDTH_QUANTUM
+        if quantum > 0:
+            low = -(-MIN_PLATFORM_WIDTH // quantum)
+            high = MAX_PLATFORM_WIDTH // quantum
+            if low <= high:
+                steps = min(max(round(width / quantum), low), high)
+                width = steps * quantum
+        return width
@@ -1,55 +1,90 @@
 # src/model/platform_manager.py
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
 from src.model.platform import Platform
 from constants import SCREEN_WIDTH, VISIBLE_PLATFORM_RANGE, WORLD_OFFSET_MARGIN
 
 
 class PlatformManager:
-    """Управляет видимостью и жизненным циклом платформ"""
+    """
+    Управляет видимостью и жизненным циклом платформ.
+    PlatformGenerator добавляет платформы по возрастанию X без перекрытий,
+    поэтому список отсортирован и по началу, и по концу платформ:
+    видимые ищутся бинарным поиском, а удаление за левой границей
+    сдвигает начало списка (как popleft у deque)
+    """
+
+    # Удаленные платформы вырезаются из списка, когда их набирается
+    # больше половины и не меньше этого количества
+    _COMPACT_THRESHOLD = 32
 
     def __init__(self, platforms: List[Platform]):
         self._platforms = platforms
+        self._head = 0  # Индекс первой живой платформы
+
+    def _visible_range(self, world_offset: float) -> Tuple[int, int]:
+        """Срез видимых платформ в self._platforms"""
+        def screen_x(platform: Platform) -> float:
+            return platform.x - world_offset
+
+        start = bisect_right(self._platforms, -VISIBLE_PLATFORM_RANGE,
+                             lo=self._head, key=screen_x)
+        stop = bisect_left(self._platforms,
+                           SCREEN_WIDTH + VISIBLE_PLATFORM_RANGE,
+                           lo=start, key=screen_x)
+        return start, stop
 
     def get_visible_platforms(self, world_offset: float) -> List[Platform]:
         """Возвращает платформы в зоне видимости"""
-        visible_platforms = []
-
-        for platform in self._platforms:
-            platform_screen_x = platform.x - world_offset
+        start, stop = self._visible_range(world_offset)
+        return self._platforms[start:stop]
 
-            if (-VISIBLE_PLATFORM_RANGE < platform_screen_x <
-                    SCREEN_WIDTH + VISIBLE_PLATFORM_RANGE):
-                visible_platforms.append(platform)
+    def get_visible_bounds(self, world_offset: float
+                           ) -> List[Tuple[float, float, float, float]]:
+        """Границы (x, y, width, height) видимых платформ"""
+        return [platform.get_bounds()
+                for platform in self.get_visible_platforms(world_offset)]
 
-        return visible_platforms
+    def count_visible(self, world_offset: float) -> int:
+        """Количество платформ в зоне видимости"""
+        start, stop = self._visible_range(world_offset)
+        return stop - start
 
     def remove_offscreen_platforms(self,
                                    world_offset: float) -> List[Platform]:
         """Удаляет платформы за левой границей и возвращает удаленные"""
-        platforms_to_remove = []
+        left_border = world_offset - WORLD_OFFSET_MARGIN
+        end = self._head
+        while (end < len(self._platforms) and
+               self._platforms[end].x + self._platforms[end].width <
+               left_border):
+            end += 1
 
-        for platform in self._platforms:
-            if (platform.x + platform.width <
-                    world_offset - WORLD_OFFSET_MARGIN):
-                platforms_to_remove.append(platform)
+        removed = self._platforms[self._head:end]
+        self._head = end
 
-        for platform in platforms_to_remove:
-            self._platforms.remove(platform)
+        if (self._head >= self._COMPACT_THRESHOLD and
+                self._head * 2 >= len(self._platforms)):
+            del self._platforms[:self._head]
+            self._head = 0
 
-        return platforms_to_remove
+        return removed
 
     def add_platform(self, platform: Platform) -> None:
-        """Добавляет платформу"""
+        """Добавляет платформу правее последней"""
+        last_platform = self.get_last_platform()
+        if last_platform is not None and platform.x < last_platform.x:
+            raise ValueError("Platforms must be added in increasing x order")
         self._platforms.append(platform)
 
     def get_last_platform(self) -> Optional[Platform]:
         """Возвращает последнюю платформу"""
-        return self._platforms[-1] if self._platforms else None
+        return self._platforms[-1] if self.count else None
 
     @property
     def platforms(self) -> List[Platform]:
-        return self._platforms
+        return self._platforms[self._head:]
 
     @property
     def count(self) -> int:
-        return len(self._platforms)
+        return len(self._platforms) - self._head
@@ -6,11 +6,18 @@ from constants import (
     PLAYER_GRAVITY, PLAYER_HITBOX_WIDTH, PLAYER_HITBOX_HEIGHT,
     PLAYER_HITBOX_OFFSET_X, PLAYER_HITBOX_OFFSET_Y,
     SCREEN_HEIGHT, PLAYER_INITIAL_Y,
-    PLAYER_INITIAL_X
+    PLAYER_INITIAL_X, VALIDATE_SETTERS
 )
 
 
 class Player(IGameObject, ICollidable):
+    __slots__ = (
+        "_width", "_height", "_x", "_y", "_speed", "_jump_power",
+        "_gravity", "_vel_y", "_is_jumping", "_facing_right", "_world_x",
+        "_hitbox_width", "_hitbox_height", "_hitbox_offset_x",
+        "_hitbox_offset_y", "_hitbox", "_world_hitbox", "_probe",
+    )
+
     def __init__(self):
         """Инициализация игрока (кота) с инкапсуляцией"""
         # Приватные атрибуты
@@ -31,7 +38,12 @@ class Player(IGameObject, ICollidable):
         self._hitbox_height = PLAYER_HITBOX_HEIGHT
         self._hitbox_offset_x = PLAYER_HITBOX_OFFSET_X
         self._hitbox_offset_y = PLAYER_HITBOX_OFFSET_Y
-        self._hitbox = None
+        # Прямоугольники создаются один раз и дальше изменяются на месте:
+        # экранный хитбокс, он же в мировых координатах (для коллизий) и
+        # пробный хитбокс для swept-проверки
+        self._hitbox = pygame.Rect(0, 0, 0, 0)
+        self._world_hitbox = pygame.Rect(0, 0, 0, 0)
+        self._probe = pygame.Rect(0, 0, 0, 0)
         self._update_hitbox()
 
     # Свойства контролируемого доступа
@@ -54,7 +66,7 @@ class Player(IGameObject, ICollidable):
     @x.setter
     def x(self, value: float) -> None:
         """Установка X с валидацией и обновлением хитбокса"""
-        if not isinstance(value, (int, float)):
+        if VALIDATE_SETTERS and not isinstance(value, (int, float)):
             raise ValueError("X coordinate must be a number")
         self._x = float(value)
         self._update_hitbox()
@@ -64,49 +76,66 @@ class Player(IGameObject, ICollidable):
         """Экранная координата Y (чтение и запись)"""
         return self._y
 
+    def _store_y(self, value: float) -> None:
+        """Запись Y без проверки"""
+        self._y = float(value)
+        self._update_hitbox()
+
     @y.setter
     def y(self, value: float) -> None:
         """Установка Y с валидацией и обновлением хитбокса"""
-        if not isinstance(value, (int, float)):
+        if VALIDATE_SETTERS and not isinstance(value, (int, float)):
             raise ValueError("Y coordinate must be a number")
-        self._y = float(value)
-        self._update_hitbox()
+        self._store_y(value)
 
     @property
     def world_x(self) -> float:
         """Мировая координата X (чтение и запись)"""
         return self._world_x
 
+    def _store_world_x(self, value: float) -> None:
+        """Запись мировой координаты X без проверки"""
+        self._world_x = float(value)
+        self._update_world_hitbox()
+
     @world_x.setter
     def world_x(self, value: float) -> None:
         """Установка мировой координаты X с валидацией"""
-        if not isinstance(value, (int, float)):
+        if VALIDATE_SETTERS and not isinstance(value, (int, float)):
             raise ValueError("World X must be a number")
-        self._world_x = float(value)
+        self._store_world_x(value)
 
     @property
     def vel_y(self) -> float:
         """Вертикальная скорость (чтение и запись)"""
         return self._vel_y
 
+    def _store_vel_y(self, value: float) -> None:
+        """Запись вертикальной скорости без проверки"""
+        self._vel_y = float(value)
+
     @vel_y.setter
     def vel_y(self, value: float) -> None:
         """Установка вертикальной скорости с валидацией"""
-        if not isinstance(value, (int, float)):
+        if VALIDATE_SETTERS and not isinstance(value, (int, float)):
             raise ValueError("Velocity must be a number")
-        self._vel_y = float(value)
+        self._store_vel_y(value)
 
     @property
     def is_jumping(self) -> bool:
         """Состояние прыжка (чтение и запись)"""
         return self._is_jumping
 
+    def _store_is_jumping(self, value: bool) -> None:
+        """Запись состояния прыжка без проверки"""
+        self._is_jumping = value
+
     @is_jumping.setter
     def is_jumping(self, value: bool) -> None:
         """Установка состояния прыжка с валидацией"""
-        if not isinstance(value, bool):
+        if VALIDATE_SETTERS and not isinstance(value, bool):
             raise ValueError("is_jumping must be boolean")
-        self._is_jumping = value
+        self._store_is_jumping(value)
 
     @property
     def facing_right(self) -> bool:
@@ -116,7 +145,7 @@ class Player(IGameObject, ICollidable):
     @facing_right.setter
     def facing_right(self, value: bool) -> None:
         """Установка направления взгляда с валидацией"""
-        if not isinstance(value, bool):
+        if VALIDATE_SETTERS and not isinstance(value, bool):
             raise ValueError("facing_right must be boolean")
         self._facing_right = value
 
@@ -125,63 +154,128 @@ class Player(IGameObject, ICollidable):
         """Хитбокс игрока (только чтение)"""
         return self._hitbox
 
+    @property
+    def world_hitbox(self) -> pygame.Rect:
+        """Хитбокс игрока в мировых координатах (только чтение)"""
+        return self._world_hitbox
+
+    # Запись из горячего пути (физика каждого кадра): в отладке через
+    # сеттеры с проверкой, в режиме release (python -O) напрямую
+    _write_y = y.fset if VALIDATE_SETTERS else _store_y
+    _write_world_x = world_x.fset if VALIDATE_SETTERS else _store_world_x
+    _write_vel_y = vel_y.fset if VALIDATE_SETTERS else _store_vel_y
+    _write_is_jumping = (is_jumping.fset if VALIDATE_SETTERS
+                         else _store_is_jumping)
+
     # Приватные методы
 
     def _update_hitbox(self) -> None:
-        """Обновляет позицию хитбокса игрока"""
-        self._hitbox = pygame.Rect(
+        """Обновляет позицию хитбокса игрока (без создания Rect)"""
+        self._hitbox.update(
             self._x + self._hitbox_offset_x,
             self._y + self._hitbox_offset_y,
             self._hitbox_width,
             self._hitbox_height,
         )
+        self._update_world_hitbox()
+
+    def _update_world_hitbox(self) -> None:
+        """
+        Переводит экранный хитбокс в мировые координаты. Это единственное
+        место, где в коллизиях учитывается смещение камеры: платформы и
+        мыши хранят хитбоксы в мировых координатах. При целых координатах
+        (скорость и генератор мира целочисленны) сравнение совпадает со
+        сравнением в экранных координатах
+        """
+        hitbox = self._hitbox
+        self._world_hitbox.update(hitbox.x + self._world_x, hitbox.y,
+                                  hitbox.width, hitbox.height)
 
     def _resolve_platform_collision(self,
                                     platform_hitbox: pygame.Rect) -> bool:
         """
         Обрабатывает коллизию с одной платформой
-        :param platform_hitbox: Хитбокс платформы
+        :param platform_hitbox: Хитбокс платформы в мировых координатах
         :return: True если игрок приземлился на платформу
         """
         on_ground = False
+        hitbox = self._world_hitbox
 
-        if self._hitbox.colliderect(platform_hitbox):
+        if hitbox.colliderect(platform_hitbox):
             # Приземление на платформу
-            if self._vel_y > 0 and self._hitbox.bottom > platform_hitbox.top:
-                self.y = (platform_hitbox.top -
-                          (self._hitbox_offset_y + self._hitbox_height))
-                self.vel_y = 0
-                self.is_jumping = False
+            if self._vel_y > 0 and hitbox.bottom > platform_hitbox.top:
+                self._write_y(platform_hitbox.top -
+                              (self._hitbox_offset_y + self._hitbox_height))
+                self._write_vel_y(0)
+                self._write_is_jumping(False)
                 on_ground = True
             # Удар головой о платформу снизу
-            elif self._vel_y < 0 and self._hitbox.top < platform_hitbox.bottom:
-                self.y = platform_hitbox.bottom - self._hitbox_offset_y
-                self.vel_y = 0
+            elif self._vel_y < 0 and hitbox.top < platform_hitbox.bottom:
+                self._write_y(platform_hitbox.bottom - self._hitbox_offset_y)
+                self._write_vel_y(0)
 
         return on_ground
 
-    def _apply_gravity(self) -> None:
-        """Применяет гравитацию к игроку"""
-        self.vel_y += self._gravity
-        self.y += self._vel_y
+    def _apply_gravity(self, dt: int = 1) -> None:
+        """
+        Применяет гравитацию к игроку.
+        Кадры считаются по одному (скорость растет, затем прибавляется
+        к Y): формула суммы округляется иначе, чем покадровые сложения,
+        и на границе платформы разница в ULP меняет целый Rect
+        :param dt: Длина шага в целых кадрах 60 Гц
+        """
+        y = self._y
+        vel_y = self._vel_y
+        gravity = self._gravity
+        for _ in range(dt):
+            vel_y += gravity
+            y += vel_y
+        self._write_y(y)
+        self._write_vel_y(vel_y)
 
     def _check_screen_bounds(self, on_ground: bool) -> None:
         """Проверяет выход за границы экрана"""
-        if self.y > SCREEN_HEIGHT - self._height and not on_ground:
-            self.y = SCREEN_HEIGHT - self._height
-            self.vel_y = 0
-            self.is_jumping = False
+        if self._y > SCREEN_HEIGHT - self._height and not on_ground:
+            self._write_y(SCREEN_HEIGHT - self._height)
+            self._write_vel_y(0)
+            self._write_is_jumping(False)
 
     # Реализация интерфейса IGameObject
 
-    def update(self, platforms: List, x_movement: float = 0) -> None:
+    def update(self, platforms: List, x_movement: float = 0,
+               dt: int = 1) -> None:
         """
         Обновляет состояние игрока - ТОЛЬКО ЛОГИКА
         :param platforms: Список активных платформ
-        :param x_movement: Движение по X
+        :param x_movement: Движение по X за весь шаг
+        :param dt: Длина шага в кадрах 60 Гц. Путь за шаг проверяется
+                   непрерывно: кадр первого касания находится заранее,
+                   и коллизия разрешается в нем, как при покадровом шаге
         """
+        if dt == 1:
+            self._step_frame(platforms, x_movement)
+            return
+
+        frame_movement = x_movement / dt
+        remaining = dt
+        while remaining > 0:
+            frames = self._frames_until_contact(platforms, frame_movement,
+                                                remaining)
+            # Свободный полет до кадра касания - без проверки коллизий.
+            # Сложения покадровые, чтобы совпасть с шагом dt=1 до бита
+            if frames > 1:
+                world_x = self._world_x
+                for _ in range(frames - 1):
+                    world_x += frame_movement
+                self._write_world_x(world_x)
+                self._apply_gravity(frames - 1)
+            self._step_frame(platforms, frame_movement)
+            remaining -= frames
+
+    def _step_frame(self, platforms: List, x_movement: float) -> None:
+        """Один кадр 60 Гц: движение, гравитация и коллизии"""
         # Обновляем мировую позицию
-        self.world_x += x_movement
+        self._write_world_x(self._world_x + x_movement)
 
         # Применяем гравитацию
         self._apply_gravity()
@@ -189,13 +283,45 @@ class Player(IGameObject, ICollidable):
         # Проверка коллизий с платформами
         on_ground = False
         for platform in platforms:
-            platform_hitbox = platform.get_hitbox(self.world_x)
-            on_ground = (self._resolve_platform_collision(platform_hitbox) or
-                         on_ground)
+            on_ground = (
+                self._resolve_platform_collision(platform.world_hitbox) or
+                on_ground
+            )
 
         # Проверка выхода за границы экрана
         self._check_screen_bounds(on_ground)
 
+    def _frames_until_contact(self, platforms: List, x_movement: float,
+                              max_frames: int) -> int:
+        """
+        Swept-проверка: номер первого кадра, в котором хитбокс коснется
+        платформы или нижней границы экрана, если двигаться без коллизий
+        :param platforms: Платформы-кандидаты
+        :param x_movement: Движение по X за кадр
+        :param max_frames: Длина оставшегося пути в кадрах
+        :return: Номер кадра (1..max_frames), max_frames без касаний
+        """
+        floor_y = SCREEN_HEIGHT - self._height
+        probe = self._probe
+        # Те же покадровые сложения, что в _step_frame
+        y = self._y
+        vel_y = self._vel_y
+        world_x = self._world_x
+        for frame in range(1, max_frames + 1):
+            vel_y += self._gravity
+            y += vel_y
+            if y > floor_y:
+                return frame
+
+            world_x += x_movement
+            probe.update(self._hitbox.x + world_x, y + self._hitbox_offset_y,
+                         self._hitbox_width, self._hitbox_height)
+            for platform in platforms:
+                if probe.colliderect(platform.world_hitbox):
+                    return frame
+
+        return max_frames
+
     def get_position(self) -> Tuple[float, float]:
         """IGameObject - возвращает позицию (экранные координаты)"""
         return self._x, self._y
@@ -208,7 +334,10 @@ class Player(IGameObject, ICollidable):
 
     def check_collision(self, other) -> bool:
         """ICollidable - проверка коллизии"""
-        if hasattr(other, 'get_hitbox'):
+        if hasattr(other, 'world_hitbox'):
+            # Платформы и мыши: сравнение в мировых координатах
+            return self._world_hitbox.colliderect(other.world_hitbox)
+        elif hasattr(other, 'get_hitbox'):
             # Для платформ используем их метод get_hitbox
             other_hitbox = other.get_hitbox(self.world_x)
             return self._hitbox.colliderect(other_hitbox)
@@ -220,9 +349,11 @@ class Player(IGameObject, ICollidable):
     def handle_collision(self, other) -> None:
         """ICollidable - обработка коллизии"""
         # Базовая реализация - можно расширить для разных типов объектов
-        if hasattr(other, 'get_hitbox'):
-            other_hitbox = other.get_hitbox(self.world_x)
-            self._resolve_platform_collision(other_hitbox)
+        if hasattr(other, 'world_hitbox'):
+            self._resolve_platform_collision(other.world_hitbox)
+        elif hasattr(other, 'get_hitbox'):
+            # Без смещения мира - хитбокс в мировых координатах
+            self._resolve_platform_collision(other.get_hitbox(0))
 
     def get_hitbox(self, world_offset: float = 0) -> pygame.Rect:
         """
@@ -234,6 +365,22 @@ class Player(IGameObject, ICollidable):
 
     # Публичные методы
 
+    def get_state(self) -> Tuple[float, float, float, float, bool, bool]:
+        """Изменяемое состояние: x, y, vel_y, world_x, прыжок, взгляд"""
+        return (self._x, self._y, self._vel_y, self._world_x,
+                self._is_jumping, self._facing_right)
+
+    def set_state(self, x: float, y: float, vel_y: float, world_x: float,
+                  is_jumping: bool, facing_right: bool) -> None:
+        """Восстанавливает состояние get_state (без проверки типов)"""
+        self._x = x
+        self._y = y
+        self._vel_y = vel_y
+        self._world_x = world_x
+        self._is_jumping = is_jumping
+        self._facing_right = facing_right
+        self._update_hitbox()
+
     def jump(self) -> None:
         """Выполняет прыжок, если игрок на земле"""
         if not self.is_jumping:
@@ -0,0 +1,127 @@
+from math import floor
+from typing import Any, Dict, List, Tuple
+from constants import COLLISION_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Широкая фаза коллизий: одномерный равномерный хэш по X.
+    Объект регистрируется во всех ячейках, которые покрывает его
+    отрезок [left, right], запрос возвращает объекты из ячеек отрезка
+    запроса в порядке регистрации - в том же порядке, в каком их
+    обходили списки платформ и мышей
+    """
+
+    def __init__(self, cell_size: float = COLLISION_CELL_SIZE):
+        """
+        :param cell_size: Ширина ячейки
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self._cell_size = cell_size
+        self._cells: Dict[int, Dict[Any, int]] = {}
+        # Объект -> (первая ячейка, последняя ячейка, порядковый номер)
+        self._entries: Dict[Any, Tuple[int, int, int]] = {}
+        self._next_order = 0
+
+        # Статистика запросов
+        self._queries = 0
+        self._candidates = 0
+        self._max_candidates = 0
+        self._cells_visited = 0
+
+    # Свойства
+
+    @property
+    def cell_size(self) -> float:
+        """Ширина ячейки (только чтение)"""
+        return self._cell_size
+
+    @property
+    def count(self) -> int:
+        """Количество зарегистрированных объектов (только чтение)"""
+        return len(self._entries)
+
+    # Публичные методы
+
+    def insert(self, obj: Any, left: float, right: float) -> None:
+        """
+        Регистрирует объект
+        :param obj: Объект (хэшируемый, по идентичности)
+        :param left: Левая граница по X
+        :param right: Правая граница по X
+        """
+        if obj in self._entries:
+            raise ValueError("Object is already registered")
+        first, last = self._cell(left), self._cell(right)
+        order = self._next_order
+        self._next_order += 1
+
+        self._entries[obj] = (first, last, order)
+        for cell in range(first, last + 1):
+            self._cells.setdefault(cell, {})[obj] = order
+
+    def remove(self, obj: Any) -> None:
+        """
+        Удаляет объект из хэша
+        :param obj: Ранее зарегистрированный объект
+        """
+        first, last, _ = self._entries.pop(obj)
+        for cell in range(first, last + 1):
+            bucket = self._cells[cell]
+            del bucket[obj]
+            if not bucket:
+                del self._cells[cell]
+
+    def query(self, left: float, right: float) -> List[Any]:
+        """
+        Объекты, ячейки которых пересекаются с отрезком [left, right]
+        :param left: Левая граница по X
+        :param right: Правая граница по X
+        :return: Кандидаты в порядке регистрации
+        """
+        first, last = self._cell(left), self._cell(right)
+        found: Dict[Any, int] = {}
+        for cell in range(first, last + 1):
+            bucket = self._cells.get(cell)
+            if bucket:
+                found.update(bucket)
+
+        candidates = sorted(found, key=found.__getitem__)
+
+        self._queries += 1
+        self._cells_visited += last - first + 1
+        self._candidates += len(candidates)
+        self._max_candidates = max(self._max_candidates, len(candidates))
+        return candidates
+
+    def clear(self) -> None:
+        """Удаляет все объекты (статистика сохраняется)"""
+        self._cells.clear()
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Статистика запросов"""
+        return {
+            'entities': len(self._entries),
+            'cells': len(self._cells),
+            'queries': self._queries,
+            'candidates': self._candidates,
+            'mean_candidates': (self._candidates / self._queries
+                                if self._queries else 0.0),
+            'max_candidates': self._max_candidates,
+            'cells_visited': self._cells_visited,
+        }
+
+    def reset_stats(self) -> None:
+        """Обнуляет статистику запросов"""
+        self._queries = 0
+        self._candidates = 0
+        self._max_candidates = 0
+        self._cells_visited = 0
+
+    # Приватные методы
+
+    def _cell(self, x: float) -> int:
+        """Номер ячейки для координаты X"""
+        return floor(x / self._cell_size)
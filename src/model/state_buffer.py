@@ -0,0 +1,109 @@
+import struct
+from array import array
+from typing import NamedTuple, Optional, Tuple
+
+# Версия раскладки буфера. 2 - платформы мира строятся кусками:
+# снимок версии 1 продолжился бы в другом мире
+STATE_VERSION = 2
+
+# Заголовок: все скалярные поля модели одной записью struct
+_HEADER = struct.Struct(
+    "<B"      # версия
+    "qd?q"    # контроллер: кадр, движение, на земле, собрано мышей
+    "??qd"    # GameState: работает, хитбоксы, счет, смещение мира
+    "dddd??"  # Player: x, y, vel_y, world_x, прыжок, взгляд вправо
+    "dQ"      # World: смещение мира, зерно
+    "dq"      # MouseManager: таймер появления, собрано мышей
+    "?d"      # random.Random: есть ли gauss_next, gauss_next
+    "II"      # количество платформ и мышей
+)
+# Внутреннее состояние Mersenne Twister (random.Random.getstate)
+_RNG_VERSION = 3
+_RNG_WORDS = 625
+_RNG = struct.Struct(f"<{_RNG_WORDS}I")
+
+# Значений double на платформу (x, y, width) и на мышь
+# (x, y, кадр анимации, собрана). Массивы пишутся в порядке байтов
+# машины: снимок предназначен для восстановления на ней же
+PLATFORM_FIELDS = 3
+MOUSE_FIELDS = 4
+_DOUBLE_SIZE = array("d").itemsize
+
+
+class WorldState(NamedTuple):
+    """Состояние мира в плоском виде"""
+    world_offset: float
+    seed: int
+    rng_state: tuple  # random.Random.getstate()
+    platforms: array  # 'd': x, y, width подряд для каждой платформы
+    spawn_timer: float
+    collected_count: int
+    mice: array  # 'd': MOUSE_FIELDS значений на мышь
+
+
+def pack_state(scalars: tuple, world: WorldState) -> bytes:
+    """
+    Собирает плоский буфер: заголовок, состояние генератора случайных
+    чисел и массивы платформ и мышей
+    :param scalars: Поля контроллера, GameState и Player по порядку
+                    заголовка
+    :param world: Состояние мира
+    :return: Буфер для unpack_state
+    """
+    version, words, gauss_next = world.rng_state
+    if version != _RNG_VERSION or len(words) != _RNG_WORDS:
+        raise ValueError("Unsupported random generator state")
+
+    header = _HEADER.pack(
+        STATE_VERSION, *scalars,
+        world.world_offset, world.seed,
+        world.spawn_timer, world.collected_count,
+        gauss_next is not None, gauss_next or 0.0,
+        len(world.platforms) // PLATFORM_FIELDS,
+        len(world.mice) // MOUSE_FIELDS,
+    )
+    return b"".join((header, _RNG.pack(*words),
+                     world.platforms.tobytes(), world.mice.tobytes()))
+
+
+def unpack_state(buffer: bytes) -> Tuple[tuple, WorldState]:
+    """
+    Разбирает буфер pack_state
+    :param buffer: Буфер снимка
+    :return: (поля контроллера, GameState и Player; состояние мира)
+    """
+    if len(buffer) < _HEADER.size + _RNG.size:
+        raise ValueError("State buffer is truncated")
+    fields = _HEADER.unpack_from(buffer)
+    if fields[0] != STATE_VERSION:
+        raise ValueError(f"Unsupported state version {fields[0]}")
+    (world_offset, seed, spawn_timer, collected_count,
+     has_gauss, gauss, platform_count, mouse_count) = fields[15:]
+
+    # Без общего кэша: разбор 625 слов стоит единицы микросекунд, а
+    # буферы восстанавливают разные контроллеры и потоки
+    offset = _HEADER.size
+    words = _RNG.unpack_from(buffer, offset)
+    offset += _RNG.size
+    gauss_next: Optional[float] = gauss if has_gauss else None
+
+    platforms = _read_doubles(buffer, offset,
+                              platform_count * PLATFORM_FIELDS)
+    offset += len(platforms) * _DOUBLE_SIZE
+    mice = _read_doubles(buffer, offset, mouse_count * MOUSE_FIELDS)
+    if offset + len(mice) * _DOUBLE_SIZE != len(buffer):
+        raise ValueError("State buffer size does not match its header")
+
+    world = WorldState(world_offset, seed,
+                       (_RNG_VERSION, words, gauss_next),
+                       platforms, spawn_timer, collected_count, mice)
+    return fields[1:15], world
+
+
+def _read_doubles(buffer: bytes, offset: int, count: int) -> array:
+    """Массив 'd' из count значений буфера начиная с offset"""
+    values = array("d")
+    values.frombytes(buffer[offset:offset + count * _DOUBLE_SIZE])
+    if len(values) != count:
+        raise ValueError("State buffer is truncated")
+    return values
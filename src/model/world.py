@@ -1,30 +1,73 @@
 # src/model/world.py (переработанный)
-from typing import List
+import pygame
+import random
+from array import array
+from typing import List, Optional
 from src.model.platform import Platform
+from src.model.chunk_prefetcher import ChunkPrefetcher
 from src.model.platform_generator import PlatformGenerator
 from src.model.platform_manager import PlatformManager
-from constants import SCREEN_WIDTH, INITIAL_PLATFORMS, VISIBLE_PLATFORM_RANGE
+from src.model.spatial_hash import SpatialHash
+from src.model.state_buffer import PLATFORM_FIELDS, WorldState
+from constants import (
+    SCREEN_WIDTH, INITIAL_PLATFORMS, VISIBLE_PLATFORM_RANGE,
+    WORLD_SEED_BITS, WORLD_SEED_LIMIT,
+    BACKGROUND_CHUNK_PREFETCH
+)
 from src.model.mouse_manager import MouseManager
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.model.mouse import Mouse
+    from src.model.mouse_pool import MousePool
 
 
 class World:
-    def __init__(self) -> None:
-        """Инициализация игрового мира с разделением ответственности"""
+    def __init__(self, seed: Optional[int] = None,
+                 prefetch: bool = BACKGROUND_CHUNK_PREFETCH) -> None:
+        """
+        Инициализация игрового мира с разделением ответственности
+        :param seed: Зерно случайных чисел мира в [0, WORLD_SEED_LIMIT)
+                     (None - случайное).
+                     Платформы куска мира зависят только от зерна и
+                     номера куска, появление мышей берет числа из
+                     генератора мира, поэтому мир с тем же зерном и
+                     тем же вводом повторяется полностью
+        :param prefetch: Готовить следующие куски в фоновом потоке
+        """
+        if seed is None:
+            seed = random.getrandbits(WORLD_SEED_BITS)
+        elif not 0 <= seed < WORLD_SEED_LIMIT:
+            # Иначе запись и снимок мира упали бы только при сохранении
+            raise ValueError("World seed must be in [0, 2 ** 64)")
+        self._seed = seed
+        self._rng = random.Random(seed)
         self._world_offset: float = 0
 
         # Композиция
-        self._platform_generator = PlatformGenerator()
-        initial_platforms = (
-            self._platform_generator.generate_initial_platforms()
-            )
+        self._prefetch = prefetch
+        self._prefetcher = ChunkPrefetcher(PlatformGenerator(seed),
+                                           background=prefetch)
+        initial_platforms = self._prefetcher.get_chunk(0)
         self._platform_manager = PlatformManager(initial_platforms)
 
+        # Широкая фаза коллизий с платформами (мировые координаты)
+        self._platform_index = SpatialHash()
+        for platform in initial_platforms:
+            self._register_platform(platform)
+
         # Мыши
-        self._mouse_manager = MouseManager()
+        self._mouse_manager = MouseManager(self._rng)
+
+    @property
+    def seed(self) -> int:
+        """Зерно случайных чисел мира (только чтение)"""
+        return self._seed
+
+    @property
+    def chunk_prefetcher(self) -> ChunkPrefetcher:
+        """Выдача кусков мира и ее статистика (только чтение)"""
+        return self._prefetcher
 
     @property
     def world_offset(self) -> float:
@@ -38,9 +81,14 @@ class World:
     def platform_count(self) -> int:
         return self._platform_manager.count
 
+    @property
+    def platform_manager(self) -> PlatformManager:
+        """Хранилище платформ (только чтение)"""
+        return self._platform_manager
+
     @property
     def active_platform_count(self) -> int:
-        return len(self.get_visible_platforms())
+        return self._platform_manager.count_visible(self._world_offset)
 
     def get_visible_mice(self) -> List['Mouse']:
         return self._mouse_manager.get_visible_mice(self._world_offset)
@@ -49,6 +97,11 @@ class World:
     def collected_mice_count(self) -> int:
         return self._mouse_manager.collected_count
 
+    @property
+    def mouse_pool(self) -> 'MousePool':
+        """Пул мышей (только чтение)"""
+        return self._mouse_manager.pool
+
     @property
     def active_mice_count(self) -> int:
         return self._mouse_manager.active_mice_count
@@ -59,43 +112,53 @@ class World:
     def get_visible_platforms(self) -> List[Platform]:
         return self._platform_manager.get_visible_platforms(self._world_offset)
 
-    def update(self, player_x_movement: float) -> None:
-        """Обновление состояния мира"""
+    def get_visible_platform_bounds(self) -> List[tuple]:
+        """Границы видимых платформ без обращения к объектам Platform"""
+        return self._platform_manager.get_visible_bounds(self._world_offset)
+
+    def update(self, player_x_movement: float, dt: float = 1) -> None:
+        """
+        Обновление состояния мира
+        :param player_x_movement: Движение игрока по X за шаг
+        :param dt: Длина шага в кадрах 60 Гц
+        """
         # Обновляем смещение мира
         self.world_offset += player_x_movement
 
         # Удаление платформ за левой границей
-        self._platform_manager.remove_offscreen_platforms(self._world_offset)
+        for platform in self._platform_manager.remove_offscreen_platforms(
+                self._world_offset):
+            self._platform_index.remove(platform)
 
-        # Генерация новых платформ впереди
+        # Генерация новых платформ впереди. Платформы статичны
+        # (Platform.update пустой), поэтому кадр не обходит их все
         self._generate_ahead_platforms()
 
-        # Обновление всех платформ
-        self._update_all_platforms()
-
         visible_platforms = self.get_visible_platforms()
-        self._mouse_manager.update(self._world_offset, visible_platforms)
+        self._mouse_manager.update(self._world_offset, visible_platforms, dt)
 
     def _generate_ahead_platforms(self) -> None:
-        """Генерирует новые платформы впереди игрока"""
+        """Добавляет впереди игрока целые куски мира"""
         while self._need_more_platforms():
             last_platform = self._platform_manager.get_last_platform()
 
-            # Если last_platform равен None, генерируем начальные платформы
-            if last_platform is None:
-                # Получаем список начальных платформ
-                initial_platforms = (
-                    self._platform_generator.generate_initial_platforms()
-                )
-                # Добавляем все начальные платформы
-                for platform in initial_platforms:
-                    self._platform_manager.add_platform(platform)
-            else:
-                # Генерируем одну новую платформу на основе последней
-                new_platform = (
-                    self._platform_generator.generate_platform(last_platform)
-                )
-                self._platform_manager.add_platform(new_platform)
+            # Следующий кусок после куска последней платформы
+            index = 0
+            if last_platform is not None:
+                index = self._prefetcher.generator.chunk_index(
+                    last_platform.x) + 1
+            for platform in self._prefetcher.get_chunk(index):
+                self._add_platform(platform)
+
+    def _add_platform(self, platform: Platform) -> None:
+        """Добавляет платформу в хранилище и в широкую фазу"""
+        self._platform_manager.add_platform(platform)
+        self._register_platform(platform)
+
+    def _register_platform(self, platform: Platform) -> None:
+        """Регистрирует платформу в широкой фазе коллизий"""
+        self._platform_index.insert(platform, platform.x,
+                                    platform.x + platform.width)
 
     def _need_more_platforms(self) -> bool:
         """Проверяет, нужно ли генерировать больше платформ"""
@@ -109,18 +172,47 @@ class World:
         return (last_platform.x + last_platform.width <
                 self._world_offset + SCREEN_WIDTH + VISIBLE_PLATFORM_RANGE)
 
-    def _update_all_platforms(self) -> None:
-        """Обновляет все платформы"""
-        for platform in self._platform_manager.platforms:
-            platform.update()
-
     # Обработка коллизий
+
+    def get_platforms_near(self, hitbox: pygame.Rect, world_x: float,
+                           x_movement: float = 0) -> List[Platform]:
+        """
+        Видимые платформы, которые могут пересечься с хитбоксом по X.
+        Остальные видимые платформы не сталкиваются с ним, пока хитбокс
+        движется только по Y, поэтому результат можно передавать
+        вместо get_visible_platforms()
+        :param hitbox: Хитбокс в экранных координатах
+        :param world_x: Смещение, в котором платформы переводятся в
+                        экранные координаты (Player.world_x)
+        :param x_movement: Сдвиг смещения за шаг: кандидаты собираются
+                           по всему пути хитбокса
+        :return: Платформы в порядке генерации
+        """
+        # Запас в 1 px покрывает отбрасывание дробной части в Rect
+        start_x = min(world_x, world_x + x_movement)
+        end_x = max(world_x, world_x + x_movement)
+        candidates = self._platform_index.query(start_x + hitbox.left - 1,
+                                                end_x + hitbox.right + 1)
+        return [
+            platform for platform in candidates
+            if (-VISIBLE_PLATFORM_RANGE < platform.x - self._world_offset <
+                SCREEN_WIDTH + VISIBLE_PLATFORM_RANGE)
+        ]
+
+    def get_collision_stats(self) -> dict:
+        """Статистика запросов широкой фазы для платформ и мышей"""
+        return {
+            'platforms': self._platform_index.get_stats(),
+            'mice': self._mouse_manager.index.get_stats(),
+        }
+
     def check_player_collisions(self, player) -> bool:
         """Проверяет коллизии игрока с платформами и мышами"""
         had_collision = False
 
         # Коллизии с платформами
-        for platform in self.get_visible_platforms():
+        for platform in self.get_platforms_near(player.hitbox,
+                                                player.world_x):
             if player.check_collision(platform):
                 player.handle_collision(platform)
                 platform.handle_collision(player)
@@ -132,5 +224,57 @@ class World:
 
         return had_collision
 
+    # Снимок состояния
+
+    def get_state(self) -> WorldState:
+        """Плоское состояние мира для GameController.snapshot"""
+        platforms = array("d")
+        for platform in self._platform_manager.platforms:
+            platforms.extend((platform.x, platform.y, platform.width))
+        spawn_timer, collected_count, mice = (
+            self._mouse_manager.get_state()
+        )
+        return WorldState(self._world_offset, self._seed,
+                          self._rng.getstate(), platforms,
+                          spawn_timer, collected_count, mice)
+
+    def set_state(self, state: WorldState) -> None:
+        """
+        Восстанавливает состояние get_state. Совпадающие по границам
+        платформы переиспользуются. Если набор платформ изменился,
+        хранилище и широкая фаза собираются заново в порядке генерации
+        """
+        self._world_offset = state.world_offset
+        if state.seed != self._seed:
+            # Снимок другого мира: куски строятся из его зерна
+            self._prefetcher.close()
+            self._prefetcher = ChunkPrefetcher(
+                PlatformGenerator(state.seed), background=self._prefetch)
+        self._seed = state.seed
+        # Генератор мышей: состояние меняется на месте
+        self._rng.setstate(state.rng_state)
+
+        live = self._platform_manager.platforms
+        current = {platform.x: platform for platform in live}
+        platforms = []
+        values = state.platforms
+        for index in range(0, len(values), PLATFORM_FIELDS):
+            x, y, width = values[index:index + PLATFORM_FIELDS]
+            platform = current.get(x)
+            if (platform is None or platform.y != y or
+                    platform.width != width):
+                platform = Platform(x, y, width)
+            platforms.append(platform)
+
+        if (len(platforms) != len(live) or
+                any(a is not b for a, b in zip(platforms, live))):
+            self._platform_manager = PlatformManager(platforms)
+            self._platform_index.clear()
+            for platform in platforms:
+                self._register_platform(platform)
+
+        self._mouse_manager.set_state(state.spawn_timer,
+                                      state.collected_count, state.mice)
+
     def can_move_left(self) -> bool:
         return self._world_offset > 0
@@ -0,0 +1,148 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from constants import PROFILER_HISTORY
+
+
+class FrameProfiler:
+    """
+    Замеряет время стадий кадра.
+    Методы оборачиваются только на время включения профилировщика,
+    поэтому в выключенном состоянии замеры ничего не стоят
+    """
+
+    def __init__(self, history: int = PROFILER_HISTORY):
+        """
+        :param history: Количество хранимых кадров
+        """
+        if history < 1:
+            raise ValueError("History must be positive")
+        self._enabled = False
+        self._history = history
+        self._targets: List[Tuple[Any, str, str]] = []
+        self._stages: Dict[str, Deque[float]] = {}
+        self._frame_times: Deque[float] = deque(maxlen=history)
+        self._frame_start: Optional[float] = None
+
+    # Свойства
+
+    @property
+    def enabled(self) -> bool:
+        """Включен ли профилировщик (только чтение)"""
+        return self._enabled
+
+    @property
+    def frame_times(self) -> List[float]:
+        """Время работы последних кадров в миллисекундах"""
+        return list(self._frame_times)
+
+    @property
+    def stages(self) -> List[str]:
+        """Имена замеряемых стадий в порядке регистрации"""
+        return list(self._stages)
+
+    # Управление
+
+    def instrument(self, target: Any, method_name: str,
+                   stage: Optional[str] = None) -> None:
+        """
+        Регистрирует метод объекта как стадию кадра
+        :param target: Объект, метод которого замеряется
+        :param method_name: Имя метода
+        :param stage: Имя стадии (по умолчанию имя метода)
+        """
+        stage = stage or method_name.lstrip("_")
+        self._targets.append((target, method_name, stage))
+        self._stages.setdefault(stage, deque(maxlen=self._history))
+        if self._enabled:
+            self._patch(target, method_name, stage)
+
+    def toggle(self) -> None:
+        """Переключает профилировщик"""
+        self.set_enabled(not self._enabled)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Включает или выключает замеры"""
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        self._frame_start = None
+
+        for target, method_name, stage in self._targets:
+            if enabled:
+                self._patch(target, method_name, stage)
+            else:
+                # Убираем обертку, возвращая метод класса
+                vars(target).pop(method_name, None)
+
+    def begin_frame(self) -> None:
+        """Отмечает начало работы над кадром"""
+        if self._enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Отмечает конец работы над кадром"""
+        if self._enabled and self._frame_start is not None:
+            self._frame_times.append(
+                (time.perf_counter() - self._frame_start) * 1000.0
+            )
+            self._frame_start = None
+
+    # Статистика
+
+    def percentile(self, percent: float) -> float:
+        """
+        Перцентиль времени кадра
+        :param percent: Перцентиль (0..100)
+        :return: Время в миллисекундах (0 без данных)
+        """
+        return _percentile(sorted(self._frame_times), percent)
+
+    def percentiles(self) -> Dict[str, float]:
+        """Значения p50/p95/p99 времени кадра"""
+        ordered = sorted(self._frame_times)
+        return {
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+            "p99": _percentile(ordered, 99),
+        }
+
+    def stage_average(self, stage: str) -> float:
+        """Среднее время стадии в миллисекундах"""
+        samples = self._stages[stage]
+        return sum(samples) / len(samples) if samples else 0.0
+
+    def stage_averages(self) -> Dict[str, float]:
+        """Средние времена всех стадий"""
+        return {stage: self.stage_average(stage) for stage in self._stages}
+
+    def reset(self) -> None:
+        """Очищает накопленные замеры"""
+        self._frame_times.clear()
+        for samples in self._stages.values():
+            samples.clear()
+
+    # Приватные методы
+
+    def _patch(self, target: Any, method_name: str, stage: str) -> None:
+        """Подменяет метод объекта оберткой с замером времени"""
+        method = getattr(target, method_name)
+        samples = self._stages[stage]
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append((perf_counter() - start) * 1000.0)
+
+        setattr(target, method_name, timed)
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    """Перцентиль отсортированного списка (ближайший ранг)"""
+    if not ordered:
+        return 0.0
+    index = round(percent / 100 * (len(ordered) - 1))
+    return ordered[min(len(ordered) - 1, max(0, index))]
@@ -1,8 +1,61 @@
+import pygame
+from typing import List, Optional
 from src.utils.helpers import load_image
-from constants import ASSETS_DIR
+from src.utils.texture_atlas import TextureAtlas
+from constants import ASSETS_DIR, ATLAS_IMAGES
 
 
 class ResourceLoader:
+    _atlas: Optional[TextureAtlas] = None
+
     @staticmethod
     def load_image(name, scale=None):
         return load_image(name, scale, assets_dir=ASSETS_DIR)
+
+    @staticmethod
+    def load_sprite_sheet(name, columns: int, rows: int,
+                          scale=None) -> List[pygame.Surface]:
+        """
+        Загружает лист спрайтов и нарезает его на кадры
+        :param name: Имя файла листа
+        :param columns: Количество кадров по горизонтали
+        :param rows: Количество кадров по вертикали
+        :param scale: Размер, к которому приводится каждый кадр
+        :return: Кадры построчно, слева направо
+        """
+        sheet = load_image(name, assets_dir=ASSETS_DIR)
+        frame_width = sheet.get_width() // columns
+        frame_height = sheet.get_height() // rows
+
+        frames = []
+        for row in range(rows):
+            for column in range(columns):
+                frame = sheet.subsurface(pygame.Rect(
+                    column * frame_width, row * frame_height,
+                    frame_width, frame_height
+                ))
+                frames.append(
+                    pygame.transform.scale(frame, scale) if scale
+                    else frame.copy()
+                )
+
+        return frames
+
+    @staticmethod
+    def load_atlas(images=ATLAS_IMAGES) -> TextureAtlas:
+        """
+        Собирает атлас из изображений папки ресурсов
+        :param images: Словарь имя -> (файл, размер или None)
+        :return: Новый атлас
+        """
+        return TextureAtlas.build({
+            name: load_image(filename, scale, assets_dir=ASSETS_DIR)
+            for name, (filename, scale) in images.items()
+        })
+
+    @classmethod
+    def get_atlas(cls) -> TextureAtlas:
+        """Общий атлас игры, собирается при первом обращении"""
+        if cls._atlas is None:
+            cls._atlas = cls.load_atlas()
+        return cls._atlas
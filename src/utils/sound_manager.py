@@ -6,17 +6,29 @@ from constants import SOUNDS_DIR, MUSIC_VOLUME, SOUND_VOLUME
 class SoundManager:
     """Менеджер для управления музыкой и звуковыми эффектами"""
 
-    def __init__(self) -> None:
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        :param enabled: False - без микшера, все методы ничего не делают
+        """
         self._sounds: Dict[str, pygame.mixer.Sound] = {}
         self._current_music: Optional[str] = None
         self._music_volume = MUSIC_VOLUME
         self._sound_volume = SOUND_VOLUME
+        self._enabled = enabled
 
         # Инициализация микшера
-        pygame.mixer.init()
+        if self._enabled:
+            pygame.mixer.init()
+
+    @property
+    def enabled(self) -> bool:
+        """Включен ли звук (только чтение)"""
+        return self._enabled
 
     def load_sound(self, name: str, filename: str) -> None:
         """Загружает звуковой эффект"""
+        if not self._enabled:
+            return
         try:
             sound = pygame.mixer.Sound(f"{SOUNDS_DIR}/{filename}")
             sound.set_volume(self._sound_volume)
@@ -26,6 +38,8 @@ class SoundManager:
 
     def load_music(self, filename: str) -> None:
         """Загружает музыкальный файл (для фоновой музыки)"""
+        if not self._enabled:
+            return
         try:
             pygame.mixer.music.load(f"{SOUNDS_DIR}/{filename}")
             pygame.mixer.music.set_volume(self._music_volume)
@@ -34,11 +48,15 @@ class SoundManager:
 
     def play_sound(self, name: str) -> None:
         """Воспроизводит звуковой эффект"""
+        if not self._enabled:
+            return
         if name in self._sounds:
             self._sounds[name].play()
 
     def play_music(self, loop: bool = True) -> None:
         """Воспроизводит фоновую музыку"""
+        if not self._enabled:
+            return
         if loop:
             pygame.mixer.music.play(-1)  # -1 означает бесконечный цикл
         else:
@@ -46,20 +64,27 @@ class SoundManager:
 
     def stop_music(self) -> None:
         """Останавливает фоновую музыку"""
+        if not self._enabled:
+            return
         pygame.mixer.music.stop()
 
     def pause_music(self) -> None:
         """Ставит музыку на паузу"""
+        if not self._enabled:
+            return
         pygame.mixer.music.pause()
 
     def unpause_music(self) -> None:
         """Продолжает воспроизведение музыки"""
+        if not self._enabled:
+            return
         pygame.mixer.music.unpause()
 
     def set_music_volume(self, volume: float) -> None:
         """Устанавливает громкость музыки (0.0 - 1.0)"""
         self._music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self._music_volume)
+        if self._enabled:
+            pygame.mixer.music.set_volume(self._music_volume)
 
     def set_sound_volume(self, volume: float) -> None:
         """Устанавливает громкость звуковых эффектов (0.0 - 1.0)"""
@@ -0,0 +1,77 @@
+import pygame
+from typing import Dict
+from constants import ATLAS_MAX_WIDTH, ATLAS_PADDING
+
+
+class TextureAtlas:
+    """Общая текстура, в которую упакованы несколько изображений"""
+
+    def __init__(self,
+                 surface: pygame.Surface,
+                 regions: Dict[str, pygame.Rect]):
+        """
+        Инициализация атласа
+        :param surface: Поверхность атласа
+        :param regions: Области изображений внутри атласа
+        """
+        self._surface = surface
+        self._regions = regions
+
+    @classmethod
+    def build(cls,
+              images: Dict[str, pygame.Surface],
+              max_width: int = ATLAS_MAX_WIDTH,
+              padding: int = ATLAS_PADDING) -> 'TextureAtlas':
+        """
+        Упаковывает изображения полками (по убыванию высоты)
+        :param images: Изображения по именам
+        :param max_width: Максимальная ширина атласа
+        :param padding: Отступ между изображениями
+        :return: Готовый атлас
+        """
+        order = sorted(images, key=lambda name: -images[name].get_height())
+        regions: Dict[str, pygame.Rect] = {}
+        x = y = shelf_height = width = 0
+
+        for name in order:
+            image_width, image_height = images[name].get_size()
+            if x > 0 and x + image_width > max_width:
+                # Переходим на новую полку
+                y += shelf_height + padding
+                x = shelf_height = 0
+            regions[name] = pygame.Rect(x, y, image_width, image_height)
+            x += image_width + padding
+            width = max(width, x - padding)
+            shelf_height = max(shelf_height, image_height)
+
+        surface = pygame.Surface((max(width, 1), max(y + shelf_height, 1)),
+                                 pygame.SRCALPHA)
+        for name, rect in regions.items():
+            # BLEND_RGBA_MAX копирует пиксели вместе с альфой без смешивания
+            surface.blit(images[name], rect,
+                         special_flags=pygame.BLEND_RGBA_MAX)
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        return cls(surface, regions)
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """Поверхность атласа (только чтение)"""
+        return self._surface
+
+    def region(self, name: str) -> pygame.Rect:
+        """
+        Область изображения внутри атласа
+        :param name: Имя изображения
+        :return: Прямоугольник-источник для blit
+        """
+        return self._regions[name]
+
+    def get_image(self, name: str) -> pygame.Surface:
+        """Изображение как подповерхность атласа (без копирования)"""
+        return self._surface.subsurface(self._regions[name])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._regions
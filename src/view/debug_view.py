@@ -1,11 +1,12 @@
 import pygame
 from src.view.hitbox_renderer import HitboxRenderer
+from src.view.text_cache import TextCache, GlyphAtlas
 from constants import (
     DEBUG_TEXT_COLOR, DEBUG_FONT_NAME,
     DEBUG_FONT_SIZE, DEBUG_LINE_SPACING,
-    DEBUG_MARGIN
+    DEBUG_MARGIN, DEBUG_GLYPH_ATLAS
 )
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.utils.sound_manager import SoundManager
@@ -17,20 +18,33 @@ class DebugView:
         self._hitbox_renderer = HitboxRenderer()
         self._line_spacing = DEBUG_LINE_SPACING
         self._margin = DEBUG_MARGIN
+        self._text_cache = TextCache(self.font)
+        self._glyph_atlas = (
+            GlyphAtlas(self.font, DEBUG_TEXT_COLOR)
+            if DEBUG_GLYPH_ATLAS else None
+        )
+
+    @property
+    def text_cache(self) -> TextCache:
+        """Кэш отрисованных строк (только чтение)"""
+        return self._text_cache
 
     def draw(self,
              screen,
              player,
              world,
              game_state,
-             sound_manager: Optional['SoundManager'] = None):
+             sound_manager: Optional['SoundManager'] = None
+             ) -> List[pygame.Rect]:
         """Отрисовка отладочной информации"""
-        debug_text = [
-            f"Позиция: {player.world_x:.1f}",
-            f"Y: {player.y:.1f}",
-            f"Платформ: {world.platform_count}",
-            f"Хитбоксы: {'ON' if game_state.show_hitboxes else 'OFF'} (H)",
-            f"Активных мышей: {world.active_mice_count}",
+        # Строка: (неизменная подпись, быстро меняющееся число или None)
+        debug_lines: List[Tuple[str, Optional[str]]] = [
+            ("Позиция: ", f"{player.world_x:.1f}"),
+            ("Y: ", f"{player.y:.1f}"),
+            (f"Платформ: {world.platform_count}", None),
+            (f"Хитбоксы: {'ON' if game_state.show_hitboxes else 'OFF'} (H)",
+             None),
+            (f"Активных мышей: {world.active_mice_count}", None),
         ]
 
         # Добавляем информацию о звуке, если передан sound_manager
@@ -38,12 +52,34 @@ class DebugView:
             music_status = "ON" if pygame.mixer.music.get_busy() else "OFF"
             sound_status = "ON" if sound_manager.sound_volume > 0 else "OFF"
 
-            debug_text.extend([
-                f"Музыка: {music_status} (M)",
-                f"Звуки: {sound_status} (N)",
+            debug_lines.extend([
+                (f"Музыка: {music_status} (M)", None),
+                (f"Звуки: {sound_status} (N)", None),
             ])
 
-        for i, text in enumerate(debug_text):
-            text_surface = self.font.render(text, True, DEBUG_TEXT_COLOR)
-            screen.blit(text_surface, (self._margin,
-                                       self._margin + i * self._line_spacing))
+        dirty_rects = []
+        for i, (label, value) in enumerate(debug_lines):
+            position = (self._margin, self._margin + i * self._line_spacing)
+            dirty_rects.append(
+                self._draw_line(screen, label, value, position)
+            )
+        return dirty_rects
+
+    def _draw_line(self,
+                   screen,
+                   label: str,
+                   value: Optional[str],
+                   position: Tuple[int, int]) -> pygame.Rect:
+        """Отрисовка одной строки через кэш строк и атлас глифов"""
+        if value is not None and self._glyph_atlas is None:
+            label, value = label + value, None
+
+        label_surface = self._text_cache.render(label, DEBUG_TEXT_COLOR)
+        rect = screen.blit(label_surface, position)
+
+        if value is not None:
+            value_rect = self._glyph_atlas.draw(screen, value,
+                                                (rect.right, position[1]))
+            rect = rect.union(value_rect)
+
+        return rect
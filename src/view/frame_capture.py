@@ -0,0 +1,67 @@
+import pygame
+from typing import Callable, Optional, Tuple, TYPE_CHECKING
+from constants import CAPTURE_INTERVAL, CAPTURE_RESOLUTION
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class FrameCapture:
+    """
+    Захват отрисованных кадров в массивы NumPy.
+    Массив - это представление pixels3d поверхности без копирования,
+    поэтому он действителен только внутри обратного вызова
+    """
+
+    def __init__(self,
+                 source: pygame.Surface,
+                 on_frame: Callable[[int, 'numpy.ndarray'], None],
+                 interval: int = CAPTURE_INTERVAL,
+                 resolution: Tuple[int, int] = CAPTURE_RESOLUTION):
+        """
+        :param source: Поверхность, в которую отрисовывается кадр
+        :param on_frame: Вызывается как on_frame(номер кадра, массив HxWx3)
+        :param interval: Захватывать каждый N-й кадр
+        :param resolution: Размер захватываемых кадров
+        """
+        if interval < 1:
+            raise ValueError("Capture interval must be positive")
+
+        self._source = source
+        self._on_frame = on_frame
+        self._interval = interval
+        self._frame = 0
+        self._captured = 0
+
+        # При другом разрешении кадр масштабируется в заранее созданную
+        # поверхность, иначе массив смотрит прямо в исходную поверхность
+        self._target: Optional[pygame.Surface] = None
+        if tuple(resolution) != source.get_size():
+            self._target = pygame.Surface(resolution, 0, source)
+
+    @property
+    def frames_captured(self) -> int:
+        """Количество захваченных кадров"""
+        return self._captured
+
+    def capture(self) -> None:
+        """Обрабатывает очередной отрисованный кадр"""
+        frame = self._frame
+        self._frame += 1
+        if frame % self._interval:
+            return
+
+        target = self._source
+        if self._target is not None:
+            pygame.transform.smoothscale(self._source,
+                                         self._target.get_size(),
+                                         self._target)
+            target = self._target
+
+        # pixels3d блокирует поверхность, пока массив жив
+        pixels = pygame.surfarray.pixels3d(target)
+        try:
+            self._on_frame(frame, pixels.transpose(1, 0, 2))
+        finally:
+            del pixels
+        self._captured += 1
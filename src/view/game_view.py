@@ -1,8 +1,14 @@
 import pygame
-from src.utils.resource_loader import ResourceLoader
+from src.view.parallax_background import ParallaxBackground
 from src.view.mouse_view import MouseView
-from constants import BACKGROUND_IMAGE, SCREEN_WIDTH, SCREEN_HEIGHT
-from typing import TYPE_CHECKING
+from src.view.hitbox_renderer import HitboxRenderer
+from src.view.profiler_view import ProfilerView
+from src.utils.frame_profiler import FrameProfiler
+from constants import (
+    BACKGROUND_LAYERS, SCREEN_WIDTH, SCREEN_HEIGHT,
+    DIRTY_RECT_RENDERING, DIRTY_RECT_SCROLL_THRESHOLD
+)
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
     from src.view.player_view import PlayerView
@@ -19,7 +25,11 @@ class GameView:
         screen: pygame.Surface,
         player_view: 'PlayerView',
         world_view: 'WorldView',
-        debug_view: 'DebugView'
+        debug_view: 'DebugView',
+        dirty_rects: bool = DIRTY_RECT_RENDERING,
+        hitbox_renderer: Optional[HitboxRenderer] = None,
+        profiler: Optional[FrameProfiler] = None,
+        present: bool = True
     ):
         """
         Инициализация GameView с внедренными зависимостями
@@ -27,11 +37,15 @@ class GameView:
         :param player_view: Внедренная зависимость отрисовки игрока
         :param world_view: Внедренная зависимость отрисовки мира
         :param debug_view: Внедренная зависимость отрисовки отладки
+        :param dirty_rects: Обновлять только измененные области экрана
+        :param hitbox_renderer: Общий для всех view отрисовщик хитбоксов
+        :param profiler: Профилировщик для замера отрисовки (необязательно)
+        :param present: Выводить кадр на дисплей (False - только в screen)
         """
         super().__init__()
         self.screen = screen
-        self.background = ResourceLoader.load_image(
-            BACKGROUND_IMAGE,
+        self.background = ParallaxBackground(
+            BACKGROUND_LAYERS,
             (SCREEN_WIDTH, SCREEN_HEIGHT)
         )
 
@@ -39,7 +53,21 @@ class GameView:
         self._player_view = player_view
         self._world_view = world_view
         self._debug_view = debug_view
-        self._mouse_view = MouseView()
+        self._hitbox_renderer = hitbox_renderer or HitboxRenderer()
+        self._mouse_view = MouseView(self._hitbox_renderer)
+
+        # Профилировщик замеряет отрисовку каждого view
+        self._profiler_view = None
+        if profiler is not None:
+            self._instrument_views(profiler)
+            self._profiler_view = ProfilerView(profiler)
+
+        self._present = present
+
+        # Состояние режима dirty rects
+        self._dirty_rects_enabled = dirty_rects
+        self._previous_rects: List[pygame.Rect] = []
+        self._previous_offset: Optional[float] = None
 
     def render(
         self,
@@ -53,34 +81,137 @@ class GameView:
         :param player: Игрок
         :param world: Мир
         """
-        # Фон
-        self.screen.blit(self.background, (0, 0))
+        if self._dirty_rects_enabled:
+            self._render_dirty(game_state, player, world)
+        else:
+            self.background.draw(self.screen, world.world_offset)
+            self._draw_layers(game_state, player, world)
+            if self._present:
+                pygame.display.flip()
+
+    def _render_dirty(
+        self,
+        game_state: 'GameState',
+        player: 'Player',
+        world: 'World'
+    ) -> None:
+        """
+        Отрисовка с обновлением только измененных областей
+        :param game_state: Состояние игры
+        :param player: Игрок
+        :param world: Мир
+        """
+        offset = world.world_offset
+        # Прокрутка параллакс-слоев меняет весь фон
+        full_redraw = (
+            self._previous_offset is None or
+            abs(offset - self._previous_offset) >
+            DIRTY_RECT_SCROLL_THRESHOLD or
+            self.background.changed(self._previous_offset, offset)
+        )
+
+        if full_redraw:
+            self.background.draw(self.screen, offset)
+        else:
+            # Восстанавливаем фон под областями прошлого кадра
+            for rect in self._previous_rects:
+                self.background.restore(self.screen, rect, offset)
+
+        dirty_rects = self._draw_layers(game_state, player, world)
+
+        if self._present:
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self._previous_rects + dirty_rects)
+
+        self._previous_rects = dirty_rects
+        self._previous_offset = offset
+
+    def _draw_layers(
+        self,
+        game_state: 'GameState',
+        player: 'Player',
+        world: 'World'
+    ) -> List[pygame.Rect]:
+        """
+        Отрисовка всех слоев поверх фона
+        :return: Список затронутых областей экрана
+        """
+        dirty_rects: List[pygame.Rect] = []
 
         # Мир
-        self._world_view.draw(self.screen, world)
+        dirty_rects.extend(self._world_view.draw(self.screen, world))
 
         # Игрок
-        self._player_view.draw(self.screen, player)
+        dirty_rects.append(self._player_view.draw(self.screen, player))
 
         # Хитбоксы и отладка
         if game_state.show_hitboxes:
-            self._player_view.draw_player_hitbox(self.screen, player)
-            self._world_view.draw_hitboxes(self.screen, world)
+            self._hitbox_renderer.begin_batch(self.screen)
+            dirty_rects.append(
+                self._player_view.draw_player_hitbox(self.screen, player)
+            )
+            dirty_rects.extend(
+                self._world_view.draw_hitboxes(self.screen, world)
+            )
 
         # Мыши
-        self._mouse_view.draw(self.screen,
-                              world.get_visible_mice(),
-                              world.world_offset)
+        dirty_rects.extend(
+            self._mouse_view.draw(self.screen,
+                                  world.get_visible_mice(),
+                                  world.world_offset)
+        )
 
         # Хитбоксы мышей
         if game_state.show_hitboxes:
-            self._mouse_view.draw_hitboxes(self.screen,
-                                           world.get_visible_mice(),
-                                           world.world_offset)
+            dirty_rects.extend(
+                self._mouse_view.draw_hitboxes(self.screen,
+                                               world.get_visible_mice(),
+                                               world.world_offset)
+            )
+
+            # В пакетном режиме все хитбоксы выводятся здесь одним blit
+            overlay_rect = self._hitbox_renderer.flush(self.screen)
+            if overlay_rect is not None:
+                dirty_rects.append(overlay_rect)
+
+        dirty_rects.extend(
+            self._debug_view.draw(self.screen, player, world, game_state)
+        )
 
-        self._debug_view.draw(self.screen, player, world, game_state)
+        if self._profiler_view is not None:
+            dirty_rects.extend(self._profiler_view.draw(self.screen))
+
+        return dirty_rects
+
+    def _instrument_views(self, profiler: FrameProfiler) -> None:
+        """Регистрирует методы отрисовки view как стадии кадра"""
+        stages = (
+            (self._world_view, "draw", "draw_world"),
+            (self._world_view, "draw_hitboxes", "draw_world_hitboxes"),
+            (self._player_view, "draw", "draw_player"),
+            (self._player_view, "draw_player_hitbox", "draw_player_hitbox"),
+            (self._mouse_view, "draw", "draw_mice"),
+            (self._mouse_view, "draw_hitboxes", "draw_mouse_hitboxes"),
+            (self._debug_view, "draw", "draw_debug"),
+        )
+        for view, method_name, stage in stages:
+            profiler.instrument(view, method_name, stage)
 
-        pygame.display.flip()
+    @property
+    def dirty_rects_enabled(self) -> bool:
+        """Включен ли режим dirty rects (чтение и запись)"""
+        return self._dirty_rects_enabled
+
+    @dirty_rects_enabled.setter
+    def dirty_rects_enabled(self, value: bool) -> None:
+        """Переключение режима dirty rects со сбросом истории"""
+        if not isinstance(value, bool):
+            raise ValueError("Dirty rects flag must be a boolean")
+        self._dirty_rects_enabled = value
+        self._previous_rects = []
+        self._previous_offset = None
 
     # === СВОЙСТВА ДЛЯ ДОСТУПА К ЗАВИСИМОСТЯМ ===
 
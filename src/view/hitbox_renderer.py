@@ -1,21 +1,82 @@
 import pygame
+from typing import List, Optional
+from constants import HITBOX_BATCHED
 
 
 class HitboxRenderer:
     """Отвечает за отрисовку хитбоксов (композиция)"""
 
-    @staticmethod
-    def draw_hitbox(screen: pygame.Surface,
-                    rect: pygame.Rect, color: tuple) -> None:
+    def __init__(self, batched: bool = HITBOX_BATCHED):
+        """
+        Инициализация отрисовщика хитбоксов
+        :param batched: Собирать хитбоксы кадра на один общий слой
+        """
+        self._batched = batched
+        self._batching = False
+        self._overlay: Optional[pygame.Surface] = None
+        self._pending: List[pygame.Rect] = []
+
+    @property
+    def batched(self) -> bool:
+        """Включен ли пакетный режим (только чтение)"""
+        return self._batched
+
+    def begin_batch(self, screen: pygame.Surface) -> None:
+        """
+        Начинает сбор хитбоксов кадра на общий слой
+        :param screen: Поверхность, на которую слой будет выведен
+        """
+        if not self._batched:
+            return
+
+        size = screen.get_size()
+        if self._overlay is None or self._overlay.get_size() != size:
+            self._overlay = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            # Очищаем только области прошлого кадра
+            for rect in self._pending:
+                self._overlay.fill((0, 0, 0, 0), rect)
+
+        self._pending = []
+        self._batching = True
+
+    def flush(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        Выводит накопленные хитбоксы одним blit
+        :param screen: Поверхность для отрисовки
+        :return: Затронутая область экрана или None
+        """
+        if not self._batching:
+            return None
+        self._batching = False
+
+        if not self._pending:
+            return None
+
+        area = self._pending[0].unionall(self._pending[1:])
+        return screen.blit(self._overlay, area.topleft, area)
+
+    def draw_hitbox(self, screen: pygame.Surface,
+                    rect: pygame.Rect, color: tuple) -> pygame.Rect:
         """
         Отрисовывает хитбокс на экране
         :param screen: Поверхность для отрисовки
         :param rect: Прямоугольник хитбокса
         :param color: Цвет хитбокса
+        :return: Затронутая область экрана
         """
+        if self._batching:
+            # В пакетном режиме только заливаем область общего слоя
+            # Обрезаем вручную: fill неверно обрезает отрицательные координаты
+            area = rect.clip(self._overlay.get_rect())
+            if area.width and area.height:
+                self._overlay.fill(color, area)
+                self._pending.append(area)
+            return area
+
         hitbox_surface = pygame.Surface(
             (rect.width, rect.height),
             pygame.SRCALPHA
         )
         hitbox_surface.fill(color)
-        screen.blit(hitbox_surface, rect.topleft)
+        return screen.blit(hitbox_surface, rect.topleft)
@@ -1,40 +1,53 @@
 import pygame
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from src.utils.resource_loader import ResourceLoader
 from src.view.hitbox_renderer import HitboxRenderer
-from constants import MOUSE_IMAGE, MOUSE_SCALE, HITBOX_COLOR
+from constants import HITBOX_COLOR
 
 if TYPE_CHECKING:
     from src.model.mouse import Mouse
 
 
 class MouseView:
-    def __init__(self):
-        self.image = ResourceLoader.load_image(MOUSE_IMAGE, scale=MOUSE_SCALE)
-        self._hitbox_renderer = HitboxRenderer()
+    def __init__(self, hitbox_renderer: Optional[HitboxRenderer] = None):
+        """
+        Инициализация отрисовки мышей
+        :param hitbox_renderer: Общий отрисовщик хитбоксов (необязательно)
+        """
+        atlas = ResourceLoader.get_atlas()
+        self._atlas_surface = atlas.surface
+        self._image_area = atlas.region("mouse")
+        self._hitbox_renderer = hitbox_renderer or HitboxRenderer()
 
     def draw(self,
              screen: pygame.Surface, mice: List['Mouse'],
-             world_offset: float) -> None:
-        """Отрисовывает всех видимых мышей"""
-        for mouse in mice:
-            if not mouse.collected:
-                self._draw_mouse(screen, mouse, world_offset)
+             world_offset: float) -> List[pygame.Rect]:
+        """Отрисовывает всех видимых мышей и возвращает их области"""
+        # Все мыши отправляются одним вызовом blits из атласа
+        return screen.blits([
+            (self._atlas_surface,
+             self._mouse_position(mouse, world_offset),
+             self._image_area)
+            for mouse in mice
+            if not mouse.collected
+        ])
 
-    def _draw_mouse(self,
-                    screen: pygame.Surface,
-                    mouse: 'Mouse',
-                    world_offset: float) -> None:
-        """Отрисовка одной мыши"""
-        screen_x = int(mouse.x - world_offset)
-        screen_y = int(mouse.y)
-        screen.blit(self.image, (screen_x, screen_y))
+    @staticmethod
+    def _mouse_position(mouse: 'Mouse',
+                        world_offset: float) -> Tuple[int, int]:
+        """Экранная позиция одной мыши"""
+        return int(mouse.x - world_offset), int(mouse.y)
 
     def draw_hitboxes(self,
                       screen: pygame.Surface, mice: List['Mouse'],
-                      world_offset: float) -> None:
+                      world_offset: float) -> List[pygame.Rect]:
         """Отрисовка хитбоксов мышей"""
+        dirty_rects = []
         for mouse in mice:
             if not mouse.collected:
                 hitbox = mouse.get_hitbox(world_offset)
-                self._hitbox_renderer.draw_hitbox(screen, hitbox, HITBOX_COLOR)
+                dirty_rects.append(
+                    self._hitbox_renderer.draw_hitbox(screen, hitbox,
+                                                      HITBOX_COLOR)
+                )
+        return dirty_rects
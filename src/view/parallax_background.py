@@ -0,0 +1,102 @@
+import pygame
+from typing import List, Sequence, Tuple
+from src.utils.resource_loader import ResourceLoader
+
+
+class ParallaxLayer:
+    """Слой фона, заранее масштабированный в зацикленную полосу"""
+
+    def __init__(self, strip: pygame.Surface, scroll_factor: float):
+        """
+        :param strip: Масштабированное изображение слоя
+        :param scroll_factor: Доля смещения мира, с которой движется слой
+        """
+        self._strip = strip
+        self._scroll_factor = scroll_factor
+        self._width = strip.get_width()
+
+    @property
+    def scroll_factor(self) -> float:
+        return self._scroll_factor
+
+    def shift(self, world_offset: float) -> int:
+        """Сдвиг полосы в пикселях для заданного смещения мира"""
+        return int(world_offset * self._scroll_factor) % self._width
+
+    def draw(self, screen: pygame.Surface, world_offset: float) -> None:
+        """Отрисовывает слой не более чем двумя blit"""
+        shift = self.shift(world_offset)
+        screen.blit(self._strip, (-shift, 0))
+        if shift:
+            screen.blit(self._strip, (self._width - shift, 0))
+
+
+class ParallaxBackground:
+    """Многослойный фон с параллакс-прокруткой"""
+
+    def __init__(self,
+                 layers: Sequence[Tuple[str, float]],
+                 size: Tuple[int, int]):
+        """
+        Загружает и масштабирует все слои один раз
+        :param layers: Пары (файл, коэффициент прокрутки), от дальнего слоя
+        :param size: Размер экрана
+        """
+        if not layers:
+            raise ValueError("At least one background layer is required")
+
+        self._layers: List[ParallaxLayer] = [
+            ParallaxLayer(ResourceLoader.load_image(filename, size), factor)
+            for filename, factor in layers
+        ]
+        self._is_static = all(
+            layer.scroll_factor == 0 for layer in self._layers
+        )
+
+        # Неподвижный фон сводится в одну поверхность
+        self._composite = None
+        if self._is_static:
+            self._composite = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                self._composite = self._composite.convert()
+            self._draw_layers(self._composite, 0.0)
+
+    @property
+    def is_static(self) -> bool:
+        """Фон не зависит от смещения мира"""
+        return self._is_static
+
+    def changed(self, old_offset: float, new_offset: float) -> bool:
+        """Изменилось ли изображение фона при смене смещения"""
+        return any(
+            layer.shift(old_offset) != layer.shift(new_offset)
+            for layer in self._layers
+        )
+
+    def draw(self, screen: pygame.Surface, world_offset: float) -> None:
+        """Отрисовывает весь фон"""
+        if self._composite is not None:
+            screen.blit(self._composite, (0, 0))
+        else:
+            self._draw_layers(screen, world_offset)
+
+    def restore(self,
+                screen: pygame.Surface,
+                rect: pygame.Rect,
+                world_offset: float) -> None:
+        """Восстанавливает фон только под заданной областью"""
+        if self._composite is not None:
+            screen.blit(self._composite, rect, rect)
+            return
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(rect)
+        self._draw_layers(screen, world_offset)
+        screen.set_clip(previous_clip)
+
+    def _draw_layers(self,
+                     screen: pygame.Surface,
+                     world_offset: float) -> None:
+        """Отрисовка слоев от дальнего к ближнему"""
+        for layer in self._layers:
+            layer.draw(screen, world_offset)
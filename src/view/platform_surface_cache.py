@@ -0,0 +1,89 @@
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+from constants import PLATFORM_SURFACE_CACHE_SIZE
+
+
+class PlatformSurfaceCache:
+    """LRU-кэш заранее замощенных тайлами поверхностей платформ"""
+
+    def __init__(self,
+                 tile: pygame.Surface,
+                 max_size: int = PLATFORM_SURFACE_CACHE_SIZE):
+        """
+        Инициализация кэша
+        :param tile: Тайл, которым замощается платформа
+        :param max_size: Максимальное число хранимых поверхностей
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be positive")
+        self._tile = tile
+        self._max_size = max_size
+        self._surfaces: 'OrderedDict[Tuple[int, int], pygame.Surface]' = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, width: int, height: int) -> pygame.Surface:
+        """
+        Возвращает поверхность платформы заданного размера
+        :param width: Ширина платформы в пикселях
+        :param height: Высота платформы в пикселях
+        :return: Замощенная поверхность (общая, не изменять)
+        """
+        key = (width, height)
+        surface = self._surfaces.get(key)
+
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self._hits += 1
+            return surface
+
+        self._misses += 1
+        surface = self._build_surface(width, height)
+        self._surfaces[key] = surface
+
+        # Вытесняем давно не использованные поверхности
+        if len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self) -> None:
+        """Очищает кэш и сбрасывает счетчики"""
+        self._surfaces.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _build_surface(self, width: int, height: int) -> pygame.Surface:
+        """Создает новую поверхность и замощает ее тайлом"""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        tile_width = self._tile.get_width()
+
+        for i in range(0, width, tile_width):
+            surface.blit(self._tile, (i, 0))
+
+        return surface
+
+    # Свойства
+
+    @property
+    def hits(self) -> int:
+        """Количество попаданий в кэш"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Количество промахов кэша"""
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        """Текущее количество поверхностей в кэше"""
+        return len(self._surfaces)
+
+    @property
+    def max_size(self) -> int:
+        """Максимальное количество поверхностей в кэше"""
+        return self._max_size
@@ -1,8 +1,14 @@
 import pygame
+from typing import Optional
 from src.view.hitbox_renderer import HitboxRenderer
+from src.view.sprite_animation import SpriteAnimation
 from src.utils.resource_loader import ResourceLoader
 from constants import (
-    PLAYER_IMAGE,
+    PLAYER_SPRITE_SHEET,
+    PLAYER_SHEET_COLUMNS,
+    PLAYER_SHEET_ROWS,
+    PLAYER_ANIMATIONS,
+    PLAYER_ANIMATION_FRAME_TIME,
     PLAYER_WIDTH,
     PLAYER_HEIGHT,
     HITBOX_COLOR,
@@ -10,22 +16,59 @@ from constants import (
 
 
 class PlayerView:
-    def __init__(self):
+    def __init__(self, hitbox_renderer: Optional[HitboxRenderer] = None):
+        """
+        Инициализация отрисовки игрока
+        :param hitbox_renderer: Общий отрисовщик хитбоксов (необязательно)
+        """
         super().__init__()
-        self.image = ResourceLoader.load_image(
-            PLAYER_IMAGE,
+        frames = ResourceLoader.load_sprite_sheet(
+            PLAYER_SPRITE_SHEET,
+            PLAYER_SHEET_COLUMNS,
+            PLAYER_SHEET_ROWS,
             scale=(PLAYER_WIDTH, PLAYER_HEIGHT)
         )
-        self._hitbox_renderer = HitboxRenderer()
+        self._animation = SpriteAnimation(
+            frames, PLAYER_ANIMATIONS, PLAYER_ANIMATION_FRAME_TIME
+        )
+        self._hitbox_renderer = hitbox_renderer or HitboxRenderer()
+
+        # Состояние анимации
+        self._state = "idle"
+        self._tick = 0
+        self._last_world_x: Optional[float] = None
+
+    @property
+    def animation_state(self) -> str:
+        """Текущее состояние анимации (только чтение)"""
+        return self._state
 
-    def draw(self, screen, player) -> None:
-        """Отрисовывает игрока на экране"""
-        # Отрисовка спрайта с учетом направления
-        flipped_image = pygame.transform.flip(
-            self.image, not player.facing_right, False
+    def draw(self, screen, player) -> pygame.Rect:
+        """Отрисовывает игрока на экране и возвращает затронутую область"""
+        state = self._select_state(player)
+        if state != self._state:
+            self._state = state
+            self._tick = 0
+        else:
+            self._tick += 1
+
+        # Кадр уже запечен с нужным направлением
+        image = self._animation.get_frame(
+            self._state, self._tick, player.facing_right
         )
-        screen.blit(flipped_image, (player.x, player.y))
+        return screen.blit(image, (player.x, player.y))
+
+    def _select_state(self, player) -> str:
+        """Определяет состояние анимации по состоянию игрока"""
+        moved = (self._last_world_x is not None and
+                 player.world_x != self._last_world_x)
+        self._last_world_x = player.world_x
+
+        if player.is_jumping or player.vel_y > 0:
+            return "jump" if player.vel_y < 0 else "fall"
+        return "run" if moved else "idle"
 
-    def draw_player_hitbox(self, screen, player) -> None:
+    def draw_player_hitbox(self, screen, player) -> pygame.Rect:
         """Отрисовка хитбокса игрока"""
-        self._hitbox_renderer.draw_hitbox(screen, player.hitbox, HITBOX_COLOR)
+        return self._hitbox_renderer.draw_hitbox(screen, player.hitbox,
+                                                 HITBOX_COLOR)
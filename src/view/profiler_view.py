@@ -0,0 +1,90 @@
+import pygame
+from typing import List
+from src.utils.frame_profiler import FrameProfiler
+from src.view.text_cache import TextCache
+from constants import (
+    SCREEN_WIDTH, DEBUG_FONT_NAME, DEBUG_FONT_SIZE, DEBUG_TEXT_COLOR,
+    DEBUG_LINE_SPACING, DEBUG_MARGIN,
+    PROFILER_GRAPH_WIDTH, PROFILER_GRAPH_HEIGHT, PROFILER_GRAPH_MAX_MS,
+    PROFILER_BUDGETS_MS, PROFILER_BACKGROUND_COLOR, PROFILER_GRAPH_COLOR,
+    PROFILER_BUDGET_COLOR, PROFILER_MAX_STAGES_SHOWN
+)
+
+
+class ProfilerView:
+    """Оверлей с графиком времени кадра и временем стадий"""
+
+    def __init__(self, profiler: FrameProfiler):
+        """
+        :param profiler: Профилировщик, данные которого отображаются
+        """
+        self._profiler = profiler
+        self.font = pygame.font.SysFont(DEBUG_FONT_NAME, DEBUG_FONT_SIZE)
+        self._text_cache = TextCache(self.font)
+
+        text_lines = 1 + PROFILER_MAX_STAGES_SHOWN
+        self._panel = pygame.Surface(
+            (PROFILER_GRAPH_WIDTH,
+             PROFILER_GRAPH_HEIGHT + text_lines * DEBUG_LINE_SPACING),
+            pygame.SRCALPHA
+        )
+        self._position = (
+            SCREEN_WIDTH - PROFILER_GRAPH_WIDTH - DEBUG_MARGIN,
+            DEBUG_MARGIN
+        )
+
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Отрисовывает оверлей, если профилировщик включен"""
+        if not self._profiler.enabled:
+            return []
+
+        self._panel.fill(PROFILER_BACKGROUND_COLOR)
+        self._draw_graph()
+        self._draw_text()
+        return [screen.blit(self._panel, self._position)]
+
+    def _to_graph_y(self, milliseconds: float) -> int:
+        """Перевод времени в координату Y графика"""
+        ratio = min(1.0, milliseconds / PROFILER_GRAPH_MAX_MS)
+        return PROFILER_GRAPH_HEIGHT - 1 - int(
+            ratio * (PROFILER_GRAPH_HEIGHT - 1)
+        )
+
+    def _draw_graph(self) -> None:
+        """График времени кадра: один столбец на кадр, новые справа"""
+        frame_times = self._profiler.frame_times[-PROFILER_GRAPH_WIDTH:]
+        start_x = PROFILER_GRAPH_WIDTH - len(frame_times)
+        bottom = PROFILER_GRAPH_HEIGHT - 1
+
+        for i, milliseconds in enumerate(frame_times):
+            x = start_x + i
+            pygame.draw.line(self._panel, PROFILER_GRAPH_COLOR,
+                             (x, bottom), (x, self._to_graph_y(milliseconds)))
+
+        for budget in PROFILER_BUDGETS_MS:
+            y = self._to_graph_y(budget)
+            pygame.draw.line(self._panel, PROFILER_BUDGET_COLOR,
+                             (0, y), (PROFILER_GRAPH_WIDTH - 1, y))
+
+    def _draw_text(self) -> None:
+        """Перцентили кадра и самые дорогие стадии"""
+        percentiles = self._profiler.percentiles()
+        lines = [
+            "p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f} мс".format(
+                **percentiles
+            )
+        ]
+
+        averages = sorted(self._profiler.stage_averages().items(),
+                          key=lambda item: -item[1])
+        lines.extend(
+            f"{stage}: {average:.2f}"
+            for stage, average in averages[:PROFILER_MAX_STAGES_SHOWN]
+        )
+
+        for i, line in enumerate(lines):
+            surface = self._text_cache.render(line, DEBUG_TEXT_COLOR)
+            self._panel.blit(
+                surface,
+                (0, PROFILER_GRAPH_HEIGHT + i * DEBUG_LINE_SPACING)
+            )
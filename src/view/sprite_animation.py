@@ -0,0 +1,53 @@
+import pygame
+from typing import Dict, List, Sequence, Tuple
+
+
+class SpriteAnimation:
+    """Набор анимаций, все кадры которых заранее запечены в обе стороны"""
+
+    def __init__(self,
+                 frames: Sequence[pygame.Surface],
+                 animations: Dict[str, List[int]],
+                 frame_time: int):
+        """
+        Запекает кадры и их зеркальные копии один раз при загрузке
+        :param frames: Кадры листа спрайтов
+        :param animations: Номера кадров для каждого состояния
+        :param frame_time: Игровых кадров на один кадр анимации
+        """
+        if frame_time < 1:
+            raise ValueError("Frame time must be positive")
+        if not animations:
+            raise ValueError("At least one animation is required")
+
+        self._frame_time = frame_time
+        self._frames: Dict[str, Tuple[List[pygame.Surface],
+                                      List[pygame.Surface]]] = {}
+
+        for state, indices in animations.items():
+            if not indices:
+                raise ValueError(f"Animation '{state}' has no frames")
+            right = [frames[index] for index in indices]
+            left = [pygame.transform.flip(frame, True, False)
+                    for frame in right]
+            self._frames[state] = (right, left)
+
+    @property
+    def states(self) -> List[str]:
+        """Список доступных состояний"""
+        return list(self._frames)
+
+    def get_frame(self,
+                  state: str,
+                  tick: int,
+                  facing_right: bool) -> pygame.Surface:
+        """
+        Возвращает готовый кадр без трансформаций
+        :param state: Состояние анимации
+        :param tick: Игровых кадров с начала состояния
+        :param facing_right: Направление взгляда
+        :return: Запеченный кадр
+        """
+        right, left = self._frames[state]
+        frames = right if facing_right else left
+        return frames[(tick // self._frame_time) % len(frames)]
@@ -0,0 +1,133 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Tuple
+from constants import DEBUG_TEXT_CACHE_SIZE, DEBUG_GLYPH_CHARS
+
+
+class TextCache:
+    """Ограниченный LRU-кэш отрисованных строк"""
+
+    def __init__(self,
+                 font: pygame.font.Font,
+                 max_size: int = DEBUG_TEXT_CACHE_SIZE):
+        """
+        Инициализация кэша
+        :param font: Шрифт для отрисовки
+        :param max_size: Максимальное число хранимых поверхностей
+        """
+        if max_size < 1:
+            raise ValueError("Cache size must be positive")
+        self._font = font
+        self._max_size = max_size
+        self._surfaces: 'OrderedDict[Tuple[str, tuple], pygame.Surface]' = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, text: str, color: tuple) -> pygame.Surface:
+        """
+        Возвращает поверхность с текстом, отрисовывая ее только при промахе
+        :param text: Строка
+        :param color: Цвет текста
+        :return: Поверхность с текстом (общая, не изменять)
+        """
+        key = (text, color)
+        surface = self._surfaces.get(key)
+
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self._hits += 1
+            return surface
+
+        self._misses += 1
+        surface = self._font.render(text, True, color)
+        self._surfaces[key] = surface
+
+        if len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
+
+        return surface
+
+    def clear(self) -> None:
+        """Очищает кэш и сбрасывает счетчики"""
+        self._surfaces.clear()
+        self._hits = 0
+        self._misses = 0
+
+    # Свойства
+
+    @property
+    def hits(self) -> int:
+        """Количество попаданий в кэш"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Количество промахов кэша"""
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        """Текущее количество строк в кэше"""
+        return len(self._surfaces)
+
+
+class GlyphAtlas:
+    """Атлас глифов для сборки часто меняющихся чисел без растеризации"""
+
+    def __init__(self,
+                 font: pygame.font.Font,
+                 color: tuple,
+                 chars: str = DEBUG_GLYPH_CHARS):
+        """
+        Отрисовывает набор символов один раз в общую поверхность
+        :param font: Шрифт для отрисовки
+        :param color: Цвет глифов
+        :param chars: Символы, входящие в атлас
+        """
+        self._font = font
+        self._color = color
+        self._atlas = font.render(chars, True, color)
+        self._glyphs: Dict[str, pygame.Rect] = {}
+        self._fallback: Dict[str, pygame.Surface] = {}
+
+        # Границы каждого символа внутри атласа
+        height = self._atlas.get_height()
+        for i, char in enumerate(chars):
+            left = font.size(chars[:i])[0]
+            right = font.size(chars[:i + 1])[0]
+            self._glyphs[char] = pygame.Rect(left, 0, right - left, height)
+
+    def draw(self,
+             screen: pygame.Surface,
+             text: str,
+             position: Tuple[int, int]) -> pygame.Rect:
+        """
+        Собирает строку из глифов атласа
+        :param screen: Поверхность для отрисовки
+        :param text: Строка
+        :param position: Левый верхний угол
+        :return: Затронутая область экрана
+        """
+        x, y = position
+        for char in text:
+            area = self._glyphs.get(char)
+            if area is not None:
+                screen.blit(self._atlas, (x, y), area)
+                x += area.width
+            else:
+                glyph = self._get_fallback_glyph(char)
+                screen.blit(glyph, (x, y))
+                x += glyph.get_width()
+
+        return pygame.Rect(position[0], y,
+                           x - position[0], self._atlas.get_height())
+
+    def _get_fallback_glyph(self, char: str) -> pygame.Surface:
+        """Отрисовывает и запоминает символ, отсутствующий в атласе"""
+        glyph = self._fallback.get(char)
+        if glyph is None:
+            glyph = self._font.render(char, True, self._color)
+            self._fallback[char] = glyph
+        return glyph
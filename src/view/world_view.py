@@ -1,48 +1,52 @@
 import pygame
+from typing import List, Optional, Tuple
 from src.utils.resource_loader import ResourceLoader
 from src.view.hitbox_renderer import HitboxRenderer
-from constants import (
-    PLATFORM_IMAGE, PLATFORM_WIDTH, PLATFORM_HEIGHT, HITBOX_COLOR
-)
+from src.view.platform_surface_cache import PlatformSurfaceCache
+from constants import HITBOX_COLOR
 
 
 class WorldView:
-    def __init__(self):
+    def __init__(self, hitbox_renderer: Optional[HitboxRenderer] = None):
+        """
+        Инициализация отрисовки мира
+        :param hitbox_renderer: Общий отрисовщик хитбоксов (необязательно)
+        """
         super().__init__()
-        self.platform_img = ResourceLoader.load_image(
-            PLATFORM_IMAGE,
-            (PLATFORM_WIDTH, PLATFORM_HEIGHT)
-        )
-        self._hitbox_renderer = HitboxRenderer()
-
-    def draw(self, screen, world) -> None:
-        """Отрисовывает все видимые платформы"""
-        for platform in world.get_visible_platforms():
-            self._draw_platform(screen, platform, world.world_offset)
-
-    def _draw_platform(self, screen, platform, world_offset):
-        """Отрисовка одной платформы"""
-        # Создаем поверхность платформы с тайлами
-        tile_width = self.platform_img.get_width()
-
-        # Приводим ширину платформы к int для range()
-        platform_width_int = int(platform.width)
-        platform_height_int = int(platform.height)
-
-        surface = pygame.Surface(
-            (platform_width_int, platform_height_int),
-            pygame.SRCALPHA
-        )
-
-        for i in range(0, platform_width_int, tile_width):
-            surface.blit(self.platform_img, (i, 0))
+        self.platform_img = ResourceLoader.get_atlas().get_image("platform")
+        self._hitbox_renderer = hitbox_renderer or HitboxRenderer()
+        self._surface_cache = PlatformSurfaceCache(self.platform_img)
+
+    @property
+    def surface_cache(self) -> PlatformSurfaceCache:
+        """Кэш поверхностей платформ (только чтение)"""
+        return self._surface_cache
+
+    def draw(self, screen, world) -> List[pygame.Rect]:
+        """Отрисовывает все видимые платформы и возвращает их области"""
+        # Все платформы отправляются одним вызовом blits
+        return screen.blits([
+            self._platform_blit(platform, world.world_offset)
+            for platform in world.get_visible_platforms()
+        ])
+
+    def _platform_blit(self, platform,
+                       world_offset) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Пара (поверхность, позиция) для отрисовки одной платформы"""
+        # Берем готовую поверхность с тайлами из кэша
+        surface = self._surface_cache.get(int(platform.width),
+                                          int(platform.height))
 
         screen_x = int(platform.x - world_offset)
         screen_y = int(platform.y)
-        screen.blit(surface, (screen_x, screen_y))
+        return surface, (screen_x, screen_y)
 
-    def draw_hitboxes(self, screen, world) -> None:
+    def draw_hitboxes(self, screen, world) -> List[pygame.Rect]:
         """Отрисовка хитбоксов платформ"""
+        dirty_rects = []
         for platform in world.get_visible_platforms():
             hitbox = platform.get_hitbox(world.world_offset)
-            self._hitbox_renderer.draw_hitbox(screen, hitbox, HITBOX_COLOR)
+            dirty_rects.append(
+                self._hitbox_renderer.draw_hitbox(screen, hitbox, HITBOX_COLOR)
+            )
+        return dirty_rects
@@ -0,0 +1,58 @@
+import os
+import random
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from src.controller.action import Action  # noqa: E402
+from src.controller.game_controller import GameController  # noqa: E402
+from src.model.batch_simulator import BatchSimulator  # noqa: E402
+
+SEEDS = list(range(8))
+FRAMES = 3000
+
+
+def _policy(seed: int, frame: int) -> int:
+    """
+    Действие игры seed на кадре frame. Четные зерна бегут вправо,
+    нечетные первые 2500 кадров топчутся у старта и собирают мышей
+    """
+    rng = random.Random(seed * 100003 + frame)
+    if rng.random() < 0.8 and (seed % 2 == 0 or frame > 2500):
+        action = Action.RIGHT
+    elif rng.random() < 0.5:
+        action = Action.LEFT
+    else:
+        action = Action.NONE
+    if rng.random() < 0.08:
+        action |= Action.JUMP
+    return int(action)
+
+
+@pytest.fixture(scope="module")
+def actions() -> np.ndarray:
+    """Действия (кадр, игра) для всех зерен"""
+    return np.array([[_policy(seed, frame) for seed in SEEDS]
+                     for frame in range(FRAMES)])
+
+
+def test_batch_matches_game_controller(actions):
+    batch = BatchSimulator(SEEDS)
+    games = [GameController(headless=True, seed=seed) for seed in SEEDS]
+
+    for frame in range(FRAMES):
+        batch.step(actions[frame])
+        for index, game in enumerate(games):
+            game.advance(Action(actions[frame, index]))
+            player = game.player
+            state = (player.y, player.vel_y, player.world_x,
+                     game.game_state.score, game.world.collected_mice_count)
+            expected = (batch.player_y[index], batch.vel_y[index],
+                        batch.world_x[index], batch.score[index],
+                        batch.collected_mice[index])
+            assert state == expected, (SEEDS[index], frame)
+
+    # Политика у старта должна действительно собирать мышей
+    assert batch.score.sum() > 0
@@ -0,0 +1,75 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from src.controller.action import Action  # noqa: E402
+from src.controller.game_controller import GameController  # noqa: E402
+from src.model.platform import Platform  # noqa: E402
+
+WARMUP_FRAMES = 1200
+FRAMES = 600
+
+
+class _RectCounter:
+    """Счетчик построенных Rect вне Platform.__init__"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.platform_depth = 0
+
+
+def _counting_rect(counter: _RectCounter) -> type:
+    """
+    Подкласс pygame.Rect, считающий конструкции. Модель обращается к
+    pygame.Rect при каждом вызове, поэтому подмены атрибута модуля
+    достаточно. Хитбокс новой платформы куска не считается
+    """
+    class CountingRect(pygame.Rect):
+        # __new__ у подкласса Rect роняет pygame 2.6, поэтому __init__
+        def __init__(self, *args) -> None:
+            if not counter.platform_depth:
+                counter.count += 1
+            super().__init__(*args)
+
+    return CountingRect
+
+
+def _counting_platform_init(counter: _RectCounter):
+    """Platform.__init__, в котором конструкции Rect не считаются"""
+    platform_init = Platform.__init__
+
+    def init(self, *args, **kwargs) -> None:
+        counter.platform_depth += 1
+        try:
+            platform_init(self, *args, **kwargs)
+        finally:
+            counter.platform_depth -= 1
+
+    return init
+
+
+def _action(frame: int) -> Action:
+    """Бег вправо с прыжками: новые куски мира, появление мышей"""
+    if frame % 40 == 0:
+        return Action.RIGHT | Action.JUMP
+    return Action.RIGHT
+
+
+def test_steady_frame_builds_no_rects(monkeypatch):
+    game = GameController(headless=True, seed=3)
+    for frame in range(WARMUP_FRAMES):
+        game.advance(_action(frame))
+    chunks = game.world.chunk_prefetcher.get_stats()['misses']
+
+    counter = _RectCounter()
+    monkeypatch.setattr(pygame, "Rect", _counting_rect(counter))
+    monkeypatch.setattr(Platform, "__init__",
+                        _counting_platform_init(counter))
+    for frame in range(WARMUP_FRAMES, WARMUP_FRAMES + FRAMES):
+        game.advance(_action(frame))
+
+    # В измеряемых кадрах строились новые куски мира
+    assert game.world.chunk_prefetcher.get_stats()['misses'] > chunks
+    assert counter.count == 0
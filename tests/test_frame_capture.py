@@ -0,0 +1,38 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from src.controller.game_controller import GameController  # noqa: E402
+from src.controller.game_loop import GameLoop  # noqa: E402
+
+FRAMES = 30
+INTERVAL = 5
+RESOLUTION = (84, 84)
+
+
+def test_run_frames_captures_every_nth_frame():
+    captured = []
+
+    def on_frame(index, pixels):
+        # Массив действителен только внутри вызова
+        captured.append((index, pixels.shape, int(pixels.sum())))
+
+    loop = GameLoop(GameController(headless=True, seed=0), headless=True,
+                    on_frame=on_frame, capture_interval=INTERVAL,
+                    capture_resolution=RESOLUTION)
+    try:
+        count = loop.run_frames(FRAMES)
+    finally:
+        pygame.quit()
+
+    assert count == FRAMES // INTERVAL
+    assert [index for index, _, _ in captured] == list(
+        range(0, FRAMES, INTERVAL))
+    assert all(shape == (RESOLUTION[1], RESOLUTION[0], 3)
+               for _, shape, _ in captured)
+    # Кадр действительно отрисован, а не пуст
+    assert all(total > 0 for _, _, total in captured)
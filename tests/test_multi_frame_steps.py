@@ -0,0 +1,43 @@
+import os
+import random
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pytest  # noqa: E402
+
+from src.controller.action import Action  # noqa: E402
+from src.controller.game_controller import GameController  # noqa: E402
+
+SEEDS = list(range(6))
+FRAMES = 2400
+
+
+def _policy(seed: int, step: int) -> Action:
+    """Действие шага step: в основном вправо, иногда прыжок"""
+    rng = random.Random(seed * 100003 + step)
+    action = Action.RIGHT if rng.random() < 0.85 else Action.LEFT
+    if rng.random() < 0.15:
+        action |= Action.JUMP
+    return action
+
+
+def _state(game: GameController) -> tuple:
+    player = game.player
+    return (player.y, player.vel_y, player.world_x, player.is_jumping,
+            game.world.world_offset)
+
+
+@pytest.mark.parametrize("dt", [2, 3, 4])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_multi_frame_step_matches_single_frames(seed, dt):
+    coarse = GameController(headless=True, seed=seed)
+    fine = GameController(headless=True, seed=seed)
+
+    for step in range(FRAMES // dt):
+        action = _policy(seed, step)
+        coarse.advance(action, dt)
+        # Прыжок нажимается один раз в начале шага
+        fine.advance(action)
+        for _ in range(dt - 1):
+            fine.advance(action & ~Action.JUMP)
+        assert _state(coarse) == _state(fine), (seed, dt, step)